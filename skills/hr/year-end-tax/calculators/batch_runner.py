@@ -0,0 +1,134 @@
+"""
+전사 연말정산 일괄 실행기 (멀티 프로세스)
+
+직원별 입력 파일(CSV 또는 JSON Lines)을 읽어 청크로 나누고,
+CPU 코어 수만큼의 워커 프로세스에서 calc_year_end_tax()를 실행합니다.
+출력 순서는 입력 순서와 같으며, 처리량(명/초)을 stderr로 보고합니다.
+
+입력 형식과 열 이름 규칙은 settlement_stream.py와 같습니다.
+
+Usage:
+    python batch_runner.py employees.csv -o results.csv --workers 8 --chunk-size 2000
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from pathlib import Path
+
+from settlement_stream import (
+    detect_format,
+    iter_rows,
+    parse_employee,
+    result_fieldnames,
+    write_rows,
+)
+from tax_rules import DEFAULT_TAX_YEAR, available_years
+
+DEFAULT_CHUNK_SIZE = 1_000
+
+# 워커 프로세스별 계산 함수/규칙 로더 (initializer에서 1회 import 후 모든 청크에 재사용)
+_worker_calc = None
+_worker_rules = None
+
+
+def _init_worker() -> None:
+    """워커 프로세스 초기화: 계산기를 1회 import 하여 전역에 보관."""
+    global _worker_calc, _worker_rules
+    from tax_rules import load_rules
+    from total_calculator import calc_year_end_tax as calc
+    _worker_calc = calc
+    _worker_rules = load_rules
+
+
+def _settle_chunk(chunk: list[dict], tax_year: int | None = None) -> list[dict]:
+    """워커에서 청크 단위로 정산한다 (과세연도 규칙은 워커별 최초 1회 로드)."""
+    rules = _worker_rules(tax_year)
+    return [_worker_calc(**kwargs, rules=rules) for kwargs in chunk]
+
+
+def _chunks(items: list, size: int):
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def settle_employees(
+    employees: list[dict],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    tax_year: int | None = None,
+) -> list[dict]:
+    """calc_year_end_tax() 인자 dict 목록을 병렬 정산한다.
+
+    Args:
+        employees: 직원별 calc_year_end_tax() 인자 dict
+        workers: 워커 프로세스 수 (기본: CPU 코어 수)
+        chunk_size: 워커에 한 번에 넘기는 직원 수
+        tax_year: 귀속 과세연도 (기본: tax_rules.DEFAULT_TAX_YEAR)
+
+    Returns:
+        입력 순서와 같은 순서의 calc_year_end_tax() 결과 dict 목록
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size는 1 이상이어야 합니다")
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        results = []
+        chunks = _chunks(employees, chunk_size)
+        for chunk_result in executor.map(_settle_chunk, chunks, repeat(tax_year)):
+            results.extend(chunk_result)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="전사 연말정산 일괄 실행기")
+    parser.add_argument("input", type=Path, help="직원 입력 파일 (.csv 또는 .jsonl)")
+    parser.add_argument("-o", "--output", type=Path, required=True,
+                        help="결과 파일 (.csv 또는 .jsonl)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="워커 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"청크당 직원 수 (기본: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--id-column", default=None,
+                        help="결과에 그대로 옮겨 쓸 직원 식별 열 (e.g., employee_id)")
+    parser.add_argument("--tax-year", type=int, choices=available_years(), default=None,
+                        help=f"귀속 과세연도 (기본: {DEFAULT_TAX_YEAR})")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    with open(args.input, encoding="utf-8", newline="") as handle:
+        rows = list(iter_rows(handle, detect_format(args.input)))
+    employees = []
+    for line_number, row in enumerate(rows, start=1):
+        try:
+            employees.append(parse_employee(row))
+        except ValueError as error:
+            raise ValueError(f"{line_number}번째 행: {error}") from error
+    results = settle_employees(employees, args.workers, args.chunk_size, args.tax_year)
+
+    if args.id_column:
+        results = [
+            {args.id_column: row.get(args.id_column), **result}
+            for row, result in zip(rows, results)
+        ]
+    with open(args.output, "w", encoding="utf-8", newline="") as handle:
+        write_rows(
+            handle, results, detect_format(args.output), result_fieldnames(args.id_column),
+        )
+
+    elapsed = time.perf_counter() - started
+    throughput = len(results) / elapsed if elapsed > 0 else float("inf")
+    print(
+        f"{len(results):,}명 정산 완료: {elapsed:.2f}초, {throughput:,.0f}명/초 "
+        f"(workers={args.workers or os.cpu_count()}, chunk_size={args.chunk_size})",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+구간표(Bracket Table) 컴파일 및 구간 조회
+
+constants.py의 구간표는 (상한, 값1, 값2, ...) 튜플 리스트입니다.
+BracketTable은 이를 한 번만 상한/하한/열 배열로 변환해 두고,
+스칼라는 bisect, 배열은 np.searchsorted로 한 번의 이진 탐색만으로
+해당 구간을 찾습니다.
+
+구간 판정 규칙은 기존 계산기와 동일합니다: value <= 상한 인 첫 구간.
+
+정확(exact) 모드의 구간표는 공제율 열이 Fraction이며, 배열 버전에서는
+rate_scale을 곱한 int64 계수 열로 컴파일합니다 (fixed_point 참고).
+"""
+from bisect import bisect_left
+from fractions import Fraction
+
+try:
+    import numpy as np
+except ImportError:  # numpy는 *_batch 메서드에서만 필요
+    np = None
+
+
+class BracketTable:
+    """오름차순 상한을 가진 구간표.
+
+    Attributes:
+        uppers: 구간별 상한 (마지막은 float('inf'))
+        lowers: 구간별 하한 (= 직전 구간 상한, 첫 구간은 0)
+        columns: 상한 이외의 열 (열 단위 튜플)
+        rate_scale: Fraction 열을 배열로 컴파일할 때 곱하는 공통 분모 (기본 1)
+    """
+
+    __slots__ = ("uppers", "lowers", "columns", "rate_scale", "_rows", "_arrays")
+
+    def __init__(self, brackets, rate_scale: int = 1):
+        """구간표를 컴파일한다.
+
+        Args:
+            brackets: (상한, 값...) 튜플 리스트. 상한 오름차순이며
+                      마지막 구간의 상한은 float('inf')여야 한다.
+            rate_scale: Fraction 공제율 열의 공통 분모 (정확 모드)
+
+        Raises:
+            ValueError: 빈 구간표, 상한이 오름차순이 아니거나 마지막 상한이 무한대가 아닌 경우
+        """
+        if not brackets:
+            raise ValueError("구간표가 비어 있습니다")
+
+        uppers = tuple(row[0] for row in brackets)
+        if any(lower >= upper for lower, upper in zip(uppers, uppers[1:])):
+            raise ValueError("구간 상한은 오름차순이어야 합니다")
+        if uppers[-1] != float('inf'):
+            raise ValueError("마지막 구간의 상한은 float('inf')여야 합니다")
+
+        self.uppers = uppers
+        self.lowers = (0,) + uppers[:-1]
+        self.columns = tuple(zip(*(row[1:] for row in brackets)))
+        self._rows = tuple(
+            (lower,) + tuple(row[1:]) for lower, row in zip(self.lowers, brackets)
+        )
+        self.rate_scale = rate_scale
+        self._arrays = None
+
+    def __len__(self) -> int:
+        return len(self.uppers)
+
+    def find(self, value) -> int:
+        """value가 속한 구간의 인덱스 (value <= 상한 인 첫 구간)."""
+        return bisect_left(self.uppers, value)
+
+    def row(self, value) -> tuple:
+        """value가 속한 구간의 (하한, 값1, 값2, ...) 튜플."""
+        return self._rows[bisect_left(self.uppers, value)]
+
+    def find_batch(self, values):
+        """배열 각 원소가 속한 구간 인덱스 배열 (np.searchsorted)."""
+        uppers, _, _ = self._compiled_arrays()
+        return np.searchsorted(uppers, values, side="left")
+
+    def rows_batch(self, values) -> tuple:
+        """배열 각 원소가 속한 구간의 (하한 배열, 값1 배열, ...) 튜플."""
+        uppers, lowers, columns = self._compiled_arrays()
+        index = np.searchsorted(uppers, values, side="left")
+        return (lowers[index],) + tuple(column[index] for column in columns)
+
+    def _compiled_arrays(self):
+        """NumPy 배열 버전을 최초 1회 생성하여 재사용한다."""
+        if self._arrays is None:
+            self._arrays = (
+                np.asarray(self.uppers, dtype=np.float64),
+                np.asarray(self.lowers, dtype=np.int64),
+                tuple(self._column_array(column) for column in self.columns),
+            )
+        return self._arrays
+
+    def _column_array(self, column):
+        """열 배열. Fraction 열은 rate_scale을 곱한 int64 계수 배열."""
+        if not any(isinstance(value, Fraction) for value in column):
+            return np.asarray(column)
+        scaled = [Fraction(value) * self.rate_scale for value in column]
+        if any(value.denominator != 1 for value in scaled):
+            raise ValueError(f"공제율 열이 rate_scale {self.rate_scale}로 나누어떨어지지 않습니다")
+        return np.asarray([value.numerator for value in scaled], dtype=np.int64)
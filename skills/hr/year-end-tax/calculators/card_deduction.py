@@ -2,21 +2,16 @@
 신용카드 등 소득공제 계산기 (조특법 제126조의2) [p.131-147]
 
 순수 함수로 구현. 모든 금액 단위: 원 (KRW).
+calc_card_deduction_batch()는 동일한 계산을 직원 N명의 열 단위로 수행합니다.
 """
-from constants import (
-    CARD_MINIMUM_USAGE_RATE,
-    CARD_RATE_CREDIT,
-    CARD_RATE_DEBIT,
-    CARD_RATE_CULTURE,
-    CARD_RATE_TRADITIONAL,
-    CARD_RATE_TRANSIT,
-    CARD_LIMIT_UNDER_70M_RATE,
-    CARD_LIMIT_UNDER_70M_CAP,
-    CARD_LIMIT_OVER_70M,
-    CARD_ADDITIONAL_LIMIT_UNDER_70M,
-    CARD_ADDITIONAL_LIMIT_OVER_70M,
-    CARD_SALARY_THRESHOLD,
-)
+try:
+    import numpy as np
+except ImportError:  # numpy는 *_batch 함수에서만 필요
+    np = None
+
+from fixed_point import apply_rate, coefficient, truncate
+from salary_cache import salary_profile
+from tax_rules import TaxRules, load_rules
 
 
 def calc_card_deduction(
@@ -26,6 +21,7 @@ def calc_card_deduction(
     culture: int = 0,
     traditional: int = 0,
     transit: int = 0,
+    rules: TaxRules | None = None,
 ) -> int:
     """신용카드 등 소득공제 [p.131-147]
 
@@ -36,6 +32,7 @@ def calc_card_deduction(
         culture: 문화체육 사용분 (총급여 7천만원 이하만 적용)
         traditional: 전통시장 사용분
         transit: 대중교통 이용분
+        rules: 과세연도 세법 규칙 (기본: load_rules())
 
     Returns:
         소득공제 금액 (원, 정수)
@@ -47,12 +44,16 @@ def calc_card_deduction(
         4. 기본 공제 한도 적용
         5. 추가 공제 (문화체육+전통시장+대중교통) 한도 적용
     """
-    minimum_usage = int(total_salary * CARD_MINIMUM_USAGE_RATE)
+    if rules is None:
+        rules = load_rules()
+
+    profile = salary_profile(total_salary, rules)
+    minimum_usage = profile.card_minimum_usage
 
-    effective_culture = culture if total_salary <= CARD_SALARY_THRESHOLD else 0
+    effective_culture = culture if total_salary <= rules.CARD_SALARY_THRESHOLD else 0
 
     categories = _build_categories(
-        credit_card, debit_cash, effective_culture, traditional, transit,
+        credit_card, debit_cash, effective_culture, traditional, transit, rules,
     )
 
     total_usage = sum(amount for amount, _ in categories)
@@ -65,11 +66,11 @@ def calc_card_deduction(
     if net_total <= 0:
         return 0
 
-    basic_limit = _calc_basic_limit(total_salary)
+    basic_limit = profile.card_basic_limit
     basic_deduction = min(net_total, basic_limit)
 
     additional_deduction = _calc_additional_deduction(
-        net_total, basic_limit, net_deductions, total_salary,
+        net_total, basic_limit, net_deductions, total_salary, rules,
     )
 
     return int(basic_deduction + additional_deduction)
@@ -81,18 +82,34 @@ def _build_categories(
     culture: int,
     traditional: int,
     transit: int,
+    rules: TaxRules,
 ) -> list[tuple[int, float]]:
     """결제수단별 (사용액, 공제율) 목록 생성.
 
     최저사용금액 차감 순서: 신용카드 -> 체크카드/현금 -> 문화체육 -> 전통시장 -> 대중교통
     """
-    return [
-        (credit_card, CARD_RATE_CREDIT),
-        (debit_cash, CARD_RATE_DEBIT),
-        (culture, CARD_RATE_CULTURE),
-        (traditional, CARD_RATE_TRADITIONAL),
-        (transit, CARD_RATE_TRANSIT),
-    ]
+    amounts = (credit_card, debit_cash, culture, traditional, transit)
+    return list(zip(amounts, category_rates(rules)))
+
+
+def category_rates(rules: TaxRules) -> tuple[float, ...]:
+    """결제수단별 공제율 (최저사용금액 차감 순서)
+
+    신용카드 -> 체크카드/현금 -> 문화체육 -> 전통시장 -> 대중교통
+
+    Args:
+        rules: 과세연도 세법 규칙
+
+    Returns:
+        결제수단별 공제율 (위 순서)
+    """
+    return (
+        rules.CARD_RATE_CREDIT,
+        rules.CARD_RATE_DEBIT,
+        rules.CARD_RATE_CULTURE,
+        rules.CARD_RATE_TRADITIONAL,
+        rules.CARD_RATE_TRANSIT,
+    )
 
 
 def _calc_net_deductions(
@@ -116,18 +133,23 @@ def _calc_net_deductions(
     return net_deductions
 
 
-def _calc_basic_limit(total_salary: int) -> int:
+def _calc_minimum_usage(total_salary: int, rules: TaxRules) -> int:
+    """최저사용금액 = 총급여액 x 25%."""
+    return int(total_salary * rules.CARD_MINIMUM_USAGE_RATE)
+
+
+def _calc_basic_limit(total_salary: int, rules: TaxRules) -> int:
     """기본 공제 한도 계산.
 
     - 총급여 7천만원 이하: min(총급여x20%, 300만원)
     - 총급여 7천만원 초과: 250만원
     """
-    if total_salary <= CARD_SALARY_THRESHOLD:
+    if total_salary <= rules.CARD_SALARY_THRESHOLD:
         return min(
-            int(total_salary * CARD_LIMIT_UNDER_70M_RATE),
-            CARD_LIMIT_UNDER_70M_CAP,
+            int(total_salary * rules.CARD_LIMIT_UNDER_70M_RATE),
+            rules.CARD_LIMIT_UNDER_70M_CAP,
         )
-    return CARD_LIMIT_OVER_70M
+    return rules.CARD_LIMIT_OVER_70M
 
 
 def _calc_additional_deduction(
@@ -135,6 +157,7 @@ def _calc_additional_deduction(
     basic_limit: int,
     net_deductions: list[float],
     total_salary: int,
+    rules: TaxRules,
 ) -> int:
     """추가 공제 계산 (문화체육 + 전통시장 + 대중교통).
 
@@ -148,9 +171,134 @@ def _calc_additional_deduction(
     # net_deductions 인덱스: [0]=신용카드, [1]=체크/현금, [2]=문화, [3]=전통, [4]=대중교통
     additional_sources = net_deductions[2] + net_deductions[3] + net_deductions[4]
 
-    if total_salary <= CARD_SALARY_THRESHOLD:
-        additional_limit = CARD_ADDITIONAL_LIMIT_UNDER_70M
+    if total_salary <= rules.CARD_SALARY_THRESHOLD:
+        additional_limit = rules.CARD_ADDITIONAL_LIMIT_UNDER_70M
     else:
-        additional_limit = CARD_ADDITIONAL_LIMIT_OVER_70M
+        additional_limit = rules.CARD_ADDITIONAL_LIMIT_OVER_70M
 
     return int(min(excess, additional_sources, additional_limit))
+
+
+# =============================================================================
+# 배치 계산 (NumPy int64 배열)
+# =============================================================================
+def calc_card_deduction_batch(
+    total_salary,
+    credit_card,
+    debit_cash,
+    culture=0,
+    traditional=0,
+    transit=0,
+    rules=None,
+):
+    """신용카드 등 소득공제 배치 계산 [p.131-147]
+
+    calc_card_deduction()과 동일한 결과를 직원 N명에 대해 한 번에 산출한다.
+    최저사용금액 차감(waterfall)은 카테고리 순서의 누적합과 clip으로 계산한다.
+
+    Args:
+        total_salary: 총급여액 배열
+        credit_card: 신용카드 사용액 배열
+        debit_cash: 체크카드+현금영수증 사용액 배열
+        culture: 문화체육 사용분 배열 (총급여 7천만원 이하만 적용)
+        traditional: 전통시장 사용분 배열
+        transit: 대중교통 이용분 배열
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        소득공제 금액 배열 (원, int64)
+    """
+    if rules is None:
+        rules = load_rules()
+
+    salary = np.atleast_1d(np.asarray(total_salary, dtype=np.int64))
+    minimum_usage = apply_rate(salary, rules.CARD_MINIMUM_USAGE_RATE, rules)
+
+    effective_culture = np.where(salary <= rules.CARD_SALARY_THRESHOLD, culture, 0)
+
+    amounts = np.stack([
+        np.broadcast_to(np.asarray(amount, dtype=np.int64), salary.shape)
+        for amount in (credit_card, debit_cash, effective_culture, traditional, transit)
+    ])
+
+    # 순 공제액은 rate_scale 단위 (기본 모드 float 원, 정확 모드 int64)
+    net_deductions = calc_net_deductions_batch(amounts, minimum_usage, rules)
+    net_total = net_deductions[0]
+    for net_deduction in net_deductions[1:]:
+        net_total = net_total + net_deduction
+
+    basic_limit = calc_basic_limit_batch(salary, rules) * rules.rate_scale
+    basic_deduction = np.minimum(net_total, basic_limit)
+
+    additional_deduction = _calc_additional_deduction_batch(
+        net_total, basic_limit, net_deductions, salary, rules,
+    )
+
+    deduction = truncate(basic_deduction + additional_deduction * rules.rate_scale, rules)
+    no_deduction = (amounts.sum(axis=0) <= minimum_usage) | (net_total <= 0)
+    return np.where(no_deduction, 0, deduction)
+
+
+def calc_net_deductions_batch(amounts, minimum_usage, rules):
+    """카테고리별 최저사용금액 차감 후 순 공제액 배치 계산
+
+    최저사용금액을 category_rates() 순서(신용카드부터)로 차감한다.
+    카테고리 i에서 차감되는 금액 = clip(최저사용금액 - 앞선 카테고리 누적 사용액, 0, 사용액_i)
+
+    Args:
+        amounts: 결제수단별 사용액 배열 (카테고리 x 직원, category_rates() 순서)
+        minimum_usage: 최저사용금액 배열 (원)
+        rules: 과세연도 세법 규칙
+
+    Returns:
+        순 공제액 배열 (카테고리 x 직원, rate_scale 단위)
+    """
+    used_before = np.cumsum(amounts, axis=0) - amounts
+    consumed = np.clip(minimum_usage - used_before, 0, amounts)
+    rates = np.asarray([coefficient(rate, rules) for rate in category_rates(rules)])
+    rates = rates[:, np.newaxis]
+    return (amounts - consumed) * rates
+
+
+def calc_basic_limit_batch(total_salary, rules):
+    """기본 공제 한도 배치 계산
+
+    - 총급여 7천만원 이하: min(총급여x20%, 300만원)
+    - 총급여 7천만원 초과: 250만원
+
+    Args:
+        total_salary: 총급여액 배열 (원)
+        rules: 과세연도 세법 규칙
+
+    Returns:
+        기본 공제 한도 배열 (원, int64)
+    """
+    under_limit = np.minimum(
+        apply_rate(total_salary, rules.CARD_LIMIT_UNDER_70M_RATE, rules),
+        rules.CARD_LIMIT_UNDER_70M_CAP,
+    )
+    return np.where(
+        total_salary <= rules.CARD_SALARY_THRESHOLD, under_limit, rules.CARD_LIMIT_OVER_70M,
+    )
+
+
+def _calc_additional_deduction_batch(
+    net_total, basic_limit, net_deductions, total_salary, rules,
+):
+    """추가 공제 배치 계산 (_calc_additional_deduction과 동일).
+
+    net_total, basic_limit, net_deductions는 rate_scale 단위이며 결과는 원 단위.
+    """
+    excess = net_total - basic_limit
+
+    # net_deductions 행: [0]=신용카드, [1]=체크/현금, [2]=문화, [3]=전통, [4]=대중교통
+    additional_sources = net_deductions[2] + net_deductions[3] + net_deductions[4]
+
+    additional_limit = np.where(
+        total_salary <= rules.CARD_SALARY_THRESHOLD,
+        rules.CARD_ADDITIONAL_LIMIT_UNDER_70M,
+        rules.CARD_ADDITIONAL_LIMIT_OVER_70M,
+    ) * rules.rate_scale
+
+    additional = np.minimum(np.minimum(excess, additional_sources), additional_limit)
+    return np.where(excess <= 0, 0, truncate(additional, rules))
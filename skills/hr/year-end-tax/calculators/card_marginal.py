@@ -0,0 +1,147 @@
+"""
+결제수단별 신용카드 사용액 한계가치 [p.131-147]
+
+"다음 1,000원을 어느 결제수단으로 쓰면 얼마가 돌아오나?"에 답합니다.
+calc_card_deduction()을 결제수단별로 다시 돌리지 않고, 현재 사용액에서 어느 구간/한도가
+걸려 있는지로 한계 공제율(사용액 1원당 공제액 증가분)을 해석적으로 구합니다.
+
+한계 공제율 (결제수단 c, 사용액을 늘리는 방향의 기울기):
+  1. 총 사용액 < 최저사용금액(총급여 x 25%): 0
+  2. 최저사용금액이 끝나는 결제수단 k (차감 순서 신용카드 -> 체크/현금 -> 문화 -> 전통시장 -> 대중교통)
+     - c가 k보다 앞이면 최저사용금액 차감분이 k에서 앞으로 옮겨지므로 k의 공제율
+     - 그 외에는 c의 공제율
+  3. 순공제액 < 기본 한도: 2의 공제율
+     순공제액 >= 기본 한도: 추가 공제 min(초과분, 문화/전통시장/대중교통 순공제액, 추가 한도) 중
+     걸린 항목의 기울기 (추가 한도이면 0)
+
+한계 절세액 = 한계 공제액 x 한계세율. 한계세율은 과세표준이 줄어드는 방향의
+기본세율 x (1 - 근로소득세액공제 기울기)이며, 결정세액 0원, 근로소득세액공제 한도,
+소득공제 종합한도(2,500만원)에 걸린 직원은 0입니다.
+
+구간 안에서는 정확한 기울기이며, 원 미만 절사(int())는 반영하지 않습니다.
+
+Usage:
+    inputs = dict(total_salary=salaries, num_dependents=dependents)
+    usage = dict(credit_card=credit, debit_cash=debit, traditional=market, transit=bus)
+    value = calc_card_marginal_batch(inputs, usage, unit=1_000)
+    value["debit_cash_tax_saving"]  # 체크카드 1,000원 추가 사용 시 절세액
+"""
+import numpy as np
+
+from card_deduction import (
+    calc_basic_limit_batch,
+    calc_card_deduction_batch,
+    calc_net_deductions_batch,
+    category_rates,
+)
+from income_tax import calc_marginal_tax_rate_batch
+from salary_cache import salary_profiles_batch
+from tax_rules import TaxRules, load_rules
+from total_calculator import calc_year_end_tax_batch
+
+# 최저사용금액 차감 순서 (calc_card_deduction() 인자 순서)
+CATEGORIES = ("credit_card", "debit_cash", "culture", "traditional", "transit")
+
+# 추가 공제 대상 결제수단 (문화체육, 전통시장, 대중교통)
+_ADDITIONAL = (2, 3, 4)
+
+
+def calc_card_marginal_batch(
+    inputs: dict,
+    card_usage: dict,
+    unit: int = 1_000,
+    rules: TaxRules | None = None,
+) -> dict:
+    """결제수단별 한계 공제액/한계 절세액 (직원 배열).
+
+    Args:
+        inputs: calc_year_end_tax_batch() 인자 dict (card_deduction 제외, 직원별 배열/스칼라)
+        card_usage: 현재 결제수단별 사용액 (CATEGORIES 키, 없으면 0)
+        unit: 추가 사용액 단위 (원, 기본 1,000원)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        dict (직원 수 길이 배열):
+            card_deduction: 현재 신용카드등 소득공제 (int64)
+            marginal_tax_rate: 소득공제 1원당 결정세액 감소액 (float64)
+            <결제수단>_deduction: unit원 추가 사용 시 공제액 증가분 (float64)
+            <결제수단>_tax_saving: unit원 추가 사용 시 결정세액 감소분 (float64)
+    """
+    if rules is None:
+        rules = load_rules()
+
+    inputs = dict(inputs)
+    inputs.pop("card_deduction", None)
+    salary = np.atleast_1d(np.asarray(inputs["total_salary"], dtype=np.int64))
+    usage = [card_usage.get(category, 0) for category in CATEGORIES]
+
+    deduction = calc_card_deduction_batch(salary, *usage, rules=rules)
+    slopes = _deduction_slopes(salary, usage, rules)
+    tax_rate = _marginal_tax_rate(inputs, salary, deduction, rules)
+
+    result = {"card_deduction": deduction, "marginal_tax_rate": tax_rate}
+    for category, slope in zip(CATEGORIES, slopes):
+        result[f"{category}_deduction"] = slope * unit
+        result[f"{category}_tax_saving"] = slope * unit * tax_rate
+    return result
+
+
+def _deduction_slopes(salary, usage, rules):
+    """결제수단별 한계 공제율 (결제수단 x 직원, float64)."""
+    salary_under = salary <= rules.CARD_SALARY_THRESHOLD
+    amounts = np.stack([
+        np.broadcast_to(np.asarray(amount, dtype=np.int64), salary.shape) for amount in usage
+    ])
+    amounts[2] = np.where(salary_under, amounts[2], 0)  # 문화체육은 7천만원 이하만
+
+    scale = rules.rate_scale
+    minimum_usage = salary_profiles_batch(salary, rules)["card_minimum_usage"]
+    net_deductions = calc_net_deductions_batch(amounts, minimum_usage, rules)
+    net_total = net_deductions.sum(axis=0)
+    basic_limit = calc_basic_limit_batch(salary, rules) * scale
+    additional_sources = net_deductions[list(_ADDITIONAL)].sum(axis=0)
+    additional_limit = np.where(
+        salary_under, rules.CARD_ADDITIONAL_LIMIT_UNDER_70M, rules.CARD_ADDITIONAL_LIMIT_OVER_70M,
+    ) * scale
+    excess = net_total - basic_limit
+
+    # 최저사용금액이 끝나는 결제수단 (누적 사용액 >= 최저사용금액인 첫 결제수단)
+    cumulative = np.cumsum(amounts, axis=0)
+    reached = cumulative[-1] >= minimum_usage
+    frontier = np.argmax(cumulative >= minimum_usage, axis=0)
+    rates = np.asarray([float(rate) for rate in category_rates(rules)])
+
+    slopes = []
+    for category in range(len(CATEGORIES)):
+        source = np.maximum(category, frontier)
+        net_slope = np.where(reached, rates[source], 0.0)
+        if category == 2:
+            net_slope = np.where(salary_under, net_slope, 0.0)
+        source_slope = np.where(np.isin(source, _ADDITIONAL), net_slope, 0.0)
+
+        # 추가 공제 = min(초과분, 추가 공제 대상 순공제액, 추가 한도): 최솟값인 항목 중 가장 작은 기울기
+        bound = np.minimum(np.minimum(excess, additional_sources), additional_limit)
+        additional_slope = np.minimum.reduce([
+            np.where(excess == bound, net_slope, np.inf),
+            np.where(additional_sources == bound, source_slope, np.inf),
+            np.where(additional_limit == bound, 0.0, np.inf),
+        ])
+        slopes.append(np.where(excess < 0, net_slope, additional_slope))
+    return slopes
+
+
+def _marginal_tax_rate(inputs, salary, deduction, rules):
+    """소득공제 1원 증가 시 결정세액 감소액 (과세표준이 줄어드는 방향의 기울기)."""
+    result = calc_year_end_tax_batch(**inputs, card_deduction=deduction, rules=rules)
+    rate = calc_marginal_tax_rate_batch(
+        np.broadcast_to(result["taxable_income"], salary.shape),
+        np.broadcast_to(result["calculated_tax"], salary.shape),
+        salary,
+        np.broadcast_to(result["earned_income_tax_credit"], salary.shape),
+        rules,
+    )
+
+    other = np.asarray(inputs.get("other_income_deductions", 0), dtype=np.int64)
+    limited = deduction + other >= rules.TOTAL_DEDUCTION_LIMIT
+    active = (np.broadcast_to(result["determined_tax"], salary.shape) > 0) & ~limited
+    return np.where(active, rate, 0.0)
@@ -0,0 +1,145 @@
+"""
+Arrow/Parquet 열 단위 입출력
+
+Parquet/Arrow 열을 배치 계산기(*_batch) 인자로 직접 매핑하고,
+결과 열을 행 단위 dict 변환 없이 int64 Arrow 열로 씁니다.
+
+계산기별로 필요한 열만 읽습니다 (e.g., card는 총급여 + 카드 사용액 5개 열).
+열 이름은 각 배치 함수의 인자 이름과 같으며, 없는 선택 열은 기본값을 사용합니다.
+  - 정수 열: null -> 0
+  - bool 열: is_single_parent, is_woman_deduction
+  - list<int> 열: birth_orders, *_amounts -> ragged.RaggedArray (null -> 빈 행)
+
+Usage:
+    inputs = read_inputs("employees.parquet", "card")
+    write_results("card.parquet", {"card_deduction": calc_card_deduction_batch(**inputs)})
+"""
+import inspect
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from card_deduction import calc_card_deduction_batch
+from donation_deduction import calc_donation_tax_credit_batch
+from education_deduction import calc_education_tax_credit_batch
+from medical_deduction import calc_medical_tax_credit_batch
+from pension_deduction import calc_pension_tax_credit_batch
+from ragged import RaggedArray
+from total_calculator import calc_year_end_tax_batch
+
+# 계산기 이름 -> (배치 함수, 단일 결과 열 이름 또는 None(결과 dict))
+CALCULATORS = {
+    "year_end_tax": (calc_year_end_tax_batch, None),
+    "card": (calc_card_deduction_batch, "card_deduction"),
+    "medical": (calc_medical_tax_credit_batch, "medical_tax_credit"),
+    "donation": (calc_donation_tax_credit_batch, "donation_tax_credit"),
+    "education": (calc_education_tax_credit_batch, "education_tax_credit"),
+    "pension": (calc_pension_tax_credit_batch, "pension_tax_credit"),
+}
+
+
+def input_columns(calculator: str) -> tuple[str, ...]:
+    """계산기가 사용하는 입력 열 이름 (배치 함수 인자 순서, rules 제외)."""
+    function, _ = _lookup(calculator)
+    return tuple(name for name in inspect.signature(function).parameters if name != "rules")
+
+
+def required_columns(calculator: str) -> tuple[str, ...]:
+    """기본값이 없어 반드시 있어야 하는 입력 열 이름."""
+    function, _ = _lookup(calculator)
+    return tuple(
+        name for name, parameter in inspect.signature(function).parameters.items()
+        if parameter.default is inspect.Parameter.empty
+    )
+
+
+def read_inputs(source, calculator: str = "year_end_tax") -> dict:
+    """Parquet 파일 또는 Arrow 테이블에서 계산기에 필요한 열만 읽는다.
+
+    Args:
+        source: Parquet 파일 경로 또는 pyarrow.Table
+        calculator: CALCULATORS 키
+
+    Returns:
+        배치 함수에 **kwargs로 넘길 수 있는 dict (열 이름 -> 배열/RaggedArray)
+
+    Raises:
+        KeyError: 알 수 없는 계산기
+        ValueError: 필수 열이 없는 경우
+    """
+    wanted = input_columns(calculator)
+
+    if isinstance(source, pa.Table):
+        table = source.select([name for name in wanted if name in source.column_names])
+    else:
+        available = set(pq.read_schema(source).names)
+        table = pq.read_table(source, columns=[name for name in wanted if name in available])
+
+    missing = [name for name in required_columns(calculator) if name not in table.column_names]
+    if missing:
+        raise ValueError(f"필수 열이 없습니다: {', '.join(missing)}")
+
+    return {name: _to_input(table.column(name)) for name in table.column_names}
+
+
+def _to_input(column: pa.ChunkedArray):
+    """Arrow 열 1개를 배치 함수 인자로 변환한다."""
+    array = column.combine_chunks()
+
+    if pa.types.is_list(array.type) or pa.types.is_large_list(array.type):
+        lengths = pc.fill_null(pc.list_value_length(array), 0).to_numpy()
+        offsets = np.zeros(lengths.size + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        values = pc.fill_null(array.flatten(), 0).cast(pa.int64()).to_numpy()
+        return RaggedArray(offsets, values)
+
+    if pa.types.is_boolean(array.type):
+        return pc.fill_null(array, False).to_numpy(zero_copy_only=False)
+
+    return pc.fill_null(array, 0).cast(pa.int64()).to_numpy()
+
+
+def run_calculator(source, calculator: str = "year_end_tax", rules=None) -> dict:
+    """필요한 열만 읽어 배치 계산기를 실행한다.
+
+    Args:
+        source: Parquet 파일 경로 또는 pyarrow.Table
+        calculator: CALCULATORS 키
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        결과 열 이름 -> int64 배열 dict
+    """
+    function, result_name = _lookup(calculator)
+    result = function(**read_inputs(source, calculator), rules=rules)
+    return result if result_name is None else {result_name: result}
+
+
+def results_to_table(results: dict, ids=None, id_column: str = "employee_id") -> pa.Table:
+    """결과 열 dict를 int64 Arrow 테이블로 변환한다 (행 단위 변환 없음).
+
+    Args:
+        results: 열 이름 -> 배열 (e.g., calc_year_end_tax_batch() 결과)
+        ids: 맨 앞에 붙일 직원 식별 열 (Arrow/NumPy 배열, 선택)
+        id_column: 식별 열 이름
+    """
+    columns = {} if ids is None else {id_column: ids}
+    for name, values in results.items():
+        columns[name] = pa.array(np.asarray(values, dtype=np.int64), type=pa.int64())
+    return pa.table(columns)
+
+
+def write_results(path, results: dict, ids=None, id_column: str = "employee_id") -> None:
+    """결과 열 dict를 Parquet 파일로 쓴다 (int64 열)."""
+    pq.write_table(results_to_table(results, ids, id_column), path)
+
+
+def _lookup(calculator: str):
+    try:
+        return CALCULATORS[calculator]
+    except KeyError:
+        raise KeyError(
+            f"알 수 없는 계산기: {calculator!r} (가능: {', '.join(CALCULATORS)})"
+        ) from None
@@ -3,6 +3,7 @@
 
 모든 금액 단위: 원 (KRW)
 매년 세법 개정 시 이 파일만 업데이트하면 됩니다.
+다른 과세연도는 constants_YYYY.py에 같은 이름으로 두고 tax_rules.RULE_MODULES에 등록합니다.
 
 Sources: 2025년 원천징수의무자를 위한 연말정산 신고안내 PDF
 """
@@ -211,3 +212,4 @@ STANDARD_TAX_CREDIT = 130_000  # 13만원 [p.174]
 # 과세연도
 # =============================================================================
 TAX_YEAR = 2025
+RULES_VERSION = "2025.1"  # 데이터 파일 버전 (상수 수정 시 증가)
@@ -3,27 +3,19 @@
 
 정치자금, 고향사랑, 특례, 우리사주, 일반(종교외/종교) 기부금에 대한
 세액공제를 계산합니다. 각 유형별 한도와 공제율이 다릅니다.
+
+calc_donation_tax_credit_batch()는 동일한 계산을 직원 N명의 열 단위로 수행합니다.
 """
-from constants import (
-    DONATION_POLITICAL_RATE_UNDER_100K,
-    DONATION_POLITICAL_RATE_UNDER_30M,
-    DONATION_POLITICAL_RATE_OVER_30M,
-    DONATION_POLITICAL_THRESHOLD_1,
-    DONATION_POLITICAL_THRESHOLD_2,
-    DONATION_HOMETOWN_THRESHOLD,
-    DONATION_HOMETOWN_RATE_UNDER_100K,
-    DONATION_HOMETOWN_RATE_OVER_100K,
-    DONATION_SPECIAL_RATE_UNDER_10M,
-    DONATION_SPECIAL_RATE_OVER_10M,
-    DONATION_SPECIAL_THRESHOLD,
-    DONATION_ESOP_LIMIT_RATE,
-    DONATION_GENERAL_LIMIT_RATE_RELIGIOUS,
-    DONATION_GENERAL_LIMIT_RATE_NON_RELIGIOUS,
-    DONATION_GENERAL_LIMIT_RATE_NON_RELIGIOUS_WITH_RELIGIOUS,
-)
-
-
-def _calc_political_credit(amount: int) -> int:
+try:
+    import numpy as np
+except ImportError:  # numpy는 *_batch 함수에서만 필요
+    np = None
+
+from fixed_point import apply_coefficient, apply_rate, coefficient, truncate
+from tax_rules import TaxRules, load_rules
+
+
+def _calc_political_credit(amount: int, rules: TaxRules) -> int:
     """정치자금기부금 세액공제 계산.
 
     - 10만원 이하: 100/110
@@ -32,6 +24,7 @@ def _calc_political_credit(amount: int) -> int:
 
     Args:
         amount: 정치자금기부금 (원)
+        rules: 과세연도 세법 규칙
 
     Returns:
         세액공제 금액 (원)
@@ -41,24 +34,24 @@ def _calc_political_credit(amount: int) -> int:
 
     credit = 0
 
-    tier_1 = min(amount, DONATION_POLITICAL_THRESHOLD_1)
-    credit += tier_1 * DONATION_POLITICAL_RATE_UNDER_100K
+    tier_1 = min(amount, rules.DONATION_POLITICAL_THRESHOLD_1)
+    credit += tier_1 * rules.DONATION_POLITICAL_RATE_UNDER_100K
 
-    if amount > DONATION_POLITICAL_THRESHOLD_1:
+    if amount > rules.DONATION_POLITICAL_THRESHOLD_1:
         tier_2 = min(
-            amount - DONATION_POLITICAL_THRESHOLD_1,
-            DONATION_POLITICAL_THRESHOLD_2 - DONATION_POLITICAL_THRESHOLD_1,
+            amount - rules.DONATION_POLITICAL_THRESHOLD_1,
+            rules.DONATION_POLITICAL_THRESHOLD_2 - rules.DONATION_POLITICAL_THRESHOLD_1,
         )
-        credit += tier_2 * DONATION_POLITICAL_RATE_UNDER_30M
+        credit += tier_2 * rules.DONATION_POLITICAL_RATE_UNDER_30M
 
-    if amount > DONATION_POLITICAL_THRESHOLD_2:
-        tier_3 = amount - DONATION_POLITICAL_THRESHOLD_2
-        credit += tier_3 * DONATION_POLITICAL_RATE_OVER_30M
+    if amount > rules.DONATION_POLITICAL_THRESHOLD_2:
+        tier_3 = amount - rules.DONATION_POLITICAL_THRESHOLD_2
+        credit += tier_3 * rules.DONATION_POLITICAL_RATE_OVER_30M
 
     return int(credit)
 
 
-def _calc_hometown_credit(amount: int) -> int:
+def _calc_hometown_credit(amount: int, rules: TaxRules) -> int:
     """고향사랑기부금 세액공제 계산.
 
     - 10만원 이하: 100/110
@@ -66,6 +59,7 @@ def _calc_hometown_credit(amount: int) -> int:
 
     Args:
         amount: 고향사랑기부금 (원)
+        rules: 과세연도 세법 규칙
 
     Returns:
         세액공제 금액 (원)
@@ -75,17 +69,17 @@ def _calc_hometown_credit(amount: int) -> int:
 
     credit = 0
 
-    tier_1 = min(amount, DONATION_HOMETOWN_THRESHOLD)
-    credit += tier_1 * DONATION_HOMETOWN_RATE_UNDER_100K
+    tier_1 = min(amount, rules.DONATION_HOMETOWN_THRESHOLD)
+    credit += tier_1 * rules.DONATION_HOMETOWN_RATE_UNDER_100K
 
-    if amount > DONATION_HOMETOWN_THRESHOLD:
-        tier_2 = amount - DONATION_HOMETOWN_THRESHOLD
-        credit += tier_2 * DONATION_HOMETOWN_RATE_OVER_100K
+    if amount > rules.DONATION_HOMETOWN_THRESHOLD:
+        tier_2 = amount - rules.DONATION_HOMETOWN_THRESHOLD
+        credit += tier_2 * rules.DONATION_HOMETOWN_RATE_OVER_100K
 
     return int(credit)
 
 
-def _calc_standard_credit(amount: int) -> int:
+def _calc_standard_credit(amount: int, rules: TaxRules) -> int:
     """특례/우리사주/일반 기부금 세액공제 계산 (공통 로직).
 
     - 1천만원 이하: 15%
@@ -93,6 +87,7 @@ def _calc_standard_credit(amount: int) -> int:
 
     Args:
         amount: 기부금 (원)
+        rules: 과세연도 세법 규칙
 
     Returns:
         세액공제 금액 (원)
@@ -100,12 +95,12 @@ def _calc_standard_credit(amount: int) -> int:
     if amount <= 0:
         return 0
 
-    tier_1 = min(amount, DONATION_SPECIAL_THRESHOLD)
-    credit = tier_1 * DONATION_SPECIAL_RATE_UNDER_10M
+    tier_1 = min(amount, rules.DONATION_SPECIAL_THRESHOLD)
+    credit = tier_1 * rules.DONATION_SPECIAL_RATE_UNDER_10M
 
-    if amount > DONATION_SPECIAL_THRESHOLD:
-        tier_2 = amount - DONATION_SPECIAL_THRESHOLD
-        credit += tier_2 * DONATION_SPECIAL_RATE_OVER_10M
+    if amount > rules.DONATION_SPECIAL_THRESHOLD:
+        tier_2 = amount - rules.DONATION_SPECIAL_THRESHOLD
+        credit += tier_2 * rules.DONATION_SPECIAL_RATE_OVER_10M
 
     return int(credit)
 
@@ -118,6 +113,7 @@ def calc_donation_tax_credit(
     esop: int = 0,
     general_non_religious: int = 0,
     general_religious: int = 0,
+    rules: TaxRules | None = None,
 ) -> int:
     """기부금 세액공제 [p.186-198].
 
@@ -132,10 +128,14 @@ def calc_donation_tax_credit(
         esop: 우리사주조합기부금 (원)
         general_non_religious: 일반기부금 - 종교단체 외 (원)
         general_religious: 일반기부금 - 종교단체 (원)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
 
     Returns:
         세액공제 금액 (원)
     """
+    if rules is None:
+        rules = load_rules()
+
     if earned_income_amount <= 0:
         return 0
 
@@ -145,37 +145,163 @@ def calc_donation_tax_credit(
     # 1. 정치자금기부금: 한도 = 근로소득금액 x 100%
     political_limit = remaining
     political_eligible = min(political, political_limit)
-    total_credit += _calc_political_credit(political_eligible)
+    total_credit += _calc_political_credit(political_eligible, rules)
     remaining -= political_eligible
 
     # 2. 고향사랑기부금: 한도 = (근로소득금액 - 정치자금) x 100%
     hometown_limit = remaining
     hometown_eligible = min(hometown, hometown_limit)
-    total_credit += _calc_hometown_credit(hometown_eligible)
+    total_credit += _calc_hometown_credit(hometown_eligible, rules)
     remaining -= hometown_eligible
 
     # 3. 특례기부금: 한도 = (근로소득금액 - 정치자금 - 고향사랑) x 100%
     special_limit = remaining
     special_eligible = min(special, special_limit)
-    total_credit += _calc_standard_credit(special_eligible)
+    total_credit += _calc_standard_credit(special_eligible, rules)
     remaining -= special_eligible
 
     # 4. 우리사주조합기부금: 한도 = (잔여) x 30%
-    esop_limit = int(remaining * DONATION_ESOP_LIMIT_RATE)
+    esop_limit = int(remaining * rules.DONATION_ESOP_LIMIT_RATE)
     esop_eligible = min(esop, esop_limit)
-    total_credit += _calc_standard_credit(esop_eligible)
+    total_credit += _calc_standard_credit(esop_eligible, rules)
     remaining -= esop_eligible
 
     # 5. 일반기부금(종교외): 종교 있으면 잔여 x 20%, 없으면 잔여 x 30%
     has_religious = general_religious > 0
-    non_religious_rate = DONATION_GENERAL_LIMIT_RATE_NON_RELIGIOUS_WITH_RELIGIOUS if has_religious else DONATION_GENERAL_LIMIT_RATE_NON_RELIGIOUS
+    non_religious_rate = (
+        rules.DONATION_GENERAL_LIMIT_RATE_NON_RELIGIOUS_WITH_RELIGIOUS
+        if has_religious
+        else rules.DONATION_GENERAL_LIMIT_RATE_NON_RELIGIOUS
+    )
     non_religious_limit = int(remaining * non_religious_rate)
     non_religious_eligible = min(general_non_religious, non_religious_limit)
-    total_credit += _calc_standard_credit(non_religious_eligible)
+    total_credit += _calc_standard_credit(non_religious_eligible, rules)
 
     # 6. 일반기부금(종교): 잔여 x 10%
-    religious_limit = int(remaining * DONATION_GENERAL_LIMIT_RATE_RELIGIOUS)
+    religious_limit = int(remaining * rules.DONATION_GENERAL_LIMIT_RATE_RELIGIOUS)
     religious_eligible = min(general_religious, religious_limit)
-    total_credit += _calc_standard_credit(religious_eligible)
+    total_credit += _calc_standard_credit(religious_eligible, rules)
 
     return total_credit
+
+
+# =============================================================================
+# 배치 계산 (NumPy int64 배열)
+# =============================================================================
+def _calc_political_credit_batch(amount, rules):
+    """정치자금기부금 세액공제 배치 계산 (_calc_political_credit과 동일)."""
+    tier_1 = np.minimum(amount, rules.DONATION_POLITICAL_THRESHOLD_1)
+    tier_2 = np.clip(
+        amount - rules.DONATION_POLITICAL_THRESHOLD_1,
+        0,
+        rules.DONATION_POLITICAL_THRESHOLD_2 - rules.DONATION_POLITICAL_THRESHOLD_1,
+    )
+    tier_3 = np.maximum(amount - rules.DONATION_POLITICAL_THRESHOLD_2, 0)
+
+    credit = tier_1 * coefficient(rules.DONATION_POLITICAL_RATE_UNDER_100K, rules)
+    credit = credit + tier_2 * coefficient(rules.DONATION_POLITICAL_RATE_UNDER_30M, rules)
+    credit = credit + tier_3 * coefficient(rules.DONATION_POLITICAL_RATE_OVER_30M, rules)
+
+    return np.where(amount <= 0, 0, truncate(credit, rules))
+
+
+def _calc_hometown_credit_batch(amount, rules):
+    """고향사랑기부금 세액공제 배치 계산 (_calc_hometown_credit과 동일)."""
+    tier_1 = np.minimum(amount, rules.DONATION_HOMETOWN_THRESHOLD)
+    tier_2 = np.maximum(amount - rules.DONATION_HOMETOWN_THRESHOLD, 0)
+
+    credit = tier_1 * coefficient(rules.DONATION_HOMETOWN_RATE_UNDER_100K, rules)
+    credit = credit + tier_2 * coefficient(rules.DONATION_HOMETOWN_RATE_OVER_100K, rules)
+
+    return np.where(amount <= 0, 0, truncate(credit, rules))
+
+
+def _calc_standard_credit_batch(amount, rules):
+    """특례/우리사주/일반 기부금 세액공제 배치 계산 (_calc_standard_credit과 동일)."""
+    tier_1 = np.minimum(amount, rules.DONATION_SPECIAL_THRESHOLD)
+    tier_2 = np.maximum(amount - rules.DONATION_SPECIAL_THRESHOLD, 0)
+
+    credit = tier_1 * coefficient(rules.DONATION_SPECIAL_RATE_UNDER_10M, rules)
+    credit = credit + tier_2 * coefficient(rules.DONATION_SPECIAL_RATE_OVER_10M, rules)
+
+    return np.where(amount <= 0, 0, truncate(credit, rules))
+
+
+def calc_donation_tax_credit_batch(
+    earned_income_amount,
+    political=0,
+    hometown=0,
+    special=0,
+    esop=0,
+    general_non_religious=0,
+    general_religious=0,
+    rules=None,
+):
+    """기부금 세액공제 배치 계산 [p.186-198].
+
+    calc_donation_tax_credit()과 동일한 결과를 직원 N명에 대해 한 번에 산출한다.
+    공제 순서(정치자금 -> 고향사랑 -> 특례 -> 우리사주 -> 종교외일반 -> 종교일반)의
+    단계별 한도를 열 단위로 차감하며, 종교외 일반기부금 한도율(20%/30%)은
+    행별 종교단체 기부금 유무에 따라 선택한다.
+
+    Args:
+        earned_income_amount: 근로소득금액 배열 (원)
+        political: 정치자금기부금 배열 (원)
+        hometown: 고향사랑기부금 배열 (원)
+        special: 특례기부금 배열 (원)
+        esop: 우리사주조합기부금 배열 (원)
+        general_non_religious: 일반기부금 - 종교단체 외 배열 (원)
+        general_religious: 일반기부금 - 종교단체 배열 (원)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        세액공제 금액 배열 (원, int64)
+    """
+    if rules is None:
+        rules = load_rules()
+
+    earned = np.atleast_1d(np.asarray(earned_income_amount, dtype=np.int64))
+
+    def column(values):
+        return np.broadcast_to(np.asarray(values, dtype=np.int64), earned.shape)
+
+    religious = column(general_religious)
+    remaining = earned
+
+    # 1. 정치자금기부금: 한도 = 근로소득금액 x 100%
+    political_eligible = np.minimum(column(political), remaining)
+    total_credit = _calc_political_credit_batch(political_eligible, rules)
+    remaining = remaining - political_eligible
+
+    # 2. 고향사랑기부금: 한도 = 잔여 x 100%
+    hometown_eligible = np.minimum(column(hometown), remaining)
+    total_credit = total_credit + _calc_hometown_credit_batch(hometown_eligible, rules)
+    remaining = remaining - hometown_eligible
+
+    # 3. 특례기부금: 한도 = 잔여 x 100%
+    special_eligible = np.minimum(column(special), remaining)
+    total_credit = total_credit + _calc_standard_credit_batch(special_eligible, rules)
+    remaining = remaining - special_eligible
+
+    # 4. 우리사주조합기부금: 한도 = 잔여 x 30%
+    esop_limit = apply_rate(remaining, rules.DONATION_ESOP_LIMIT_RATE, rules)
+    esop_eligible = np.minimum(column(esop), esop_limit)
+    total_credit = total_credit + _calc_standard_credit_batch(esop_eligible, rules)
+    remaining = remaining - esop_eligible
+
+    # 5. 일반기부금(종교외): 종교 있으면 잔여 x 20%, 없으면 잔여 x 30%
+    non_religious_rate = np.where(
+        religious > 0,
+        coefficient(rules.DONATION_GENERAL_LIMIT_RATE_NON_RELIGIOUS_WITH_RELIGIOUS, rules),
+        coefficient(rules.DONATION_GENERAL_LIMIT_RATE_NON_RELIGIOUS, rules),
+    )
+    non_religious_limit = apply_coefficient(remaining, non_religious_rate, rules)
+    non_religious_eligible = np.minimum(column(general_non_religious), non_religious_limit)
+    total_credit = total_credit + _calc_standard_credit_batch(non_religious_eligible, rules)
+
+    # 6. 일반기부금(종교): 잔여 x 10%
+    religious_limit = apply_rate(remaining, rules.DONATION_GENERAL_LIMIT_RATE_RELIGIOUS, rules)
+    religious_eligible = np.minimum(religious, religious_limit)
+    total_credit = total_credit + _calc_standard_credit_batch(religious_eligible, rules)
+
+    return np.where(earned <= 0, 0, total_credit)
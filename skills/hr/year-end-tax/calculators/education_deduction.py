@@ -3,13 +3,18 @@
 
 본인, 취학전 아동, 초중고, 대학생, 장애인 특수교육비에 대한
 세액공제를 계산합니다. 공제율 15%.
+
+calc_education_tax_credit_batch()는 동일한 계산을 직원 N명에 대해 수행하며,
+자녀별 교육비는 CSR 형식(ragged.RaggedArray)으로 받습니다.
 """
-from constants import (
-    EDUCATION_RATE,
-    EDUCATION_LIMIT_PRESCHOOL,
-    EDUCATION_LIMIT_ELEMENTARY_MIDDLE_HIGH,
-    EDUCATION_LIMIT_UNIVERSITY,
-)
+try:
+    import numpy as np
+    from ragged import as_ragged
+except ImportError:  # numpy는 *_batch 함수에서만 필요
+    np = None
+
+from fixed_point import apply_rate
+from tax_rules import TaxRules, load_rules
 
 
 def _cap_per_person(amounts: list[int], limit: int) -> int:
@@ -31,6 +36,7 @@ def calc_education_tax_credit(
     school_amounts: list[int] | None = None,
     university_amounts: list[int] | None = None,
     disabled_special: int = 0,
+    rules: TaxRules | None = None,
 ) -> int:
     """교육비 세액공제 [p.177-186].
 
@@ -44,24 +50,28 @@ def calc_education_tax_credit(
         school_amounts: 초중고 학생별 교육비 리스트 (원, 1인당 300만원 한도)
         university_amounts: 대학생별 교육비 리스트 (원, 1인당 900만원 한도)
         disabled_special: 장애인 특수교육비 (원, 한도 없음)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
 
     Returns:
         세액공제 금액 (원)
     """
+    if rules is None:
+        rules = load_rules()
+
     preschool_total = (
-        _cap_per_person(preschool_amounts, EDUCATION_LIMIT_PRESCHOOL)
+        _cap_per_person(preschool_amounts, rules.EDUCATION_LIMIT_PRESCHOOL)
         if preschool_amounts
         else 0
     )
 
     school_total = (
-        _cap_per_person(school_amounts, EDUCATION_LIMIT_ELEMENTARY_MIDDLE_HIGH)
+        _cap_per_person(school_amounts, rules.EDUCATION_LIMIT_ELEMENTARY_MIDDLE_HIGH)
         if school_amounts
         else 0
     )
 
     university_total = (
-        _cap_per_person(university_amounts, EDUCATION_LIMIT_UNIVERSITY)
+        _cap_per_person(university_amounts, rules.EDUCATION_LIMIT_UNIVERSITY)
         if university_amounts
         else 0
     )
@@ -74,4 +84,65 @@ def calc_education_tax_credit(
         + disabled_special
     )
 
-    return int(total_eligible * EDUCATION_RATE)
+    return int(total_eligible * rules.EDUCATION_RATE)
+
+
+# =============================================================================
+# 배치 계산 (NumPy int64 배열 + CSR)
+# =============================================================================
+def _cap_per_person_batch(amounts, limit):
+    """행별로 각 개인에게 한도를 적용한 후 합산합니다 (_cap_per_person과 동일).
+
+    Args:
+        amounts: 행별 개인 교육비 (RaggedArray 또는 행별 리스트의 시퀀스)
+        limit: 1인당 한도 (원)
+
+    Returns:
+        행별 한도 적용 후 합산 금액 배열 (원, int64)
+    """
+    amounts = as_ragged(amounts)
+    return amounts.segment_sum(np.minimum(amounts.values, limit))
+
+
+def calc_education_tax_credit_batch(
+    self_education=0,
+    preschool_amounts=None,
+    school_amounts=None,
+    university_amounts=None,
+    disabled_special=0,
+    rules=None,
+):
+    """교육비 세액공제 배치 계산 [p.177-186].
+
+    calc_education_tax_credit()과 동일한 결과를 행별로 산출한다.
+    자녀별 교육비는 CSR 형식으로 전 직원을 한 번에 받아
+    1인당 한도 적용 후 행별 합계(segment reduction)를 구한다.
+
+    Args:
+        self_education: 본인 교육비 배열 (원, 한도 없음)
+        preschool_amounts: 취학전 아동별 교육비 (RaggedArray, 1인당 300만원 한도)
+        school_amounts: 초중고 학생별 교육비 (RaggedArray, 1인당 300만원 한도)
+        university_amounts: 대학생별 교육비 (RaggedArray, 1인당 900만원 한도)
+        disabled_special: 장애인 특수교육비 배열 (원, 한도 없음)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        세액공제 금액 배열 (원, int64)
+    """
+    if rules is None:
+        rules = load_rules()
+
+    total_eligible = (
+        np.asarray(self_education, dtype=np.int64)
+        + np.asarray(disabled_special, dtype=np.int64)
+    )
+
+    for amounts, limit in (
+        (preschool_amounts, rules.EDUCATION_LIMIT_PRESCHOOL),
+        (school_amounts, rules.EDUCATION_LIMIT_ELEMENTARY_MIDDLE_HIGH),
+        (university_amounts, rules.EDUCATION_LIMIT_UNIVERSITY),
+    ):
+        if amounts is not None:
+            total_eligible = total_eligible + _cap_per_person_batch(amounts, limit)
+
+    return np.atleast_1d(apply_rate(total_eligible, rules.EDUCATION_RATE, rules))
@@ -0,0 +1,107 @@
+"""
+정수 고정소수점(유리수) 계산 모드
+
+기본 모드는 공제율을 float로 곱한 뒤 int()로 절사합니다
+(e.g., int(total_salary * CARD_MINIMUM_USAGE_RATE)). 100/110 같은 순환소수
+공제율은 float로 정확히 표현되지 않아 결과가 부동소수점 반올림에 의존하고,
+배치 계산기는 중간에 float64 배열을 거쳐야 합니다.
+
+정확(exact) 모드에서는 데이터 파일의 모든 공제율을 분자/분모 유리수(Fraction)로 바꿉니다.
+  - 스칼라 계산기: 정수 x Fraction 곱과 int() 절사가 그대로 정확한 정수 연산이 됩니다.
+  - 배치 계산기: 모든 공제율의 분모 최소공배수 rate_scale(2025 귀속 5,500)을 공통 분모로,
+    공제율을 정수 분자(coefficient)로 바꾸어 int64 곱셈과 절사 나눗셈만 사용합니다.
+
+기본(float) 모드에서는 rate_scale = 1, coefficient = 공제율 그대로이므로
+배치 계산기가 같은 코드로 기존 결과를 그대로 재현합니다.
+
+Usage:
+    rules = load_rules(2025, exact=True)
+    calc_year_end_tax(total_salary=65_400_000, num_dependents=4, rules=rules)
+"""
+from fractions import Fraction
+from math import lcm
+
+try:
+    import numpy as np
+except ImportError:  # numpy는 배치 계산기(coefficient/truncate)에서만 필요
+    np = None
+
+# float 공제율 -> 유리수 변환 시 허용하는 최대 분모
+MAX_RATE_DENOMINATOR = 10_000
+
+
+def exact_rate(value: float) -> Fraction:
+    """float 공제율과 같은 값의 최소 분모 유리수 (e.g., 100/110 -> 10/11, 0.15 -> 3/20).
+
+    Raises:
+        ValueError: MAX_RATE_DENOMINATOR 이하 분모로 표현되지 않는 값
+    """
+    rate = Fraction(value).limit_denominator(MAX_RATE_DENOMINATOR)
+    if float(rate) != value:
+        raise ValueError(f"공제율 {value!r}를 유리수로 변환할 수 없습니다")
+    return rate
+
+
+def exact_constants(constants: dict) -> tuple[dict, int]:
+    """상수의 float 값(무한대 제외)을 Fraction으로 바꾼다 (구간표 등 중첩 포함).
+
+    Returns:
+        (변환된 상수 dict, 모든 공제율 분모의 최소공배수)
+    """
+    denominators = set()
+
+    def convert(value):
+        if isinstance(value, float) and value != float('inf'):
+            rate = exact_rate(value)
+            denominators.add(rate.denominator)
+            return rate
+        if isinstance(value, (list, tuple)):
+            return type(value)(convert(item) for item in value)
+        if isinstance(value, dict):
+            return {key: convert(item) for key, item in value.items()}
+        return value
+
+    converted = {name: convert(value) for name, value in constants.items()}
+    return converted, lcm(1, *denominators)
+
+
+def coefficient(rate, rules):
+    """배치 계산용 공제율 계수.
+
+    정확 모드는 rate x rules.rate_scale (정수 분자), 기본 모드는 rate 그대로.
+    계수를 곱한 값은 rules.rate_scale 단위이므로 truncate()로 원 단위로 되돌린다.
+
+    Raises:
+        ValueError: 정확 모드에서 rate_scale로 나누어떨어지지 않는 공제율
+    """
+    if not rules.exact:
+        return rate
+    scaled = Fraction(rate) * rules.rate_scale
+    if scaled.denominator != 1:
+        raise ValueError(f"공제율 {rate}는 rate_scale {rules.rate_scale}의 약분수가 아닙니다")
+    return scaled.numerator
+
+
+def truncate(values, rules):
+    """rate_scale 단위 값을 int()와 같이 0 방향으로 절사하여 원 단위 int64 배열로 변환한다."""
+    values = np.asarray(values)
+    if not rules.exact:
+        return values.astype(np.int64)
+    quotient = np.abs(values) // rules.rate_scale
+    return np.where(values < 0, -quotient, quotient).astype(np.int64)
+
+
+def apply_rate(amount, rate, rules, base=None):
+    """int(base + amount x rate)의 배치 버전 (rate는 coefficient() 적용 전 공제율, base 기본 0).
+
+    구간표 rows_batch()의 공제율 열처럼 이미 계수인 배열은 apply_coefficient()를 사용한다.
+    """
+    return apply_coefficient(amount, coefficient(rate, rules), rules, base)
+
+
+def apply_coefficient(amount, rate_coefficient, rules, base=None):
+    """int(base + amount x rate)의 배치 버전 (rate_coefficient는 계수 또는 계수 배열)."""
+    scaled = amount * rate_coefficient
+    if base is not None:
+        scaled = base * rules.rate_scale + scaled
+    return truncate(scaled, rules)
@@ -0,0 +1,174 @@
+"""
+목표 환급액 역산 (goal-seek)
+
+"IRP에 얼마를 더 넣어야 X원을 돌려받나?"에 답합니다. 직원별로 연금저축/퇴직연금(IRP),
+기부금 또는 신용카드 사용액을 얼마나 더 늘려야 환급액(refund_amount)이 목표 이하
+(음수 = 환급)가 되는지, 그 최소 추가 금액을 구합니다.
+
+추가 금액이 늘수록 공제가 늘어 refund_amount는 대체로 줄어들기만 합니다(단조 감소).
+예외로 종교단체 일반기부금은 0원에서 1원이 되는 순간 종교외 일반기부금 한도를
+30%에서 20%로 낮추므로(calc_donation_tax_credit() 5단계) refund_amount가 한 번 뛰어오를 수 있습니다.
+따라서 추가 금액 0원을 먼저 확인하고, 나머지 직원만 단조 구간 [1 unit, max_extra]에서
+전 직원 배열 이분 탐색을 동시에 수행합니다.
+반복마다 calc_year_end_tax_batch()를 한 번 호출하므로 전사 계산도 수십 번의 배치 호출로 끝납니다.
+
+Usage:
+    inputs = dict(total_salary=salaries, num_dependents=dependents, pension_savings=savings)
+    result = solve_extra_amount_batch(-500_000, "retirement_pension", inputs, unit=10_000)
+    result["extra"]  # 직원별 최소 추가 납입액 (-1 = 한도 내 도달 불가)
+"""
+import numpy as np
+
+from card_deduction import calc_card_deduction_batch
+from donation_deduction import calc_donation_tax_credit_batch
+from salary_cache import salary_profiles_batch
+from tax_rules import TaxRules, load_rules
+from total_calculator import calc_year_end_tax_batch
+
+LEVERS = ("pension_savings", "retirement_pension", "donation", "card")
+
+# 기부금/카드 추가 금액 탐색 상한 기본값 (원)
+DEFAULT_MAX_EXTRA = 100_000_000
+
+UNREACHABLE = -1
+
+
+def solve_extra_amount_batch(
+    target_refund,
+    lever: str,
+    inputs: dict,
+    max_extra=None,
+    unit: int = 1,
+    donations: dict | None = None,
+    donation_kind: str = "general_non_religious",
+    card_usage: dict | None = None,
+    card_category: str = "credit_card",
+    rules: TaxRules | None = None,
+) -> dict:
+    """목표 환급액에 도달하는 최소 추가 금액 (직원 배열 동시 이분 탐색).
+
+    Args:
+        target_refund: 목표 refund_amount 배열/스칼라 (음수 = 환급, e.g., -500_000)
+        lever: 늘릴 항목 (LEVERS)
+            - pension_savings / retirement_pension: inputs의 해당 납입액에 더함
+            - donation: donations[donation_kind]에 더해 기부금 세액공제를 다시 계산
+            - card: card_usage[card_category]에 더해 신용카드등 소득공제를 다시 계산
+        inputs: calc_year_end_tax_batch() 인자 dict (직원별 배열/스칼라)
+        max_extra: 추가 금액 탐색 상한 배열/스칼라
+                   (기본: 연금은 PENSION_TOTAL_LIMIT, 그 외 DEFAULT_MAX_EXTRA)
+        unit: 추가 금액 단위 (e.g., 10_000이면 만원 단위로 올림, max_extra 이하 배수만 탐색)
+        donations: lever="donation"일 때 calc_donation_tax_credit_batch() 인자
+                   (earned_income_amount 제외, 기존 기부금 금액)
+        donation_kind: 늘릴 기부금 종류 (donations 키)
+        card_usage: lever="card"일 때 calc_card_deduction_batch() 인자
+                    (total_salary 제외, 기존 사용액)
+        card_category: 늘릴 결제수단 (card_usage 키)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        dict:
+            extra: 최소 추가 금액 배열 (max_extra 이하 unit 배수, 도달 불가 행은 UNREACHABLE)
+            refund_amount: extra 적용 후 환급액
+                           (도달 불가 행은 max_extra 이하 최대 unit 배수 적용 결과)
+            feasible: 목표 도달 가능 여부 배열
+
+    Raises:
+        ValueError: 알 수 없는 lever, unit < 1
+    """
+    if rules is None:
+        rules = load_rules()
+    if lever not in LEVERS:
+        raise ValueError(f"lever는 {', '.join(LEVERS)} 중 하나여야 합니다: {lever}")
+    if unit < 1:
+        raise ValueError("unit은 1 이상이어야 합니다")
+
+    salary = np.atleast_1d(np.asarray(inputs["total_salary"], dtype=np.int64))
+    shape = salary.shape
+    refund_with = _refund_function(
+        lever, inputs, salary, donations, donation_kind, card_usage, card_category, rules,
+    )
+
+    if max_extra is None:
+        max_extra = rules.PENSION_TOTAL_LIMIT if lever in LEVERS[:2] else DEFAULT_MAX_EXTRA
+    target = np.broadcast_to(np.asarray(target_refund, dtype=np.int64), shape)
+    # 탐색 변수는 unit 개수 k (추가 금액 = k x unit <= max_extra)
+    limit = np.broadcast_to(np.asarray(max_extra, dtype=np.int64), shape)
+    top = limit // unit
+    # 0원은 따로 확인 (종교단체 기부금은 0 -> 1원에서 단조성이 깨짐)
+    at_zero = refund_with(np.zeros(shape, dtype=np.int64)) <= target
+    at_top = (top >= 1) & (refund_with(top * unit) <= target)
+    feasible = at_zero | at_top
+    high = np.where(at_zero | ~at_top, 0, top)
+    low = np.where(at_zero | ~at_top, 0, 1)
+    while np.any(low < high):
+        middle = (low + high) // 2
+        reached = refund_with(middle * unit) <= target
+        high = np.where(reached, middle, high)
+        low = np.where(reached, low, middle + 1)
+
+    extra = high * unit
+    refund_amount = refund_with(np.where(feasible, high, top) * unit)
+    return {
+        "extra": np.where(feasible, extra, UNREACHABLE),
+        "refund_amount": refund_amount,
+        "feasible": feasible,
+    }
+
+
+def solve_extra_amount(target_refund: int, lever: str, inputs: dict, **options) -> int | None:
+    """직원 1명의 최소 추가 금액 (도달 불가면 None).
+
+    Args:
+        target_refund: 목표 refund_amount (음수 = 환급)
+        lever: 늘릴 항목 (LEVERS)
+        inputs: calc_year_end_tax() 인자 dict
+        **options: solve_extra_amount_batch()의 나머지 인자
+    """
+    result = solve_extra_amount_batch(target_refund, lever, inputs, **options)
+    return int(result["extra"][0]) if result["feasible"][0] else None
+
+
+def _refund_function(
+    lever, inputs, salary, donations, donation_kind, card_usage, card_category, rules,
+):
+    """추가 금액 배열 -> refund_amount 배열 함수."""
+    inputs = dict(inputs)
+
+    if lever in ("pension_savings", "retirement_pension"):
+        base = np.asarray(inputs.pop(lever, 0), dtype=np.int64)
+
+        def refund_with(extra):
+            return calc_year_end_tax_batch(**inputs, **{lever: base + extra}, rules=rules)[
+                "refund_amount"
+            ]
+
+    elif lever == "donation":
+        donations = dict(donations or {})
+        base = np.asarray(donations.pop(donation_kind, 0), dtype=np.int64)
+        earned = salary_profiles_batch(salary, rules)["earned_income_amount"]
+        inputs.pop("donation_tax_credit", None)
+
+        def refund_with(extra):
+            credit = calc_donation_tax_credit_batch(
+                earned, **donations, **{donation_kind: base + extra}, rules=rules,
+            )
+            return calc_year_end_tax_batch(**inputs, donation_tax_credit=credit, rules=rules)[
+                "refund_amount"
+            ]
+
+    else:
+        card_usage = dict(card_usage or {})
+        card_usage.setdefault("credit_card", 0)
+        card_usage.setdefault("debit_cash", 0)
+        base = np.asarray(card_usage.pop(card_category, 0), dtype=np.int64)
+        inputs.pop("card_deduction", None)
+
+        def refund_with(extra):
+            deduction = calc_card_deduction_batch(
+                salary, **card_usage, **{card_category: base + extra}, rules=rules,
+            )
+            return calc_year_end_tax_batch(**inputs, card_deduction=deduction, rules=rules)[
+                "refund_amount"
+            ]
+
+    return refund_with
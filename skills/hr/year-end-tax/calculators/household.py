@@ -0,0 +1,343 @@
+"""
+맞벌이 부부 공제 배분 최적화
+
+부양가족, 의료비, 신용카드 사용액, 기부금은 부부 중 누가 공제받느냐에 따라 가구 합계 세액이 달라집니다.
+  - 기본공제/추가공제: 한계세율이 높은 배우자 쪽이 유리 [p.95]
+  - 의료비: 총급여액 3% 기준금액을 넘는 쪽에서만 공제 [p.172]
+  - 신용카드: 총급여액 25% 최저사용금액을 넘는 쪽에서만 공제 [p.131]
+  - 기부금/세액공제: 결정세액 0원 하한에 걸리면 효과 없음
+
+optimize_household()는 공유 항목을 각 배우자에게 배분하는 모든 경우를 분기 한정(branch-and-bound)으로 탐색하여
+부부 결정세액 합계가 최소인 배분을 찾습니다.
+  - 배우자 한 명의 정산 결과는 배분받은 항목 금액의 합계(상태 벡터)로만 정해지므로
+    (배우자, 상태) 키로 부분 정산 결과를 메모이제이션합니다.
+  - 아직 배분하지 않은 항목을 두 배우자 모두에게 준 세액 합계가 하한(lower bound)이 됩니다.
+    하한이 지금까지의 최선 이상인 분기는 잘라냅니다.
+  - 종교단체 일반기부금은 있기만 해도 종교외 일반기부금 한도를 30%에서 20%로 낮추므로
+    (calc_donation_tax_credit() 5단계) 항목이 늘어 세액이 오를 수 있습니다.
+    하한은 종교외 한도를 항상 30%로 본 완화 공제로 계산하여 항목이 늘면 줄기만 하고
+    실제 세액 이하가 되도록 합니다 (종교단체 기부금이 없으면 실제 세액과 같음).
+
+Usage:
+    first = Spouse(
+        TaxpayerInput(total_salary=80_000_000, num_dependents=1),
+        card_usage={"credit_card": 15_000_000},
+    )
+    second = Spouse(TaxpayerInput(total_salary=40_000_000, num_dependents=1))
+    items = [
+        SharedItem("dependent", child_over_8=True),
+        SharedItem("medical", "self_etc_medical", 2_000_000),
+    ]
+    plan = optimize_household(first, second, items)
+    plan.assignment, plan.determined_tax
+"""
+import dataclasses
+from dataclasses import dataclass, field
+
+from card_deduction import calc_card_deduction
+from donation_deduction import calc_donation_tax_credit
+from medical_deduction import calc_medical_tax_credit
+from records import SettlementResult, TaxpayerInput
+from salary_cache import salary_profile
+from tax_rules import TaxRules, load_rules
+from total_calculator import settle
+
+# 항목 종류별 금액 항목 (calc_*() 인자 이름, 인자 순서)
+CARD_CATEGORIES = ("credit_card", "debit_cash", "culture", "traditional", "transit")
+MEDICAL_CATEGORIES = (
+    "other_dependent_medical", "self_etc_medical", "infertility_medical", "premature_medical",
+)
+DONATION_CATEGORIES = (
+    "political", "hometown", "special", "esop", "general_non_religious", "general_religious",
+)
+ITEM_CATEGORIES = {
+    "dependent": (),
+    "card": CARD_CATEGORIES,
+    "medical": MEDICAL_CATEGORIES,
+    "donation": DONATION_CATEGORIES,
+}
+
+# 상태 벡터: (부양가족, 경로우대, 장애인, 8세 이상 자녀, 카드 5개, 의료비 4개, 기부금 6개)
+_PERSON_SLOTS = 4
+_OFFSETS = {
+    "card": _PERSON_SLOTS,
+    "medical": _PERSON_SLOTS + len(CARD_CATEGORIES),
+    "donation": _PERSON_SLOTS + len(CARD_CATEGORIES) + len(MEDICAL_CATEGORIES),
+}
+_STATE_SIZE = _OFFSETS["donation"] + len(DONATION_CATEGORIES)
+_RELIGIOUS = _OFFSETS["donation"] + DONATION_CATEGORIES.index("general_religious")
+
+# 배분 단위(그룹) 수 상한 (경우의 수 2^n)
+MAX_SHARED_UNITS = 24
+
+
+@dataclass(frozen=True, slots=True)
+class SharedItem:
+    """부부 중 한 명이 공제받을 항목.
+
+    Attributes:
+        kind: 'dependent' | 'card' | 'medical' | 'donation'
+        category: 금액 항목 (CARD_CATEGORIES 등, dependent는 빈 문자열)
+        amount: 금액 (원, dependent는 0)
+        elderly: 경로우대 대상 (dependent)
+        disabled: 장애인 (dependent)
+        child_over_8: 8세 이상 자녀 (dependent, 자녀세액공제)
+        group: 같은 배우자에게 함께 배분할 항목 묶음 이름 (e.g., 자녀와 그 자녀의 의료비)
+        label: 표시용 이름
+    """
+
+    kind: str
+    category: str = ""
+    amount: int = 0
+    elderly: bool = False
+    disabled: bool = False
+    child_over_8: bool = False
+    group: str = ""
+    label: str = ""
+
+    def __post_init__(self):
+        """
+        Raises:
+            ValueError: 알 수 없는 kind/category, 음수 금액
+        """
+        if self.kind not in ITEM_CATEGORIES:
+            raise ValueError(
+                f"항목 종류는 {', '.join(ITEM_CATEGORIES)} 중 하나여야 합니다: {self.kind}"
+            )
+        categories = ITEM_CATEGORIES[self.kind]
+        if categories and self.category not in categories:
+            raise ValueError(f"{self.kind} 항목은 {', '.join(categories)} 중 하나여야 합니다")
+        if self.amount < 0:
+            raise ValueError("금액은 0 이상이어야 합니다")
+
+
+@dataclass(frozen=True, slots=True)
+class Spouse:
+    """배우자 1명의 본인분 입력.
+
+    taxpayer의 card_deduction, medical_tax_credit, donation_tax_credit은 사용하지 않고
+    아래 본인분 금액 + 배분받은 항목 금액으로 다시 계산합니다.
+    num_dependents 등 인적공제 인원은 본인분(본인 포함)에 배분받은 부양가족을 더합니다.
+
+    Attributes:
+        taxpayer: 연말정산 입력 레코드 (본인분)
+        card_usage: 본인 카드 사용액 (CARD_CATEGORIES 키)
+        medical: 본인분 의료비 (MEDICAL_CATEGORIES 키)
+        donations: 본인 기부금 (DONATION_CATEGORIES 키)
+    """
+
+    taxpayer: TaxpayerInput
+    card_usage: dict = field(default_factory=dict)
+    medical: dict = field(default_factory=dict)
+    donations: dict = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class HouseholdPlan:
+    """최적 배분 결과.
+
+    Attributes:
+        assignment: 입력 항목 순서대로 공제받을 배우자 (0 = first, 1 = second)
+        taxpayers: 배분 반영 후 두 배우자의 입력 레코드
+        results: 두 배우자의 연말정산 결과
+        settlements: 실제로 계산한 부분 정산 수 (메모이제이션 적중 제외)
+    """
+
+    assignment: tuple[int, ...]
+    taxpayers: tuple[TaxpayerInput, TaxpayerInput]
+    results: tuple[SettlementResult, SettlementResult]
+    settlements: int
+
+    @property
+    def determined_tax(self) -> int:
+        """부부 결정세액 합계."""
+        return self.results[0].determined_tax + self.results[1].determined_tax
+
+
+def optimize_household(
+    first: Spouse,
+    second: Spouse,
+    items,
+    rules: TaxRules | None = None,
+) -> HouseholdPlan:
+    """부부 결정세액 합계가 최소인 공유 항목 배분 (분기 한정 탐색).
+
+    Args:
+        first: 배우자 1
+        second: 배우자 2
+        items: SharedItem 목록 (같은 group은 함께 배분)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        HouseholdPlan (합계가 같은 배분이 여럿이면 first에 먼저 배분한 쪽)
+
+    Raises:
+        ValueError: 배분 단위가 MAX_SHARED_UNITS를 넘는 경우
+    """
+    if rules is None:
+        rules = load_rules()
+    items = tuple(items)
+    spouses = (first, second)
+
+    units = _group_units(items)
+    if len(units) > MAX_SHARED_UNITS:
+        raise ValueError(f"배분 단위는 {MAX_SHARED_UNITS}개 이하여야 합니다: {len(units)}")
+    vectors = [_sum_states(_item_state(items[index]) for index in unit) for unit in units]
+    # 큰 항목부터 배분해야 하한이 빨리 좁혀져 가지치기가 잘 된다
+    order = sorted(range(len(units)), key=lambda unit: -_unit_weight(vectors[unit]))
+    suffix = [_empty_state()] * (len(order) + 1)
+    for position in range(len(order) - 1, -1, -1):
+        suffix[position] = _sum_states((vectors[order[position]], suffix[position + 1]))
+
+    memo = {}
+
+    def settled(spouse: int, state: tuple, relaxed: bool = False) -> SettlementResult:
+        # 종교단체 기부금이 없으면 완화 공제 = 실제 공제
+        relaxed = relaxed and _religious_amount(spouses[spouse], state) > 0
+        key = (spouse, state, relaxed)
+        if key not in memo:
+            memo[key] = _settle_spouse(spouses[spouse], state, rules, relaxed)[1]
+        return memo[key]
+
+    def bound(position: int, states: tuple) -> int:
+        rest = suffix[position]
+        return sum(
+            settled(spouse, _sum_states((states[spouse], rest)), relaxed=True).determined_tax
+            for spouse in (0, 1)
+        )
+
+    best = [float('inf'), None]  # 결정세액 합계, 단위별 배우자
+
+    def search(position: int, states: tuple, choice: list) -> None:
+        if position == len(order):
+            total = sum(settled(spouse, states[spouse]).determined_tax for spouse in (0, 1))
+            if total < best[0]:
+                best[0], best[1] = total, list(choice)
+            return
+        vector = vectors[order[position]]
+        children = []
+        for spouse in (0, 1):
+            child = list(states)
+            child[spouse] = _sum_states((states[spouse], vector))
+            child = tuple(child)
+            children.append((bound(position + 1, child), spouse, child))
+        for lower, spouse, child in sorted(children):
+            if lower >= best[0]:
+                continue
+            choice.append(spouse)
+            search(position + 1, child, choice)
+            choice.pop()
+
+    search(0, (_empty_state(), _empty_state()), [])
+
+    unit_spouse = dict(zip(order, best[1]))
+    assignment = [0] * len(items)
+    states = [_empty_state(), _empty_state()]
+    for unit, indexes in enumerate(units):
+        spouse = unit_spouse[unit]
+        states[spouse] = _sum_states((states[spouse], vectors[unit]))
+        for index in indexes:
+            assignment[index] = spouse
+    settled_pair = [_settle_spouse(spouses[spouse], states[spouse], rules) for spouse in (0, 1)]
+    return HouseholdPlan(
+        assignment=tuple(assignment),
+        taxpayers=(settled_pair[0][0], settled_pair[1][0]),
+        results=(settled_pair[0][1], settled_pair[1][1]),
+        settlements=len(memo),
+    )
+
+
+def _group_units(items) -> list[list[int]]:
+    """항목 인덱스를 배분 단위로 묶는다 (group이 빈 문자열이면 단독)."""
+    units, groups = [], {}
+    for index, item in enumerate(items):
+        if not item.group:
+            units.append([index])
+        elif item.group in groups:
+            groups[item.group].append(index)
+        else:
+            groups[item.group] = [index]
+            units.append(groups[item.group])
+    return units
+
+
+def _empty_state() -> tuple:
+    return (0,) * _STATE_SIZE
+
+
+def _item_state(item: SharedItem) -> tuple:
+    """항목 1개의 상태 벡터."""
+    state = [0] * _STATE_SIZE
+    if item.kind == "dependent":
+        state[:_PERSON_SLOTS] = (1, int(item.elderly), int(item.disabled), int(item.child_over_8))
+    else:
+        state[_OFFSETS[item.kind] + ITEM_CATEGORIES[item.kind].index(item.category)] = item.amount
+    return tuple(state)
+
+
+def _sum_states(states) -> tuple:
+    return tuple(map(sum, zip(*states)))
+
+
+def _unit_weight(state: tuple) -> int:
+    """탐색 순서용 크기 (부양가족 1명 = 기본공제액 수준의 금액으로 간주)."""
+    return sum(state[:_PERSON_SLOTS]) * 10_000_000 + sum(state[_PERSON_SLOTS:])
+
+
+def _religious_amount(spouse: Spouse, state: tuple) -> int:
+    """배우자 1명의 종교단체 일반기부금 합계 (본인분 + 배분분)."""
+    return spouse.donations.get("general_religious", 0) + state[_RELIGIOUS]
+
+
+def _relaxed_donation_credit(earned_income_amount: int, *amounts, rules) -> int:
+    """종교외 일반기부금 한도를 종교단체 기부금과 무관하게 30%로 본 기부금 세액공제.
+
+    실제 공제(calc_donation_tax_credit) 이상이고 기부금이 늘면 줄지 않으므로
+    분기 한정 하한 계산에 사용합니다.
+    """
+    *others, non_religious, religious = amounts
+    without_religious = calc_donation_tax_credit(
+        earned_income_amount, *others, non_religious, 0, rules,
+    )
+    # 종교 기부금 공제분 (종교외 0원이면 5단계 한도와 무관)
+    religious_credit = calc_donation_tax_credit(
+        earned_income_amount, *others, 0, religious, rules,
+    ) - calc_donation_tax_credit(earned_income_amount, *others, 0, 0, rules)
+    return without_religious + religious_credit
+
+
+def _settle_spouse(
+    spouse: Spouse, state: tuple, rules, relaxed: bool = False,
+) -> tuple[TaxpayerInput, SettlementResult]:
+    """배분 상태를 반영한 배우자 1명의 입력 레코드와 정산 결과.
+
+    relaxed이면 기부금 세액공제를 _relaxed_donation_credit()으로 계산한다 (하한용).
+    """
+    taxpayer = spouse.taxpayer
+    salary = taxpayer.total_salary
+
+    def amounts(kind, own):
+        offset = _OFFSETS[kind]
+        return [
+            own.get(category, 0) + state[offset + position]
+            for position, category in enumerate(ITEM_CATEGORIES[kind])
+        ]
+
+    dependents, elderly, disabled, children = state[:_PERSON_SLOTS]
+    taxpayer = dataclasses.replace(
+        taxpayer,
+        num_dependents=taxpayer.num_dependents + dependents,
+        elderly_count=taxpayer.elderly_count + elderly,
+        disabled_count=taxpayer.disabled_count + disabled,
+        children_over_8=taxpayer.children_over_8 + children,
+        card_deduction=calc_card_deduction(salary, *amounts("card", spouse.card_usage), rules),
+        medical_tax_credit=calc_medical_tax_credit(
+            salary, *amounts("medical", spouse.medical), rules,
+        ),
+        donation_tax_credit=(_relaxed_donation_credit if relaxed else calc_donation_tax_credit)(
+            salary_profile(salary, rules).earned_income_amount,
+            *amounts("donation", spouse.donations),
+            rules=rules,
+        ),
+    )
+    return taxpayer, settle(taxpayer, rules)
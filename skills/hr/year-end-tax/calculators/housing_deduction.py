@@ -4,17 +4,8 @@
 주택임차차입금, 주택마련저축, 장기주택저당차입금 소득공제 및
 월세액 세액공제를 계산합니다.
 """
-from constants import (
-    HOUSING_RENT_LOAN_RATE,
-    HOUSING_RENT_LOAN_SAVINGS_LIMIT,
-    HOUSING_SAVINGS_RATE,
-    HOUSING_SAVINGS_ANNUAL_LIMIT,
-    RENT_CREDIT_SALARY_LIMIT,
-    RENT_CREDIT_ANNUAL_LIMIT,
-    RENT_CREDIT_RATE_LOW,
-    RENT_CREDIT_RATE_HIGH,
-    RENT_CREDIT_SALARY_THRESHOLD,
-)
+from salary_cache import salary_profile
+from tax_rules import TaxRules, load_rules
 
 
 def calc_housing_loan_deduction(
@@ -22,6 +13,7 @@ def calc_housing_loan_deduction(
     mortgage_interest: int = 0,
     housing_savings: int = 0,
     mortgage_limit: int = 20_000_000,
+    rules: TaxRules | None = None,
 ) -> int:
     """주택자금 소득공제 [p.107-119].
 
@@ -33,21 +25,25 @@ def calc_housing_loan_deduction(
         mortgage_interest: 장기주택저당차입금 이자상환액 (원)
         housing_savings: 주택마련저축 납입액 (원)
         mortgage_limit: 장기주택저당차입금 한도 (원, 상환기간/방식에 따라 다름)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
 
     Returns:
         소득공제 금액 (원)
     """
+    if rules is None:
+        rules = load_rules()
+
     # 주택임차차입금: 원리금상환액 x 40%
-    rent_loan_deduction = int(rent_loan_repayment * HOUSING_RENT_LOAN_RATE)
+    rent_loan_deduction = int(rent_loan_repayment * rules.HOUSING_RENT_LOAN_RATE)
 
     # 주택마련저축: 납입액(300만원 한도) x 40%
-    savings_capped = min(housing_savings, HOUSING_SAVINGS_ANNUAL_LIMIT)
-    savings_deduction = int(savings_capped * HOUSING_SAVINGS_RATE)
+    savings_capped = min(housing_savings, rules.HOUSING_SAVINGS_ANNUAL_LIMIT)
+    savings_deduction = int(savings_capped * rules.HOUSING_SAVINGS_RATE)
 
     # 주택임차 + 주택마련저축 합산 400만원 한도
     rent_savings_combined = min(
         rent_loan_deduction + savings_deduction,
-        HOUSING_RENT_LOAN_SAVINGS_LIMIT,
+        rules.HOUSING_RENT_LOAN_SAVINGS_LIMIT,
     )
 
     # 장기주택저당차입금: 이자상환액 (한도 적용)
@@ -56,7 +52,11 @@ def calc_housing_loan_deduction(
     return rent_savings_combined + mortgage_deduction
 
 
-def calc_rent_tax_credit(total_salary: int, annual_rent: int) -> int:
+def calc_rent_tax_credit(
+    total_salary: int,
+    annual_rent: int,
+    rules: TaxRules | None = None,
+) -> int:
     """월세액 세액공제 [p.202-204].
 
     총급여 8천만원 이하인 경우에만 적용됩니다.
@@ -65,19 +65,30 @@ def calc_rent_tax_credit(total_salary: int, annual_rent: int) -> int:
     Args:
         total_salary: 총급여액 (원)
         annual_rent: 연간 월세 합계 (원)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
 
     Returns:
         세액공제 금액 (원)
     """
-    if total_salary > RENT_CREDIT_SALARY_LIMIT:
-        return 0
+    if rules is None:
+        rules = load_rules()
 
-    rent_capped = min(annual_rent, RENT_CREDIT_ANNUAL_LIMIT)
+    rate = salary_profile(total_salary, rules).rent_rate
+    if rate == 0:
+        return 0
 
-    rate = (
-        RENT_CREDIT_RATE_LOW
-        if total_salary <= RENT_CREDIT_SALARY_THRESHOLD
-        else RENT_CREDIT_RATE_HIGH
-    )
+    rent_capped = min(annual_rent, rules.RENT_CREDIT_ANNUAL_LIMIT)
 
     return int(rent_capped * rate)
+
+
+def _rent_credit_rate(total_salary: int, rules: TaxRules) -> float:
+    """월세액 세액공제율 [p.202].
+
+    총급여 5,500만원 이하 17%, 8천만원 이하 15%, 8천만원 초과는 공제 대상 아님(0).
+    """
+    if total_salary > rules.RENT_CREDIT_SALARY_LIMIT:
+        return 0.0
+    if total_salary <= rules.RENT_CREDIT_SALARY_THRESHOLD:
+        return rules.RENT_CREDIT_RATE_LOW
+    return rules.RENT_CREDIT_RATE_HIGH
@@ -8,22 +8,23 @@ References:
   - 근로소득공제: 소법 제47조 [p.94]
   - 산출세액: 소법 제55조 [p.83]
   - 근로소득세액공제: 소법 제59조 [p.162-163]
+
+*_batch 함수는 동일한 계산을 NumPy int64 배열 단위로 수행합니다
+(공제율 곱/절사는 fixed_point를 거치므로 정확 모드에서도 int64만 사용).
+총급여액만으로 정해지는 공제액/한도는 salary_cache를 거쳐 재사용합니다.
 """
 
-from constants import (
-    EARNED_INCOME_DEDUCTION_BRACKETS,
-    EARNED_INCOME_DEDUCTION_CAP,
-    INCOME_TAX_BRACKETS,
-    EARNED_INCOME_TAX_CREDIT_THRESHOLD,
-    EARNED_INCOME_TAX_CREDIT_RATE_LOW,
-    EARNED_INCOME_TAX_CREDIT_BASE,
-    EARNED_INCOME_TAX_CREDIT_RATE_HIGH,
-    EARNED_INCOME_TAX_CREDIT_LIMITS,
-    EARNED_INCOME_TAX_CREDIT_MIN_LIMIT,
-)
+try:
+    import numpy as np
+except ImportError:  # numpy는 *_batch 함수에서만 필요
+    np = None
+
+from fixed_point import apply_coefficient, apply_rate
+from salary_cache import salary_profile
+from tax_rules import TaxRules, load_rules
 
 
-def calc_earned_income_deduction(total_salary: int) -> int:
+def calc_earned_income_deduction(total_salary: int, rules: TaxRules | None = None) -> int:
     """근로소득공제 계산 [p.94]
 
     총급여액에 구간별 공제율을 적용하여 근로소득공제액을 산출한다.
@@ -31,33 +32,35 @@ def calc_earned_income_deduction(total_salary: int) -> int:
 
     Args:
         total_salary: 총급여액 (원)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
 
     Returns:
         근로소득공제액 (원)
     """
+    return salary_profile(total_salary, rules).earned_income_deduction
+
+
+def _calc_earned_income_deduction(total_salary: int, rules: TaxRules) -> int:
+    """근로소득공제 계산 본체 (salary_cache 실패 시 호출)."""
     if total_salary <= 0:
         return 0
 
-    prev_upper = 0
-    for upper, base_deduction, rate in EARNED_INCOME_DEDUCTION_BRACKETS:
-        if total_salary <= upper:
-            deduction = base_deduction + int((total_salary - prev_upper) * rate)
-            return min(deduction, EARNED_INCOME_DEDUCTION_CAP)
-        prev_upper = upper
+    lower, base_deduction, rate = rules.earned_income_deduction_table.row(total_salary)
+    deduction = base_deduction + int((total_salary - lower) * rate)
+    return min(deduction, rules.EARNED_INCOME_DEDUCTION_CAP)
 
-    return EARNED_INCOME_DEDUCTION_CAP
 
-
-def calc_earned_income_amount(total_salary: int) -> int:
+def calc_earned_income_amount(total_salary: int, rules: TaxRules | None = None) -> int:
     """근로소득금액 = 총급여액 - 근로소득공제 [p.94]
 
     Args:
         total_salary: 총급여액 (원)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
 
     Returns:
         근로소득금액 (원)
     """
-    return total_salary - calc_earned_income_deduction(total_salary)
+    return salary_profile(total_salary, rules).earned_income_amount
 
 
 def calc_taxable_income(earned_income_amount: int, total_deductions: int) -> int:
@@ -75,28 +78,33 @@ def calc_taxable_income(earned_income_amount: int, total_deductions: int) -> int
     return max(0, earned_income_amount - total_deductions)
 
 
-def calc_calculated_tax(taxable_income: int) -> int:
+def calc_calculated_tax(taxable_income: int, rules: TaxRules | None = None) -> int:
     """산출세액: 과세표준에 기본세율 적용 [p.83]
 
     세액 = 과세표준 x 세율 - 누진공제액
 
     Args:
         taxable_income: 과세표준 (원)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
 
     Returns:
         산출세액 (원)
     """
+    if rules is None:
+        rules = load_rules()
+
     if taxable_income <= 0:
         return 0
 
-    for upper, progressive_deduction, rate in INCOME_TAX_BRACKETS:
-        if taxable_income <= upper:
-            return int(taxable_income * rate - progressive_deduction)
-
-    return 0
+    _, progressive_deduction, rate = rules.income_tax_table.row(taxable_income)
+    return int(taxable_income * rate - progressive_deduction)
 
 
-def calc_earned_income_tax_credit(calculated_tax: int, total_salary: int) -> int:
+def calc_earned_income_tax_credit(
+    calculated_tax: int,
+    total_salary: int,
+    rules: TaxRules | None = None,
+) -> int:
     """근로소득세액공제 [p.162-163]
 
     Step 1: 산출세액 기준 공제액 산출
@@ -108,40 +116,176 @@ def calc_earned_income_tax_credit(calculated_tax: int, total_salary: int) -> int
     Args:
         calculated_tax: 산출세액 (원)
         total_salary: 총급여액 (원)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
 
     Returns:
         근로소득세액공제액 (원)
     """
+    if rules is None:
+        rules = load_rules()
+
     if calculated_tax <= 0:
         return 0
 
     # Step 1: base credit
-    if calculated_tax <= EARNED_INCOME_TAX_CREDIT_THRESHOLD:
-        credit = int(calculated_tax * EARNED_INCOME_TAX_CREDIT_RATE_LOW)
+    if calculated_tax <= rules.EARNED_INCOME_TAX_CREDIT_THRESHOLD:
+        credit = int(calculated_tax * rules.EARNED_INCOME_TAX_CREDIT_RATE_LOW)
     else:
-        excess = calculated_tax - EARNED_INCOME_TAX_CREDIT_THRESHOLD
-        credit = EARNED_INCOME_TAX_CREDIT_BASE + int(excess * EARNED_INCOME_TAX_CREDIT_RATE_HIGH)
+        excess = calculated_tax - rules.EARNED_INCOME_TAX_CREDIT_THRESHOLD
+        credit = rules.EARNED_INCOME_TAX_CREDIT_BASE + int(
+            excess * rules.EARNED_INCOME_TAX_CREDIT_RATE_HIGH
+        )
 
     # Step 2: apply salary-based limit
-    limit = _calc_credit_limit(total_salary)
+    limit = salary_profile(total_salary, rules).earned_income_tax_credit_limit
 
     return min(credit, limit)
 
 
-def _calc_credit_limit(total_salary: int) -> int:
+def _calc_credit_limit(total_salary: int, rules: TaxRules) -> int:
     """총급여액 구간별 근로소득세액공제 한도 계산 [p.162]
 
     Args:
         total_salary: 총급여액 (원)
+        rules: 과세연도 세법 규칙
 
     Returns:
         세액공제 한도액 (원)
     """
-    prev_upper = 0
-    for upper, base_limit, decrease_rate, min_limit in EARNED_INCOME_TAX_CREDIT_LIMITS:
-        if total_salary <= upper:
-            decreased = int(base_limit - (total_salary - prev_upper) * decrease_rate)
-            return max(decreased, min_limit)
-        prev_upper = upper
-
-    return EARNED_INCOME_TAX_CREDIT_MIN_LIMIT
+    lower, base_limit, decrease_rate, min_limit = (
+        rules.earned_income_tax_credit_limit_table.row(total_salary)
+    )
+    decreased = int(base_limit - (total_salary - lower) * decrease_rate)
+    return max(decreased, min_limit)
+
+
+# =============================================================================
+# 배치 계산 (NumPy int64 배열)
+# =============================================================================
+def calc_earned_income_deduction_batch(total_salary, rules=None):
+    """근로소득공제 배치 계산 [p.94]
+
+    calc_earned_income_deduction()과 동일한 결과를 배열 단위로 산출한다.
+
+    Args:
+        total_salary: 총급여액 배열 (원)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        근로소득공제액 배열 (원, int64)
+    """
+    if rules is None:
+        rules = load_rules()
+
+    salary = np.asarray(total_salary, dtype=np.int64)
+
+    lower, base_deduction, rate = rules.earned_income_deduction_table.rows_batch(salary)
+    deduction = base_deduction + apply_coefficient(salary - lower, rate, rules)
+
+    return np.where(salary <= 0, 0, np.minimum(deduction, rules.EARNED_INCOME_DEDUCTION_CAP))
+
+
+def calc_calculated_tax_batch(taxable_income, rules=None):
+    """산출세액 배치 계산 [p.83]
+
+    Args:
+        taxable_income: 과세표준 배열 (원)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        산출세액 배열 (원, int64)
+    """
+    if rules is None:
+        rules = load_rules()
+
+    income = np.asarray(taxable_income, dtype=np.int64)
+
+    _, progressive_deduction, rate = rules.income_tax_table.rows_batch(income)
+    tax = apply_coefficient(income, rate, rules, base=-progressive_deduction)
+
+    return np.where(income <= 0, 0, tax)
+
+
+def calc_earned_income_tax_credit_batch(
+    calculated_tax, total_salary, rules=None, credit_limit=None,
+):
+    """근로소득세액공제 배치 계산 [p.162-163]
+
+    Args:
+        calculated_tax: 산출세액 배열 (원)
+        total_salary: 총급여액 배열 (원)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+        credit_limit: 총급여액별 한도 배열 (기본: total_salary로 계산,
+                      salary_cache.salary_profiles_batch() 결과 재사용 시 지정)
+
+    Returns:
+        근로소득세액공제액 배열 (원, int64)
+    """
+    if rules is None:
+        rules = load_rules()
+
+    tax = np.asarray(calculated_tax, dtype=np.int64)
+
+    low_credit = apply_rate(tax, rules.EARNED_INCOME_TAX_CREDIT_RATE_LOW, rules)
+    high_credit = rules.EARNED_INCOME_TAX_CREDIT_BASE + apply_rate(
+        tax - rules.EARNED_INCOME_TAX_CREDIT_THRESHOLD,
+        rules.EARNED_INCOME_TAX_CREDIT_RATE_HIGH,
+        rules,
+    )
+    credit = np.where(tax <= rules.EARNED_INCOME_TAX_CREDIT_THRESHOLD, low_credit, high_credit)
+
+    limit = _calc_credit_limit_batch(total_salary, rules) if credit_limit is None else credit_limit
+
+    return np.where(tax <= 0, 0, np.minimum(credit, limit))
+
+
+def calc_marginal_tax_rate_batch(
+    taxable_income, calculated_tax, total_salary, earned_income_tax_credit, rules=None,
+):
+    """과세표준 1원 감소 시 결정세액 감소액 배치 계산 [p.83, p.162]
+
+    기본세율 x (1 - 근로소득세액공제 기울기). 근로소득세액공제 기울기는 산출세액
+    130만원 이하 55%, 초과 30%이며 한도에 걸려 있으면 0입니다.
+    결정세액 0원 하한과 소득공제 종합한도는 호출하는 쪽에서 반영합니다.
+
+    Args:
+        taxable_income: 과세표준 배열 (원)
+        calculated_tax: 산출세액 배열 (원)
+        total_salary: 총급여액 배열 (원)
+        earned_income_tax_credit: 근로소득세액공제액 배열 (원, 한도 적용 후)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        한계세율 배열 (float64, 과세표준 0원은 0)
+    """
+    if rules is None:
+        rules = load_rules()
+
+    taxable = np.asarray(taxable_income, dtype=np.int64)
+    calculated = np.asarray(calculated_tax, dtype=np.int64)
+
+    _, _, bracket_rate = rules.income_tax_table.rows_batch(taxable)
+    bracket_rate = bracket_rate / rules.rate_scale
+
+    uncapped = calc_earned_income_tax_credit_batch(
+        calculated, total_salary, rules, credit_limit=np.iinfo(np.int64).max,
+    )
+    credit_slope = np.where(
+        calculated <= rules.EARNED_INCOME_TAX_CREDIT_THRESHOLD,
+        float(rules.EARNED_INCOME_TAX_CREDIT_RATE_LOW),
+        float(rules.EARNED_INCOME_TAX_CREDIT_RATE_HIGH),
+    )
+    credit_slope = np.where(uncapped > earned_income_tax_credit, 0.0, credit_slope)
+    return np.where(taxable > 0, bracket_rate * (1 - credit_slope), 0.0)
+
+
+def _calc_credit_limit_batch(total_salary, rules):
+    """총급여액 구간별 근로소득세액공제 한도 배치 계산 [p.162]"""
+    salary = np.asarray(total_salary, dtype=np.int64)
+
+    lower, base_limit, decrease_rate, min_limit = (
+        rules.earned_income_tax_credit_limit_table.rows_batch(salary)
+    )
+    decreased = apply_coefficient(salary - lower, -decrease_rate, rules, base=base_limit)
+
+    return np.maximum(decreased, min_limit)
@@ -4,12 +4,7 @@
 소득공제: 국민건강보험료, 노인장기요양보험료, 고용보험료 (전액 공제)
 세액공제: 보장성보험료 (12%), 장애인전용보장성보험료 (15%)
 """
-from constants import (
-    INSURANCE_DEDUCTION_LIMIT,
-    INSURANCE_DEDUCTION_RATE,
-    INSURANCE_DISABLED_DEDUCTION_LIMIT,
-    INSURANCE_DISABLED_DEDUCTION_RATE,
-)
+from tax_rules import TaxRules, load_rules
 
 
 def calc_insurance_income_deduction(
@@ -33,6 +28,7 @@ def calc_insurance_income_deduction(
 def calc_insurance_tax_credit(
     protection_premium: int,
     disabled_protection_premium: int = 0,
+    rules: TaxRules | None = None,
 ) -> int:
     """보장성보험료 세액공제 [p.170].
 
@@ -41,14 +37,18 @@ def calc_insurance_tax_credit(
     Args:
         protection_premium: 보장성보험료 납입액 (원)
         disabled_protection_premium: 장애인전용 보장성보험료 납입액 (원, 기본값 0)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
 
     Returns:
         세액공제 금액 (원)
     """
-    protection_eligible = min(protection_premium, INSURANCE_DEDUCTION_LIMIT)
-    disabled_eligible = min(disabled_protection_premium, INSURANCE_DISABLED_DEDUCTION_LIMIT)
+    if rules is None:
+        rules = load_rules()
 
-    protection_credit = int(protection_eligible * INSURANCE_DEDUCTION_RATE)
-    disabled_credit = int(disabled_eligible * INSURANCE_DISABLED_DEDUCTION_RATE)
+    protection_eligible = min(protection_premium, rules.INSURANCE_DEDUCTION_LIMIT)
+    disabled_eligible = min(disabled_protection_premium, rules.INSURANCE_DISABLED_DEDUCTION_LIMIT)
+
+    protection_credit = int(protection_eligible * rules.INSURANCE_DEDUCTION_RATE)
+    disabled_credit = int(disabled_eligible * rules.INSURANCE_DISABLED_DEDUCTION_RATE)
 
     return protection_credit + disabled_credit
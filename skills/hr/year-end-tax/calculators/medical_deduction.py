@@ -4,14 +4,17 @@
 총급여액의 3% 초과분에 대해 세액공제.
 기준금액(threshold)은 낮은 우선순위 카테고리부터 차감:
   그 외 부양가족 -> 본인등 -> 미숙아 -> 난임시술비
+
+calc_medical_tax_credit_batch()는 동일한 계산을 직원 N명의 열 단위로 수행합니다.
 """
-from constants import (
-    MEDICAL_OTHER_DEPENDENT_LIMIT,
-    MEDICAL_RATE_GENERAL,
-    MEDICAL_RATE_INFERTILITY,
-    MEDICAL_RATE_PREMATURE,
-    MEDICAL_THRESHOLD_RATE,
-)
+try:
+    import numpy as np
+except ImportError:  # numpy는 *_batch 함수에서만 필요
+    np = None
+
+from fixed_point import apply_rate
+from salary_cache import salary_profile
+from tax_rules import TaxRules, load_rules
 
 
 def calc_medical_tax_credit(
@@ -20,6 +23,7 @@ def calc_medical_tax_credit(
     self_etc_medical: int,
     infertility_medical: int = 0,
     premature_medical: int = 0,
+    rules: TaxRules | None = None,
 ) -> int:
     """의료비 세액공제 [p.172-177].
 
@@ -35,20 +39,22 @@ def calc_medical_tax_credit(
         self_etc_medical: 본인/장애인/65세이상/6세이하 의료비 (원)
         infertility_medical: 난임시술비 (원, 기본값 0)
         premature_medical: 미숙아/선천성이상아 의료비 (원, 기본값 0)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
 
     Returns:
         세액공제 금액 (원)
     """
-    threshold = int(total_salary * MEDICAL_THRESHOLD_RATE)
+    if rules is None:
+        rules = load_rules()
 
-    remaining_threshold = threshold
+    remaining_threshold = salary_profile(total_salary, rules).medical_threshold
 
     # 1. 그 외 부양가족에서 threshold 차감
     other_after_threshold = max(0, other_dependent_medical - remaining_threshold)
     remaining_threshold = max(0, remaining_threshold - other_dependent_medical)
 
     # 700만원 한도 적용
-    other_eligible = min(other_after_threshold, MEDICAL_OTHER_DEPENDENT_LIMIT)
+    other_eligible = min(other_after_threshold, rules.MEDICAL_OTHER_DEPENDENT_LIMIT)
 
     # 2. 본인등에서 remaining threshold 차감
     self_after_threshold = max(0, self_etc_medical - remaining_threshold)
@@ -68,8 +74,70 @@ def calc_medical_tax_credit(
     infertility_eligible = infertility_after_threshold
 
     # 세액공제 계산
-    general_credit = int((other_eligible + self_eligible) * MEDICAL_RATE_GENERAL)
-    premature_credit = int(premature_eligible * MEDICAL_RATE_PREMATURE)
-    infertility_credit = int(infertility_eligible * MEDICAL_RATE_INFERTILITY)
+    general_credit = int((other_eligible + self_eligible) * rules.MEDICAL_RATE_GENERAL)
+    premature_credit = int(premature_eligible * rules.MEDICAL_RATE_PREMATURE)
+    infertility_credit = int(infertility_eligible * rules.MEDICAL_RATE_INFERTILITY)
+
+    return general_credit + premature_credit + infertility_credit
+
+
+def _calc_threshold(total_salary: int, rules: TaxRules) -> int:
+    """의료비 기준금액 = 총급여액 x 3% [p.172]."""
+    return int(total_salary * rules.MEDICAL_THRESHOLD_RATE)
+
+
+# =============================================================================
+# 배치 계산 (NumPy int64 배열)
+# =============================================================================
+def calc_medical_tax_credit_batch(
+    total_salary,
+    other_dependent_medical,
+    self_etc_medical,
+    infertility_medical=0,
+    premature_medical=0,
+    rules=None,
+):
+    """의료비 세액공제 배치 계산 [p.172-177].
+
+    calc_medical_tax_credit()과 동일한 결과를 직원 N명에 대해 한 번에 산출한다.
+    카테고리 i에 남은 threshold = max(0, threshold - 앞선 카테고리 누적 의료비)
+    이므로 순차 차감을 누적합으로 계산한다.
+
+    Args:
+        total_salary: 총급여액 배열 (원)
+        other_dependent_medical: 그 외 부양가족 의료비 배열 (원)
+        self_etc_medical: 본인/장애인/65세이상/6세이하 의료비 배열 (원)
+        infertility_medical: 난임시술비 배열 (원)
+        premature_medical: 미숙아/선천성이상아 의료비 배열 (원)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        세액공제 금액 배열 (원, int64)
+    """
+    if rules is None:
+        rules = load_rules()
+
+    salary = np.atleast_1d(np.asarray(total_salary, dtype=np.int64))
+    threshold = apply_rate(salary, rules.MEDICAL_THRESHOLD_RATE, rules)
+
+    # 차감 순서: 그 외 부양가족 -> 본인등 -> 미숙아 -> 난임
+    amounts = np.stack([
+        np.broadcast_to(np.asarray(amount, dtype=np.int64), salary.shape)
+        for amount in (
+            other_dependent_medical, self_etc_medical, premature_medical, infertility_medical,
+        )
+    ])
+    used_before = np.cumsum(amounts, axis=0) - amounts
+    remaining_threshold = np.maximum(0, threshold - used_before)
+    other_after, self_eligible, premature_eligible, infertility_eligible = np.maximum(
+        0, amounts - remaining_threshold,
+    )
+
+    # 700만원 한도 적용
+    other_eligible = np.minimum(other_after, rules.MEDICAL_OTHER_DEPENDENT_LIMIT)
+
+    general_credit = apply_rate(other_eligible + self_eligible, rules.MEDICAL_RATE_GENERAL, rules)
+    premature_credit = apply_rate(premature_eligible, rules.MEDICAL_RATE_PREMATURE, rules)
+    infertility_credit = apply_rate(infertility_eligible, rules.MEDICAL_RATE_INFERTILITY, rules)
 
     return general_credit + premature_credit + infertility_credit
@@ -3,14 +3,17 @@
 
 소득공제: 국민연금 보험료 (전액 공제)
 세액공제: 연금저축 + 퇴직연금 (한도 및 소득구간별 공제율 적용)
+
+*_batch 함수는 동일한 계산을 NumPy int64 배열 단위로 수행합니다.
 """
-from constants import (
-    PENSION_RATE_HIGH_SALARY,
-    PENSION_RATE_LOW_SALARY,
-    PENSION_SALARY_THRESHOLD,
-    PENSION_SAVINGS_LIMIT,
-    PENSION_TOTAL_LIMIT,
-)
+try:
+    import numpy as np
+except ImportError:  # numpy는 *_batch 함수에서만 필요
+    np = None
+
+from fixed_point import apply_coefficient, coefficient
+from salary_cache import salary_profile
+from tax_rules import TaxRules, load_rules
 
 
 def calc_pension_insurance_deduction(national_pension: int) -> int:
@@ -29,6 +32,7 @@ def calc_pension_tax_credit(
     total_salary: int,
     pension_savings: int,
     retirement_pension: int = 0,
+    rules: TaxRules | None = None,
 ) -> int:
     """연금계좌 세액공제 [p.164].
 
@@ -40,18 +44,66 @@ def calc_pension_tax_credit(
         total_salary: 총급여액 (원)
         pension_savings: 연금저축 납입액 (원)
         retirement_pension: 퇴직연금 근로자부담금 (원, 기본값 0)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
 
     Returns:
         세액공제 금액 (원)
     """
-    savings_eligible = min(pension_savings, PENSION_SAVINGS_LIMIT)
-    retirement_eligible = min(retirement_pension, PENSION_TOTAL_LIMIT - savings_eligible)
+    if rules is None:
+        rules = load_rules()
+
+    savings_eligible = min(pension_savings, rules.PENSION_SAVINGS_LIMIT)
+    retirement_eligible = min(retirement_pension, rules.PENSION_TOTAL_LIMIT - savings_eligible)
     total_eligible = savings_eligible + retirement_eligible
 
-    rate = (
-        PENSION_RATE_LOW_SALARY
-        if total_salary <= PENSION_SALARY_THRESHOLD
-        else PENSION_RATE_HIGH_SALARY
-    )
+    rate = salary_profile(total_salary, rules).pension_rate
 
     return int(total_eligible * rate)
+
+
+def _pension_credit_rate(total_salary: int, rules: TaxRules) -> float:
+    """연금계좌 세액공제율: 총급여 5,500만원 이하 15%, 초과 12% [p.164]."""
+    if total_salary <= rules.PENSION_SALARY_THRESHOLD:
+        return rules.PENSION_RATE_LOW_SALARY
+    return rules.PENSION_RATE_HIGH_SALARY
+
+
+def calc_pension_tax_credit_batch(
+    total_salary,
+    pension_savings,
+    retirement_pension=0,
+    rules=None,
+):
+    """연금계좌 세액공제 배치 계산 [p.164].
+
+    calc_pension_tax_credit()과 동일한 결과를 배열 단위로 산출한다.
+
+    Args:
+        total_salary: 총급여액 배열 (원)
+        pension_savings: 연금저축 납입액 배열 (원)
+        retirement_pension: 퇴직연금 근로자부담금 배열 (원)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        세액공제 금액 배열 (원, int64)
+    """
+    if rules is None:
+        rules = load_rules()
+
+    salary = np.asarray(total_salary, dtype=np.int64)
+    savings_eligible = np.minimum(
+        np.asarray(pension_savings, dtype=np.int64), rules.PENSION_SAVINGS_LIMIT,
+    )
+    retirement_eligible = np.minimum(
+        np.asarray(retirement_pension, dtype=np.int64),
+        rules.PENSION_TOTAL_LIMIT - savings_eligible,
+    )
+    total_eligible = savings_eligible + retirement_eligible
+
+    rate = np.where(
+        salary <= rules.PENSION_SALARY_THRESHOLD,
+        coefficient(rules.PENSION_RATE_LOW_SALARY, rules),
+        coefficient(rules.PENSION_RATE_HIGH_SALARY, rules),
+    )
+
+    return apply_coefficient(total_eligible, rate, rules)
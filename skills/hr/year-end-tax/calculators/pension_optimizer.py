@@ -0,0 +1,140 @@
+"""
+연금계좌 납입액 최적화 [p.164]
+
+연금계좌 세액공제는 연금저축 600만원, 연금저축 + 퇴직연금(IRP) 합산 900만원 한도 내에서
+납입액 x 15%(총급여 5,500만원 이하) 또는 12%입니다. 결정세액은 0원 미만이 될 수 없으므로
+연금계좌 세액공제 전 결정세액을 모두 상쇄하고 남는 납입액은 세액공제 효과가 없습니다.
+
+optimize_pension_batch()는 직원별로
+  1. 연금 납입액 0원일 때의 결정세액(tax_before_pension)을 calc_year_end_tax_batch()로 구하고
+  2. 그 세액을 상쇄하는 최소 공제대상 납입액(useful_contribution, 합산한도 이내)을 공제율 역산으로 구한 뒤
+  3. 연금저축/퇴직연금 한도에 맞게 나눈 권장 납입액과 그때의 세액공제/결정세액을 반환합니다.
+현재 납입액(inputs의 pension_savings/retirement_pension) 중 세액공제 효과가 없는 금액은 excess로 보고합니다.
+
+Usage:
+    inputs = dict(total_salary=salaries, num_dependents=dependents, pension_savings=current)
+    plan = optimize_pension_batch(inputs, prefer="retirement_pension")
+    plan["pension_savings"], plan["retirement_pension"], plan["excess"]
+"""
+from fractions import Fraction
+
+import numpy as np
+
+from fixed_point import exact_rate
+from pension_deduction import calc_pension_tax_credit_batch
+from tax_rules import TaxRules, load_rules
+from total_calculator import calc_year_end_tax_batch
+
+PREFERENCES = ("pension_savings", "retirement_pension")
+
+
+def optimize_pension_batch(
+    inputs: dict,
+    prefer: str = "pension_savings",
+    rules: TaxRules | None = None,
+) -> dict:
+    """결정세액 0원 하한을 넘지 않는 최대 공제 연금계좌 납입액 (직원 배열).
+
+    Args:
+        inputs: calc_year_end_tax_batch() 인자 dict (직원별 배열/스칼라).
+                pension_savings/retirement_pension은 현재 납입액 (excess 계산에만 사용)
+        prefer: 먼저 채울 계좌
+            - pension_savings: 연금저축 600만원까지 먼저, 나머지는 퇴직연금
+            - retirement_pension: 퇴직연금에 전액 (합산한도 900만원까지)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        dict (모두 직원 수 길이 int64 배열):
+            pension_savings: 권장 연금저축 납입액
+            retirement_pension: 권장 퇴직연금 납입액
+            useful_contribution: 세액공제 효과가 있는 최대 공제대상 납입액 (= 권장 합계)
+            pension_tax_credit: 권장 납입 시 연금계좌 세액공제
+            tax_before_pension: 연금계좌 세액공제 전 결정세액
+            determined_tax: 권장 납입 시 결정세액 (합산한도로 모두 상쇄하지 못하면 0 초과)
+            excess: 현재 공제대상 납입액 중 useful_contribution 초과분
+
+    Raises:
+        ValueError: 알 수 없는 prefer
+    """
+    if rules is None:
+        rules = load_rules()
+    if prefer not in PREFERENCES:
+        raise ValueError(f"prefer는 {', '.join(PREFERENCES)} 중 하나여야 합니다: {prefer}")
+
+    inputs = dict(inputs)
+    salary = np.atleast_1d(np.asarray(inputs["total_salary"], dtype=np.int64))
+    current_savings = np.asarray(inputs.pop("pension_savings", 0), dtype=np.int64)
+    current_retirement = np.asarray(inputs.pop("retirement_pension", 0), dtype=np.int64)
+
+    tax_before = np.broadcast_to(
+        calc_year_end_tax_batch(**inputs, rules=rules)["determined_tax"], salary.shape,
+    )
+
+    # 공제율 역산: 세액공제 >= 공제 전 결정세액이 되는 최소 납입액 = ceil(세액 / 공제율)
+    low, high = _rate(rules.PENSION_RATE_LOW_SALARY), _rate(rules.PENSION_RATE_HIGH_SALARY)
+    low_salary = salary <= rules.PENSION_SALARY_THRESHOLD
+    numerator = np.where(low_salary, low.numerator, high.numerator)
+    denominator = np.where(low_salary, low.denominator, high.denominator)
+    useful = np.minimum(-(-tax_before * denominator // numerator), rules.PENSION_TOTAL_LIMIT)
+    # float 공제율의 int() 절사로 1원 모자라는 경우 보정
+    while True:
+        short = (
+            (_credit(salary, useful, prefer, rules) < tax_before)
+            & (useful < rules.PENSION_TOTAL_LIMIT)
+        )
+        if not np.any(short):
+            break
+        useful = useful + short
+
+    savings, retirement = _split(useful, prefer, rules)
+    result = calc_year_end_tax_batch(
+        **inputs, pension_savings=savings, retirement_pension=retirement, rules=rules,
+    )
+    current_eligible = _eligible(current_savings, current_retirement, rules)
+    return {
+        "pension_savings": savings,
+        "retirement_pension": retirement,
+        "useful_contribution": useful,
+        "pension_tax_credit": np.broadcast_to(result["pension_tax_credit"], salary.shape),
+        "tax_before_pension": tax_before,
+        "determined_tax": np.broadcast_to(result["determined_tax"], salary.shape),
+        "excess": np.maximum(0, current_eligible - useful),
+    }
+
+
+def optimize_pension(inputs: dict, prefer: str = "pension_savings", rules=None) -> dict:
+    """직원 1명의 권장 연금계좌 납입액 (optimize_pension_batch()의 스칼라 버전).
+
+    Args:
+        inputs: calc_year_end_tax() 인자 dict
+        prefer: 먼저 채울 계좌 (PREFERENCES)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        optimize_pension_batch()와 같은 키의 int dict
+    """
+    plan = optimize_pension_batch(inputs, prefer, rules)
+    return {key: int(values[0]) for key, values in plan.items()}
+
+
+def _rate(rate) -> Fraction:
+    """공제율 유리수 (정확 모드는 이미 Fraction)."""
+    return rate if isinstance(rate, Fraction) else exact_rate(rate)
+
+
+def _split(contribution, prefer, rules):
+    """공제대상 납입액 -> (연금저축, 퇴직연금)."""
+    if prefer == "retirement_pension":
+        return np.zeros_like(contribution), contribution
+    savings = np.minimum(contribution, rules.PENSION_SAVINGS_LIMIT)
+    return savings, contribution - savings
+
+
+def _credit(salary, contribution, prefer, rules):
+    return calc_pension_tax_credit_batch(salary, *_split(contribution, prefer, rules), rules)
+
+
+def _eligible(savings, retirement, rules):
+    """한도 적용 후 공제대상 납입액 (calc_pension_tax_credit()과 같은 순서)."""
+    savings_eligible = np.minimum(savings, rules.PENSION_SAVINGS_LIMIT)
+    return savings_eligible + np.minimum(retirement, rules.PENSION_TOTAL_LIMIT - savings_eligible)
@@ -8,24 +8,20 @@ References:
   - 기본공제: 소법 제50조 [p.95]
   - 추가공제: 소법 제51조 [p.99-102]
   - 자녀세액공제: 소법 제59조의2 [p.160-161]
+
+*_batch 함수는 동일한 계산을 NumPy int64 배열 단위로 수행합니다.
 """
 
-from constants import (
-    PERSONAL_DEDUCTION_PER_PERSON,
-    ADDITIONAL_DEDUCTION_ELDERLY,
-    ADDITIONAL_DEDUCTION_DISABLED,
-    ADDITIONAL_DEDUCTION_SINGLE_PARENT,
-    ADDITIONAL_DEDUCTION_WOMAN,
-    CHILD_CREDIT_1,
-    CHILD_CREDIT_2,
-    CHILD_CREDIT_EXTRA,
-    CHILD_CREDIT_BIRTH_1ST,
-    CHILD_CREDIT_BIRTH_2ND,
-    CHILD_CREDIT_BIRTH_3RD,
-)
-
-
-def calc_basic_personal_deduction(num_dependents: int) -> int:
+try:
+    import numpy as np
+    from ragged import as_ragged
+except ImportError:  # numpy는 *_batch 함수에서만 필요
+    np = None
+
+from tax_rules import TaxRules, load_rules
+
+
+def calc_basic_personal_deduction(num_dependents: int, rules: TaxRules | None = None) -> int:
     """기본공제 = 1인당 150만원 x 인원수 [p.95]
 
     본인, 배우자, 부양가족 중 소득요건을 충족하는 인원에 대해
@@ -33,11 +29,15 @@ def calc_basic_personal_deduction(num_dependents: int) -> int:
 
     Args:
         num_dependents: 기본공제 대상 인원수 (본인 포함)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
 
     Returns:
         기본공제액 (원)
     """
-    return num_dependents * PERSONAL_DEDUCTION_PER_PERSON
+    if rules is None:
+        rules = load_rules()
+
+    return num_dependents * rules.PERSONAL_DEDUCTION_PER_PERSON
 
 
 def calc_additional_deduction(
@@ -45,6 +45,7 @@ def calc_additional_deduction(
     disabled_count: int = 0,
     is_single_parent: bool = False,
     is_woman_deduction: bool = False,
+    rules: TaxRules | None = None,
 ) -> int:
     """추가공제 [p.99-102]
 
@@ -59,19 +60,23 @@ def calc_additional_deduction(
         disabled_count: 장애인 인원수
         is_single_parent: 한부모 해당 여부
         is_woman_deduction: 부녀자 공제 해당 여부
+        rules: 과세연도 세법 규칙 (기본: load_rules())
 
     Returns:
         추가공제액 (원)
     """
+    if rules is None:
+        rules = load_rules()
+
     total = 0
-    total += elderly_count * ADDITIONAL_DEDUCTION_ELDERLY
-    total += disabled_count * ADDITIONAL_DEDUCTION_DISABLED
+    total += elderly_count * rules.ADDITIONAL_DEDUCTION_ELDERLY
+    total += disabled_count * rules.ADDITIONAL_DEDUCTION_DISABLED
 
     # 한부모와 부녀자는 중복 적용 불가, 한부모 우선
     if is_single_parent:
-        total += ADDITIONAL_DEDUCTION_SINGLE_PARENT
+        total += rules.ADDITIONAL_DEDUCTION_SINGLE_PARENT
     elif is_woman_deduction:
-        total += ADDITIONAL_DEDUCTION_WOMAN
+        total += rules.ADDITIONAL_DEDUCTION_WOMAN
 
     return total
 
@@ -79,6 +84,7 @@ def calc_additional_deduction(
 def calc_child_tax_credit(
     children_over_8: int,
     birth_orders: list[int] | None = None,
+    rules: TaxRules | None = None,
 ) -> int:
     """자녀세액공제 [p.160-161]
 
@@ -96,39 +102,134 @@ def calc_child_tax_credit(
         children_over_8: 8세 이상 기본공제 대상 자녀 수
         birth_orders: 해당 과세연도 출산/입양 자녀의 출생순위 리스트
                       (e.g., [3] for 셋째, [1, 2] for 첫째+둘째)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
 
     Returns:
         자녀세액공제액 (원)
     """
+    if rules is None:
+        rules = load_rules()
+
     total = 0
 
     # 8세 이상 자녀 공제
     if children_over_8 == 1:
-        total += CHILD_CREDIT_1
+        total += rules.CHILD_CREDIT_1
     elif children_over_8 == 2:
-        total += CHILD_CREDIT_2
+        total += rules.CHILD_CREDIT_2
     elif children_over_8 >= 3:
-        total += CHILD_CREDIT_2 + (children_over_8 - 2) * CHILD_CREDIT_EXTRA
+        total += rules.CHILD_CREDIT_2 + (children_over_8 - 2) * rules.CHILD_CREDIT_EXTRA
 
     # 출산/입양 자녀 공제
     if birth_orders:
         for order in birth_orders:
-            total += _birth_credit_by_order(order)
+            total += _birth_credit_by_order(order, rules)
 
     return total
 
 
-def _birth_credit_by_order(order: int) -> int:
+def _birth_credit_by_order(order: int, rules: TaxRules) -> int:
     """출생순위별 출산/입양 세액공제액 [p.160]
 
     Args:
         order: 출생순위 (1=첫째, 2=둘째, 3이상=셋째이상)
+        rules: 과세연도 세법 규칙
 
     Returns:
         출산/입양 세액공제액 (원)
     """
     if order <= 1:
-        return CHILD_CREDIT_BIRTH_1ST
+        return rules.CHILD_CREDIT_BIRTH_1ST
     if order == 2:
-        return CHILD_CREDIT_BIRTH_2ND
-    return CHILD_CREDIT_BIRTH_3RD
+        return rules.CHILD_CREDIT_BIRTH_2ND
+    return rules.CHILD_CREDIT_BIRTH_3RD
+
+
+# =============================================================================
+# 배치 계산 (NumPy int64 배열)
+# =============================================================================
+def calc_additional_deduction_batch(
+    elderly_count=0,
+    disabled_count=0,
+    is_single_parent=False,
+    is_woman_deduction=False,
+    rules=None,
+):
+    """추가공제 배치 계산 [p.99-102]
+
+    calc_additional_deduction()과 동일한 결과를 배열 단위로 산출한다.
+    한부모와 부녀자는 행별로 중복 적용 불가 (한부모 우선).
+
+    Args:
+        elderly_count: 경로우대 대상 인원수 배열
+        disabled_count: 장애인 인원수 배열
+        is_single_parent: 한부모 해당 여부 배열
+        is_woman_deduction: 부녀자 공제 해당 여부 배열
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        추가공제액 배열 (원, int64)
+    """
+    if rules is None:
+        rules = load_rules()
+
+    elderly = np.asarray(elderly_count, dtype=np.int64)
+    disabled = np.asarray(disabled_count, dtype=np.int64)
+    single_parent = np.asarray(is_single_parent, dtype=bool)
+    woman = np.asarray(is_woman_deduction, dtype=bool)
+
+    total = (
+        elderly * rules.ADDITIONAL_DEDUCTION_ELDERLY
+        + disabled * rules.ADDITIONAL_DEDUCTION_DISABLED
+    )
+    total = total + np.where(
+        single_parent,
+        rules.ADDITIONAL_DEDUCTION_SINGLE_PARENT,
+        np.where(woman, rules.ADDITIONAL_DEDUCTION_WOMAN, 0),
+    )
+    return total.astype(np.int64)
+
+
+def calc_child_tax_credit_batch(children_over_8, birth_orders=None, rules=None):
+    """자녀세액공제 배치 계산 [p.160-161]
+
+    Args:
+        children_over_8: 8세 이상 기본공제 대상 자녀 수 배열
+        birth_orders: 행별 출산/입양 자녀 출생순위 (RaggedArray 또는
+                      e.g., [[3], [], None, [1, 2]]), None이면 출산 공제 없음
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        자녀세액공제액 배열 (원, int64)
+    """
+    if rules is None:
+        rules = load_rules()
+
+    children = np.asarray(children_over_8, dtype=np.int64)
+
+    total = np.select(
+        [children == 1, children == 2, children >= 3],
+        [
+            rules.CHILD_CREDIT_1,
+            rules.CHILD_CREDIT_2,
+            rules.CHILD_CREDIT_2 + (children - 2) * rules.CHILD_CREDIT_EXTRA,
+        ],
+        default=0,
+    ).astype(np.int64)
+
+    if birth_orders is not None:
+        orders = as_ragged(birth_orders)
+        if (len(orders),) != total.shape:
+            raise ValueError("birth_orders 행 수가 다른 열과 일치하지 않습니다")
+        total = total + orders.segment_sum(_birth_credit_by_order_batch(orders.values, rules))
+
+    return total
+
+
+def _birth_credit_by_order_batch(orders, rules):
+    """출생순위별 출산/입양 세액공제액 배치 계산 (_birth_credit_by_order와 동일)."""
+    return np.select(
+        [orders <= 1, orders == 2],
+        [rules.CHILD_CREDIT_BIRTH_1ST, rules.CHILD_CREDIT_BIRTH_2ND],
+        default=rules.CHILD_CREDIT_BIRTH_3RD,
+    ).astype(np.int64)
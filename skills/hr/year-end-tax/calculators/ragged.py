@@ -0,0 +1,104 @@
+"""
+행별 가변 길이 입력의 CSR(offsets + values) 표현
+
+자녀별 교육비, 출산/입양 자녀 출생순위처럼 직원마다 개수가 다른 입력을
+전 직원에 대해 하나의 values 배열과 행 경계 offsets 배열로 보관합니다.
+행 i의 값은 values[offsets[i]:offsets[i + 1]] 입니다.
+
+행별 합계(segment reduction)는 누적합 차분으로 계산하므로
+자녀 수가 많은 가정이 있어도 행 단위 Python 반복이 없습니다.
+"""
+from itertools import chain
+
+import numpy as np
+
+
+class RaggedArray:
+    """CSR 형식의 행별 가변 길이 int64 배열.
+
+    Attributes:
+        offsets: 행 경계 (길이 행수+1, offsets[0] == 0, 비감소)
+        values: 전체 값 (길이 offsets[-1])
+    """
+
+    __slots__ = ("offsets", "values")
+
+    def __init__(self, offsets, values):
+        """
+        Args:
+            offsets: 행 경계 배열
+            values: 전체 값 배열
+
+        Raises:
+            ValueError: offsets가 0으로 시작하지 않거나, 감소하거나,
+                        마지막 값이 values 길이와 다른 경우
+        """
+        offsets = np.asarray(offsets, dtype=np.int64)
+        values = np.asarray(values, dtype=np.int64)
+
+        if offsets.ndim != 1 or offsets.size == 0 or offsets[0] != 0:
+            raise ValueError("offsets는 0으로 시작하는 1차원 배열이어야 합니다")
+        if np.any(np.diff(offsets) < 0):
+            raise ValueError("offsets는 비감소여야 합니다")
+        if offsets[-1] != values.size:
+            raise ValueError("offsets[-1]과 values 길이가 일치하지 않습니다")
+
+        self.offsets = offsets
+        self.values = values
+
+    @classmethod
+    def from_lists(cls, rows) -> "RaggedArray":
+        """행별 리스트의 시퀀스로부터 생성 (None/빈 리스트는 길이 0 행).
+
+        Args:
+            rows: e.g., [[1_200_000], None, [2_500_000, 3_000_000]]
+        """
+        lengths = np.fromiter((len(row) if row else 0 for row in rows), dtype=np.int64)
+        offsets = np.zeros(lengths.size + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        values = np.fromiter(
+            chain.from_iterable(row for row in rows if row),
+            dtype=np.int64,
+            count=int(offsets[-1]),
+        )
+        return cls(offsets, values)
+
+    def __len__(self) -> int:
+        return self.offsets.size - 1
+
+    @property
+    def lengths(self):
+        """행별 값 개수."""
+        return np.diff(self.offsets)
+
+    @property
+    def row_ids(self):
+        """values 각 원소가 속한 행 번호."""
+        return np.repeat(np.arange(len(self)), self.lengths)
+
+    def segment_sum(self, values=None):
+        """행별 합계 (누적합 차분, int64 정확).
+
+        Args:
+            values: self.values와 같은 길이의 값 배열 (기본: self.values)
+
+        Returns:
+            길이 행수의 int64 배열 (빈 행은 0)
+        """
+        values = self.values if values is None else np.asarray(values, dtype=np.int64)
+        cumulative = np.zeros(values.size + 1, dtype=np.int64)
+        np.cumsum(values, out=cumulative[1:])
+        return cumulative[self.offsets[1:]] - cumulative[self.offsets[:-1]]
+
+    def tolist(self) -> list[list[int]]:
+        """행별 리스트로 변환 (검증/디버깅용)."""
+        values = self.values.tolist()
+        bounds = self.offsets.tolist()
+        return [values[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def as_ragged(rows) -> RaggedArray:
+    """RaggedArray는 그대로, 행별 리스트의 시퀀스는 RaggedArray로 변환한다."""
+    if isinstance(rows, RaggedArray):
+        return rows
+    return RaggedArray.from_lists(rows)
@@ -0,0 +1,220 @@
+"""
+총급여액별 실효세율/한계세율 곡선
+
+가족 구성 등 고정 입력(profile)에 대해 총급여액 1천만원~3억원을 1만원 간격으로
+calc_year_end_tax_batch() 한 번에 계산하여 결정세액, 실효세율, 한계세율 배열을 만듭니다.
+
+곡선이 꺾이는 총급여액(kink)도 함께 돌려줍니다 (모두 "이 금액부터 새 구간"인 최초 총급여액, 원 단위).
+  - 총급여액 기준 규칙: 근로소득공제 구간, 근로소득세액공제 한도 구간과 한도 감소 종료점,
+    신용카드(7천만원)/연금계좌(5,500만원)/월세(5,500만원, 8천만원) 기준
+  - 과세표준/세액 기준 규칙: 기본세율 구간, 근로소득세액공제 55%/30% 기준(산출세액 130만원),
+    근로소득공제 한도, 결정세액 0원 하한 탈출, 카드 최저사용금액 미달,
+    근로소득세액공제 한도 적용 시작/해제 (양방향).
+    격자에서 넘는 구간을 찾은 뒤 그 구간 안을 배열 이분 탐색으로 1원 단위까지 좁힙니다.
+
+Usage:
+    curves = calc_rate_curves(
+        dict(num_dependents=4, children_over_8=2), card_usage=dict(credit_card=20_000_000),
+    )
+    curves["salary"], curves["effective_rate"], curves["marginal_rate"]
+    dict(zip(curves["kink_label"], curves["kink_salary"]))
+"""
+from fractions import Fraction
+
+import numpy as np
+
+from card_deduction import calc_card_deduction_batch
+from fixed_point import apply_rate, exact_rate
+from income_tax import calc_earned_income_tax_credit_batch
+from tax_rules import TaxRules, load_rules
+from total_calculator import calc_year_end_tax_batch
+
+DEFAULT_SALARY_MIN = 10_000_000
+DEFAULT_SALARY_MAX = 300_000_000
+DEFAULT_SALARY_STEP = 10_000
+
+
+def calc_rate_curves(
+    profile: dict | None = None,
+    card_usage: dict | None = None,
+    annual_rent: int = 0,
+    salary_min: int = DEFAULT_SALARY_MIN,
+    salary_max: int = DEFAULT_SALARY_MAX,
+    salary_step: int = DEFAULT_SALARY_STEP,
+    rules: TaxRules | None = None,
+) -> dict:
+    """총급여액 격자의 결정세액/실효세율/한계세율과 꺾이는 점.
+
+    Args:
+        profile: calc_year_end_tax_batch() 고정 인자 dict (total_salary 제외, 기본 본인 1명)
+        card_usage: 결제수단별 카드 사용액 (calc_card_deduction_batch() 인자, 총급여액마다 재계산)
+        annual_rent: 연간 월세액 (월세액 세액공제, 총급여액마다 재계산)
+        salary_min: 첫 총급여액 (원)
+        salary_max: 마지막 총급여액 (원, 포함)
+        salary_step: 총급여액 간격 (원)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        dict:
+            salary: 총급여액 배열 (int64)
+            determined_tax: 결정세액 배열 (int64)
+            effective_rate: 결정세액 / 총급여액 (float64)
+            marginal_rate: (다음 총급여액의 결정세액 - 결정세액) / salary_step (float64, 마지막은 직전 값)
+            kink_salary: 꺾이는 점 총급여액 (int64, 오름차순, 범위 내)
+            kink_label: 꺾이는 점 이름 (str 배열)
+
+    Raises:
+        ValueError: salary_step < 1 또는 salary_max < salary_min
+    """
+    if rules is None:
+        rules = load_rules()
+    if salary_step < 1 or salary_max < salary_min:
+        raise ValueError("salary_step은 1 이상, salary_max는 salary_min 이상이어야 합니다")
+
+    profile = dict(profile or {})
+    profile.pop("total_salary", None)
+    profile.setdefault("num_dependents", 1)
+
+    def evaluate(salary):
+        return _evaluate(salary, profile, card_usage, annual_rent, rules)
+
+    salary = np.arange(salary_min, salary_max + 1, salary_step, dtype=np.int64)
+    result = evaluate(salary)
+    determined = result["determined_tax"]
+
+    marginal = np.diff(determined) / salary_step
+    marginal = np.append(marginal, marginal[-1] if marginal.size else 0.0)
+
+    kinks = _rule_kinks(profile, card_usage, annual_rent, rules)
+    kinks += _crossing_kinks(salary, result, evaluate, rules)
+    kinks = sorted(
+        (point, label) for point, label in kinks if salary_min <= point <= salary_max
+    )
+    return {
+        "salary": salary,
+        "determined_tax": determined,
+        "effective_rate": np.divide(
+            determined, salary, out=np.zeros(salary.shape), where=salary > 0,
+        ),
+        "marginal_rate": marginal,
+        "kink_salary": np.array([point for point, _ in kinks], dtype=np.int64),
+        "kink_label": np.array([label for _, label in kinks], dtype=str),
+    }
+
+
+def _evaluate(salary, profile, card_usage, annual_rent, rules) -> dict:
+    """총급여액 배열의 연말정산 결과 (카드공제/월세액 세액공제는 총급여액별 재계산)."""
+    inputs = dict(profile)
+    if card_usage:
+        usage = dict(card_usage)
+        usage.setdefault("credit_card", 0)
+        usage.setdefault("debit_cash", 0)
+        inputs["card_deduction"] = calc_card_deduction_batch(salary, **usage, rules=rules)
+    if annual_rent:
+        inputs["other_tax_credits"] = (
+            np.asarray(inputs.get("other_tax_credits", 0), dtype=np.int64)
+            + _rent_credit_batch(salary, annual_rent, rules)
+        )
+    return calc_year_end_tax_batch(total_salary=salary, **inputs, rules=rules)
+
+
+def _rent_credit_batch(salary, annual_rent, rules):
+    """월세액 세액공제 배치 계산 (calc_rent_tax_credit()과 동일) [p.202]."""
+    rent = min(annual_rent, rules.RENT_CREDIT_ANNUAL_LIMIT)
+    rent = np.full(salary.shape, rent, dtype=np.int64)
+    credit = np.where(
+        salary <= rules.RENT_CREDIT_SALARY_THRESHOLD,
+        apply_rate(rent, rules.RENT_CREDIT_RATE_LOW, rules),
+        apply_rate(rent, rules.RENT_CREDIT_RATE_HIGH, rules),
+    )
+    return np.where(salary > rules.RENT_CREDIT_SALARY_LIMIT, 0, credit)
+
+
+def _rule_kinks(profile, card_usage, annual_rent, rules) -> list:
+    """총급여액 기준이 규칙에 정해진 꺾이는 점 (구간 상한 + 1)."""
+    kinks = [
+        (int(upper) + 1, "earned_income_deduction_bracket")
+        for upper in rules.earned_income_deduction_table.uppers[:-1]
+    ]
+
+    table = rules.earned_income_tax_credit_limit_table
+    for lower, upper, base_limit, decrease_rate, min_limit in zip(
+        table.lowers, table.uppers, *table.columns,
+    ):
+        if upper != float('inf'):
+            kinks.append((int(upper) + 1, "earned_income_tax_credit_limit_bracket"))
+        if decrease_rate and base_limit > min_limit:
+            # 한도 감소가 최저한도에 닿는 총급여액 (이후 한도 고정)
+            rate = (
+                decrease_rate if isinstance(decrease_rate, Fraction) else exact_rate(decrease_rate)
+            )
+            floor = lower + (base_limit - min_limit) / rate
+            if floor < upper:
+                kinks.append((int(floor) + 1, "earned_income_tax_credit_limit_floor"))
+
+    if card_usage:
+        kinks.append((rules.CARD_SALARY_THRESHOLD + 1, "card_salary_threshold"))
+    if profile.get("pension_savings") or profile.get("retirement_pension"):
+        kinks.append((rules.PENSION_SALARY_THRESHOLD + 1, "pension_salary_threshold"))
+    if annual_rent:
+        kinks.append((rules.RENT_CREDIT_SALARY_THRESHOLD + 1, "rent_salary_threshold"))
+        kinks.append((rules.RENT_CREDIT_SALARY_LIMIT + 1, "rent_salary_limit"))
+    return kinks
+
+
+def _crossing_kinks(salary, result, evaluate, rules) -> list:
+    """과세표준/세액 기준 꺾이는 점: 격자에서 넘는 구간을 찾고 배열 이분 탐색으로 1원까지 좁힌다.
+
+    각 조건은 (결과 dict, 총급여액 배열) -> 참/거짓 배열이며, 격자에서 참/거짓이 바뀌는
+    구간마다 (거짓 -> 참, 참 -> 거짓 모두) 바뀐 값이 되는 최초 총급여액을 돌려준다.
+    근로소득세액공제 한도는 총급여액이 늘면 걸렸다가 다시 풀릴 수도 있다.
+    """
+    conditions = [
+        (_above("taxable_income", 1, int(upper)), "income_tax_bracket")
+        for upper in rules.income_tax_table.uppers[:-1]
+    ]
+    conditions += [
+        (_above("calculated_tax", 1, rules.EARNED_INCOME_TAX_CREDIT_THRESHOLD),
+         "earned_income_tax_credit_rate"),
+        (_above("earned_income_deduction", 1, rules.EARNED_INCOME_DEDUCTION_CAP - 1),
+         "earned_income_deduction_cap"),
+        (_above("determined_tax", 1, 0), "tax_floor"),
+        (_above("card_deduction", -1, -1), "card_minimum_usage"),
+        (lambda values, points: _credit_capped(values, points, rules),
+         "earned_income_tax_credit_cap"),
+    ]
+
+    low, high, target, found = [], [], [], []
+    for condition, label in conditions:
+        reached = condition(result, salary)
+        for index in np.flatnonzero(reached[1:] != reached[:-1]) + 1:
+            low.append(int(salary[index - 1]))
+            high.append(int(salary[index]))
+            target.append(bool(reached[index]))
+            found.append((condition, label))
+    if not found:
+        return []
+
+    low, high, target = np.array(low), np.array(high), np.array(target)
+    while np.any(high - low > 1):
+        middle = (low + high) // 2
+        values = evaluate(middle)
+        reached = np.array([
+            condition(values, middle)[k] for k, (condition, _) in enumerate(found)
+        ])
+        high = np.where(reached == target, middle, high)
+        low = np.where(reached == target, low, middle)
+    return [(int(point), label) for point, (_, label) in zip(high, found)]
+
+
+def _above(key, sign, threshold):
+    """결과 키 조건: 부호 x 값 > 기준값."""
+    return lambda values, points: sign * values[key] > threshold
+
+
+def _credit_capped(values, points, rules):
+    """근로소득세액공제가 총급여액별 한도에 걸려 있는지 (한도 없는 공제액 > 적용 공제액)."""
+    uncapped = calc_earned_income_tax_credit_batch(
+        values["calculated_tax"], points, rules, credit_limit=np.iinfo(np.int64).max,
+    )
+    return uncapped > values["earned_income_tax_credit"]
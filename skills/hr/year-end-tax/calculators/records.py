@@ -0,0 +1,97 @@
+"""
+연말정산 입력/결과 레코드
+
+calc_year_end_tax()의 인자 묶음(TaxpayerInput)과 결과(SettlementResult)를
+불변(frozen) __slots__ 데이터클래스로 표현합니다.
+직원별 결과를 dict(19개 문자열 키) 대신 고정 슬롯 객체로 보관하므로
+대량 보관 시 메모리가 적고 속성 접근이 빠릅니다.
+
+기존 dict 기반 호출부는 to_dict() / from_dict()로 호환됩니다.
+"""
+from dataclasses import dataclass, fields
+
+
+@dataclass(frozen=True, slots=True)
+class TaxpayerInput:
+    """calc_year_end_tax() 입력 (필드 이름/기본값 동일).
+
+    birth_orders는 불변성을 위해 tuple로 보관합니다.
+    """
+
+    total_salary: int
+    num_dependents: int
+    # 인적공제
+    elderly_count: int = 0
+    disabled_count: int = 0
+    is_single_parent: bool = False
+    is_woman_deduction: bool = False
+    # 소득공제
+    national_pension: int = 0
+    health_insurance: int = 0
+    long_term_care: int = 0
+    employment_insurance: int = 0
+    housing_loan_deduction: int = 0
+    card_deduction: int = 0
+    other_income_deductions: int = 0
+    # 세액공제
+    children_over_8: int = 0
+    birth_orders: tuple[int, ...] = ()
+    pension_savings: int = 0
+    retirement_pension: int = 0
+    insurance_tax_credit: int = 0
+    medical_tax_credit: int = 0
+    education_tax_credit: int = 0
+    donation_tax_credit: int = 0
+    other_tax_credits: int = 0
+    # 기납부
+    prepaid_tax: int = 0
+
+    @classmethod
+    def from_kwargs(cls, **kwargs) -> "TaxpayerInput":
+        """calc_year_end_tax() 인자 dict로부터 생성 (birth_orders 리스트/None 허용)."""
+        birth_orders = kwargs.pop("birth_orders", None)
+        return cls(**kwargs, birth_orders=tuple(birth_orders or ()))
+
+    def to_kwargs(self) -> dict:
+        """calc_year_end_tax(**kwargs)에 넘길 dict."""
+        kwargs = {name: getattr(self, name) for name in INPUT_FIELDS}
+        kwargs["birth_orders"] = list(self.birth_orders) or None
+        return kwargs
+
+
+@dataclass(frozen=True, slots=True)
+class SettlementResult:
+    """calc_year_end_tax() 결과 (필드 순서 = 기존 반환 dict 키 순서)."""
+
+    total_salary: int
+    earned_income_deduction: int
+    earned_income_amount: int
+    personal_deduction: int
+    pension_insurance_deduction: int
+    insurance_income_deduction: int
+    housing_deduction: int
+    card_deduction: int
+    total_income_deduction: int
+    taxable_income: int
+    calculated_tax: int
+    earned_income_tax_credit: int
+    child_tax_credit: int
+    pension_tax_credit: int
+    special_tax_credit: int
+    total_tax_credit: int
+    determined_tax: int
+    prepaid_tax: int
+    refund_amount: int
+
+    @classmethod
+    def from_dict(cls, result: dict) -> "SettlementResult":
+        """calc_year_end_tax() 반환 dict로부터 생성."""
+        return cls(**{key: result[key] for key in RESULT_KEYS})
+
+    def to_dict(self) -> dict:
+        """기존 calc_year_end_tax() 반환 형식의 dict."""
+        return {key: getattr(self, key) for key in RESULT_KEYS}
+
+
+INPUT_FIELDS = tuple(field.name for field in fields(TaxpayerInput))
+RESULT_KEYS = tuple(field.name for field in fields(SettlementResult))
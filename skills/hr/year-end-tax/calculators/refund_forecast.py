@@ -0,0 +1,193 @@
+"""
+연말 지출 불확실성을 반영한 1월 환급액 Monte Carlo 예측
+
+10월에는 카드/의료비/기부금 사용액을 9월까지만 알고 있습니다. 직원별 지출 항목마다
+올해 월별 기록으로 분포를 맞춘 뒤 남은 달(4분기) 지출을 표본 추출하고,
+(표본 S x 직원 N) 전체에 연말정산을 벡터 계산하여 전사 환급액의 백분위를 구합니다.
+
+분포 (직원 x 항목별, 항목/달 사이는 독립):
+  - 월평균 m, 월분산 v (기록이 1개월이면 0)
+  - 남은 r개월 합계 ~ 로그정규분포, 평균 r x m, 분산 r x v (적률 일치)
+  - m = 0이면 0, v = 0이면 r x m 고정
+
+메모리는 표본 축을 chunk_size개씩 나누어 (chunk_size x N) 배열만 유지합니다.
+표본마다 독립 난수열(SeedSequence.spawn)을 쓰므로 chunk_size와 무관하게 같은 결과가 나옵니다.
+연말정산은 total_calculator의 배치 단계(prepare_settlement_batch / settle_prepared_batch)에
+(N,) 고정 입력과 (chunk, N) 변동 입력을 함께 넣어 계산하므로,
+근로소득공제/인적공제 등은 표본 수와 무관하게 청크마다 직원당 한 번만 계산됩니다.
+
+Usage:
+    forecast = forecast_refunds(
+        dict(total_salary=salaries, num_dependents=dependents, prepaid_tax=withheld),
+        card_monthly=dict(credit_card=credit_jan_sep, debit_cash=debit_jan_sep),  # (N, 9)
+        medical_monthly=dict(self_etc_medical=medical_jan_sep),
+        samples=1_000, seed=2024,
+    )
+    forecast["percentiles"]  # {5: ..., 50: ..., 95: ...} 전사 refund_amount 합계
+"""
+import numpy as np
+
+from card_deduction import calc_card_deduction_batch
+from donation_deduction import calc_donation_tax_credit_batch
+from medical_deduction import calc_medical_tax_credit_batch
+from salary_cache import salary_profiles_batch
+from tax_rules import TaxRules, load_rules
+from total_calculator import batch_columns, prepare_settlement_batch, settle_prepared_batch
+from withholding_simulator import MONTHS
+
+DEFAULT_SAMPLES = 1_000
+DEFAULT_PERCENTILES = (5, 50, 95)
+
+# 한 번에 계산할 (직원 x 표본) 칸 수 기본값 (chunk_size 미지정 시)
+DEFAULT_CHUNK_CELLS = 1000000
+
+
+def forecast_refunds(
+    inputs: dict,
+    card_monthly: dict | None = None,
+    medical_monthly: dict | None = None,
+    donation_monthly: dict | None = None,
+    samples: int = DEFAULT_SAMPLES,
+    percentiles=DEFAULT_PERCENTILES,
+    chunk_size: int | None = None,
+    seed=None,
+    rules: TaxRules | None = None,
+) -> dict:
+    """4분기 지출을 표본 추출한 전사 환급액 분포.
+
+    Args:
+        inputs: calc_year_end_tax_batch() 인자 dict (직원별 배열/스칼라).
+                지출 기록을 준 항목의 card_deduction/medical_tax_credit/donation_tax_credit은
+                표본마다 다시 계산하므로 무시합니다.
+        card_monthly: 결제수단 -> 월별 사용액 (N, k) (calc_card_deduction_batch() 인자 이름)
+        medical_monthly: 의료비 종류 -> 월별 의료비 (N, k) (calc_medical_tax_credit_batch() 인자 이름)
+        donation_monthly: 기부금 종류 -> 월별 기부금 (N, k)
+                          (calc_donation_tax_credit_batch() 인자 이름)
+        samples: 표본 수
+        percentiles: 구할 백분위 (0~100)
+        chunk_size: 한 번에 계산할 표본 수 (기본: DEFAULT_CHUNK_CELLS // N)
+        seed: 난수 시드 (np.random.SeedSequence 인자)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        dict:
+            total_refund: 표본별 전사 refund_amount 합계 (samples,) int64 (음수 = 순환급)
+            refund_liability: 표본별 환급 대상자 환급액 합계 (samples,) int64 (양수)
+            percentiles: 백분위 -> total_refund 백분위 값
+            liability_percentiles: 백분위 -> refund_liability 백분위 값
+            mean_refund: 직원별 refund_amount 표본 평균 (N,) float64
+
+    Raises:
+        ValueError: samples/chunk_size < 1, 월별 기록이 (N, 1~12) 배열이 아닌 경우
+    """
+    if rules is None:
+        rules = load_rules()
+    if samples < 1 or (chunk_size is not None and chunk_size < 1):
+        raise ValueError("samples와 chunk_size는 1 이상이어야 합니다")
+
+    salary = np.atleast_1d(np.asarray(inputs["total_salary"], dtype=np.int64))
+    size = salary.shape[0]
+    groups = {
+        "card": _fit(card_monthly, size),
+        "medical": _fit(medical_monthly, size),
+        "donation": _fit(donation_monthly, size),
+    }
+    fixed = batch_columns({**inputs, "total_salary": salary}, size)
+    if groups["donation"]:
+        earned = salary_profiles_batch(salary, rules)["earned_income_amount"]
+
+    if chunk_size is None:
+        chunk_size = max(1, DEFAULT_CHUNK_CELLS // size)
+    seeds = np.random.SeedSequence(seed).spawn(samples)
+    series_count = sum(len(series) for series in groups.values())
+
+    total_refund = np.empty(samples, dtype=np.int64)
+    refund_liability = np.empty(samples, dtype=np.int64)
+    refund_sum = np.zeros(size)
+    for start in range(0, samples, chunk_size):
+        chunk = seeds[start:start + chunk_size]
+        # 표본별 난수열에서 (항목, 직원) 표준정규 -> (표본, 항목, 직원)
+        normals = np.stack([
+            np.random.default_rng(sequence).standard_normal((series_count, size))
+            for sequence in chunk
+        ])
+        totals = _draw_totals(groups, normals)
+
+        flat_salary = np.tile(salary, len(chunk))
+        varying = {}
+        if groups["card"]:
+            usage = {name: amount.ravel() for name, amount in totals["card"].items()}
+            usage.setdefault("credit_card", 0)
+            usage.setdefault("debit_cash", 0)
+            varying["card_deduction"] = calc_card_deduction_batch(
+                flat_salary, **usage, rules=rules,
+            )
+        if groups["medical"]:
+            medical = {name: amount.ravel() for name, amount in totals["medical"].items()}
+            medical.setdefault("other_dependent_medical", 0)
+            medical.setdefault("self_etc_medical", 0)
+            varying["medical_tax_credit"] = calc_medical_tax_credit_batch(
+                flat_salary, **medical, rules=rules,
+            )
+        if groups["donation"]:
+            donations = {name: amount.ravel() for name, amount in totals["donation"].items()}
+            varying["donation_tax_credit"] = calc_donation_tax_credit_batch(
+                np.tile(earned, len(chunk)), **donations, rules=rules,
+            )
+
+        grid = dict(fixed)
+        for name, column in varying.items():
+            grid[name] = column.reshape(len(chunk), size)
+        prepared = prepare_settlement_batch(grid, inputs.get("birth_orders"))
+        refund = np.broadcast_to(
+            settle_prepared_batch(prepared, rules)["refund_amount"], (len(chunk), size),
+        )
+        total_refund[start:start + len(chunk)] = refund.sum(axis=1)
+        refund_liability[start:start + len(chunk)] = np.maximum(0, -refund).sum(axis=1)
+        refund_sum += refund.sum(axis=0)
+
+    points = list(percentiles)
+    return {
+        "total_refund": total_refund,
+        "refund_liability": refund_liability,
+        "percentiles": dict(zip(points, np.percentile(total_refund, points).tolist())),
+        "liability_percentiles": dict(
+            zip(points, np.percentile(refund_liability, points).tolist()),
+        ),
+        "mean_refund": refund_sum / samples,
+    }
+
+
+def _fit(monthly, size) -> dict:
+    """항목 -> (올해 누계, 남은 달 합계의 로그정규 mu, sigma) (각 (N,) 배열)."""
+    fitted = {}
+    for name, values in (monthly or {}).items():
+        values = np.asarray(values, dtype=np.int64)
+        if values.ndim != 2 or values.shape[0] != size or not 1 <= values.shape[1] <= MONTHS:
+            raise ValueError(f"{name} 월별 기록은 ({size}, 1~{MONTHS}) 배열이어야 합니다")
+        known = values.sum(axis=1)
+        remaining = MONTHS - values.shape[1]
+        mean = values.mean(axis=1)
+        variance = values.var(axis=1, ddof=1) if values.shape[1] > 1 else np.zeros(size)
+
+        # 남은 r개월 합계: 평균 r x m, 분산 r x v -> 로그정규 (m > 0인 직원만)
+        expected = remaining * mean
+        positive = expected > 0
+        safe = np.where(positive, expected, 1.0)
+        sigma2 = np.log1p(remaining * variance / safe**2)
+        mu = np.log(safe) - sigma2 / 2
+        fitted[name] = (known, np.where(positive, mu, -np.inf), np.sqrt(sigma2))
+    return fitted
+
+
+def _draw_totals(groups, normals) -> dict:
+    """표준정규 (표본, 항목, N) -> 항목별 연간 합계 (표본, N) int64."""
+    totals = {}
+    index = 0
+    for group, series in groups.items():
+        totals[group] = {}
+        for name, (known, mu, sigma) in series.items():
+            draw = np.exp(mu + sigma * normals[:, index])
+            totals[group][name] = known + np.rint(draw).astype(np.int64)
+            index += 1
+    return totals
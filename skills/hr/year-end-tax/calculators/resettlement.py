@@ -0,0 +1,156 @@
+"""
+과세연도 간 재정산 및 차이 계산 (경정청구 일괄 처리)
+
+같은 직원 입력을 두 과세연도 규칙(e.g., 2024 귀속 / 2025 귀속, 현행 / 개정안)으로
+다시 정산하고 calc_year_end_tax() 결과 키별 차이(after - before)를 직원별로 돌려줍니다.
+
+두 규칙에 공통인 부분(total_calculator.prepare_settlement_batch: 입력 열 변환,
+연금보험료/보험료 소득공제, 카드+기타 합계, 특별세액공제 합계, 총급여액 0 이하 가드)은
+한 번만 계산하고, 규칙별 단계(settle_prepared_batch)만 규칙마다 실행합니다.
+결과는 규칙별로 calc_year_end_tax_batch()와 원소별로 같습니다.
+과세연도 규칙은 tax_rules.RULE_MODULES에 등록된 constants_YYYY.py를 사용합니다.
+
+Usage:
+    diff = resettle_batch(inputs, load_rules(2024), load_rules(2025))
+    diff["diff"]["refund_amount"]  # 직원별 환급액 차이 (음수 = 추가 환급)
+
+    python resettlement.py employees.csv -o amended.csv --from-year 2024 --to-year 2025 \\
+        --id-column employee_id --only-changed
+"""
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from records import RESULT_KEYS, TaxpayerInput
+from settlement_stream import detect_format, iter_rows, parse_employee, write_rows
+from tax_rules import DEFAULT_TAX_YEAR, TaxRules, available_years, load_rules
+from total_calculator import (
+    BOOL_FIELDS,
+    COLUMN_FIELDS,
+    batch_columns,
+    prepare_settlement_batch,
+    settle_prepared_batch,
+)
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def resettle_batch(inputs: dict, before: TaxRules, after: TaxRules) -> dict:
+    """두 과세연도 규칙으로 재정산한 결과와 결과 키별 차이 (직원 배열).
+
+    Args:
+        inputs: calc_year_end_tax_batch() 인자 dict (직원별 배열/스칼라, birth_orders는 행별 목록)
+        before: 기존 정산 규칙 (e.g., load_rules(2024))
+        after: 재정산 규칙 (e.g., load_rules(2025))
+
+    Returns:
+        dict:
+            before: RESULT_KEYS 각 키 -> before 규칙 결과 (int64)
+            after: RESULT_KEYS 각 키 -> after 규칙 결과 (int64)
+            diff: RESULT_KEYS 각 키 -> after - before (int64)
+            changed: 결과 키 중 하나라도 다른 직원 여부 (bool)
+    """
+    salary = np.atleast_1d(np.asarray(inputs["total_salary"], dtype=np.int64))
+    prepared = prepare_settlement_batch(
+        batch_columns({**inputs, "total_salary": salary}, salary.shape[0]),
+        inputs.get("birth_orders"),
+    )
+    before_result = settle_prepared_batch(prepared, before)
+    after_result = before_result if after is before else settle_prepared_batch(prepared, after)
+
+    diff = {key: after_result[key] - before_result[key] for key in RESULT_KEYS}
+    changed = np.zeros(salary.shape[0], dtype=bool)
+    for values in diff.values():
+        changed |= values != 0
+    return {"before": before_result, "after": after_result, "diff": diff, "changed": changed}
+
+
+def columns_from_employees(employees: list[dict]) -> dict:
+    """calc_year_end_tax() 인자 dict 목록 -> resettle_batch() 입력 열 (없는 값은 기본값)."""
+    taxpayers = [TaxpayerInput.from_kwargs(**kwargs) for kwargs in employees]
+    columns = {
+        name: np.array(
+            [getattr(taxpayer, name) for taxpayer in taxpayers],
+            dtype=bool if name in BOOL_FIELDS else np.int64,
+        )
+        for name in COLUMN_FIELDS
+    }
+    columns["birth_orders"] = [list(taxpayer.birth_orders) for taxpayer in taxpayers]
+    return columns
+
+
+def diff_fieldnames(id_column: str | None = None) -> list[str]:
+    """차이 출력 열 순서 (식별 열 + changed + RESULT_KEYS 차이)."""
+    return ([id_column] if id_column else []) + ["changed"] + list(RESULT_KEYS)
+
+
+def _diff_rows(rows, before, after, id_column, only_changed, chunk_size):
+    """입력 행을 chunk_size명씩 재정산하여 직원별 차이 행을 낸다."""
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        employees = []
+        for line_number, row in enumerate(chunk, start=start + 1):
+            try:
+                employees.append(parse_employee(row))
+            except ValueError as error:
+                raise ValueError(f"{line_number}번째 행: {error}") from error
+        result = resettle_batch(columns_from_employees(employees), before, after)
+        for index, row in enumerate(chunk):
+            changed = bool(result["changed"][index])
+            if only_changed and not changed:
+                continue
+            output = {id_column: row.get(id_column)} if id_column else {}
+            output["changed"] = changed
+            output.update({key: int(result["diff"][key][index]) for key in RESULT_KEYS})
+            yield output
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="과세연도 간 재정산 차이 (경정청구)")
+    parser.add_argument("input", type=Path, help="직원 입력 파일 (.csv 또는 .jsonl)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="차이 파일 (.csv/.jsonl), '-'는 표준출력 (기본, 입력 형식)")
+    parser.add_argument("--from-year", type=int, choices=available_years(), required=True,
+                        help="기존 정산 과세연도 규칙")
+    parser.add_argument("--to-year", type=int, choices=available_years(),
+                        default=DEFAULT_TAX_YEAR,
+                        help=f"재정산 과세연도 규칙 (기본: {DEFAULT_TAX_YEAR})")
+    parser.add_argument("--id-column", default=None,
+                        help="결과에 그대로 옮겨 쓸 직원 식별 열 (e.g., employee_id)")
+    parser.add_argument("--only-changed", action="store_true",
+                        help="결과가 달라진 직원만 출력")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"한 번에 재정산할 직원 수 (기본: {DEFAULT_CHUNK_SIZE})")
+    args = parser.parse_args(argv)
+    if args.chunk_size <= 0:
+        parser.error("--chunk-size는 1 이상이어야 합니다")
+
+    input_format = detect_format(args.input)
+    output_format = input_format if args.output == "-" else detect_format(Path(args.output))
+    with open(args.input, encoding="utf-8", newline="") as handle:
+        rows = list(iter_rows(handle, input_format))
+
+    diff_rows = _diff_rows(
+        rows, load_rules(args.from_year), load_rules(args.to_year),
+        args.id_column, args.only_changed, args.chunk_size,
+    )
+    sink = (
+        sys.stdout if args.output == "-"
+        else open(args.output, "w", encoding="utf-8", newline="")
+    )
+    try:
+        count = write_rows(sink, diff_rows, output_format, diff_fieldnames(args.id_column))
+    finally:
+        if sink is not sys.stdout:
+            sink.close()
+    print(
+        f"{len(rows):,}명 재정산 ({args.from_year} -> {args.to_year}), {count:,}행 출력",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
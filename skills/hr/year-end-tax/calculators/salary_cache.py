@@ -0,0 +1,246 @@
+"""
+총급여액 파생값 LRU 캐시
+
+근로소득공제, 근로소득세액공제 한도, 신용카드 최저사용금액/기본한도,
+의료비 기준금액(3%), 연금계좌/월세 공제율처럼 총급여액과 과세연도 규칙만으로
+정해지는 값을 (규칙 객체, 총급여액) 키로 한 번만 계산하여 재사용합니다.
+규칙 버전 문자열이 아니라 TaxRules 객체 자체를 키로 쓰므로, 같은 데이터 파일 상수를 고쳐 만든
+개정안 TaxRules(RULES_VERSION이 같음)도 현행 규칙과 캐시를 공유하지 않습니다.
+급여가 호봉 단위로 몰려 있으면 같은 총급여액이 반복되므로 대부분 캐시 적중입니다.
+
+스칼라 계산기(서비스 경로)는 salary_profile(), 배치 계산기는 salary_profiles_batch()로
+같은 캐시(SALARY_CACHE)를 공유합니다. 적중/실패 통계는 SALARY_CACHE.stats()로 확인합니다.
+"""
+from collections import OrderedDict, namedtuple
+from dataclasses import dataclass, fields
+from threading import Lock
+
+try:
+    import numpy as np
+except ImportError:  # numpy는 salary_profiles_batch에서만 필요
+    np = None
+
+from fixed_point import apply_rate
+
+DEFAULT_MAXSIZE = 4_096
+
+CacheStats = namedtuple("CacheStats", ["hits", "misses", "size", "maxsize"])
+
+
+@dataclass(frozen=True, slots=True)
+class SalaryProfile:
+    """총급여액 1개에 대한 파생값 (모두 총급여액 + 규칙만으로 결정)."""
+
+    earned_income_deduction: int  # 근로소득공제 [p.94]
+    earned_income_amount: int  # 근로소득금액 [p.94]
+    earned_income_tax_credit_limit: int  # 근로소득세액공제 한도 [p.162]
+    card_minimum_usage: int  # 신용카드 최저사용금액 (총급여 x 25%) [p.131]
+    card_basic_limit: int  # 신용카드 기본 공제 한도 [p.131]
+    medical_threshold: int  # 의료비 기준금액 (총급여 x 3%) [p.172]
+    pension_rate: float  # 연금계좌 세액공제율 (5,500만원 기준) [p.164]
+    rent_rate: float  # 월세 세액공제율 (8천만원 초과는 0) [p.202]
+
+
+PROFILE_FIELDS = tuple(field.name for field in fields(SalaryProfile))
+
+
+class SalaryCache:
+    """(규칙 객체, 총급여액) -> SalaryProfile LRU 캐시 (스레드 안전).
+
+    Attributes:
+        maxsize: 최대 보관 항목 수 (초과 시 가장 오래 쓰지 않은 항목부터 제거)
+    """
+
+    __slots__ = ("maxsize", "_entries", "_hits", "_misses", "_lock")
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """
+        Raises:
+            ValueError: maxsize가 1 미만인 경우
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize는 1 이상이어야 합니다")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, total_salary: int, rules) -> SalaryProfile:
+        """캐시된 파생값을 반환하고, 없으면 계산하여 보관한다."""
+        key = (rules, total_salary)
+        with self._lock:
+            profile = self._entries.get(key)
+            if profile is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return profile
+            self._misses += 1
+
+        profile = _build_profile(total_salary, rules)
+        self._store(key, profile)
+        return profile
+
+    def get_many(self, salaries, rules) -> list:
+        """여러 총급여액의 파생값 (실패분은 배치 계산기로 한 번에 계산).
+
+        Args:
+            salaries: 중복 없는 총급여액 시퀀스
+            rules: 과세연도 세법 규칙
+
+        Returns:
+            salaries 순서의 SalaryProfile 리스트
+        """
+        profiles = []
+        missing = []
+        with self._lock:
+            for index, total_salary in enumerate(salaries):
+                key = (rules, total_salary)
+                profile = self._entries.get(key)
+                if profile is None:
+                    missing.append(index)
+                else:
+                    self._entries.move_to_end(key)
+                profiles.append(profile)
+            self._hits += len(profiles) - len(missing)
+            self._misses += len(missing)
+
+        if missing:
+            built = _build_profiles_batch([salaries[index] for index in missing], rules)
+            for index, profile in zip(missing, built):
+                profiles[index] = profile
+                self._store((rules, salaries[index]), profile)
+        return profiles
+
+    def stats(self) -> CacheStats:
+        """(적중, 실패, 현재 크기, 최대 크기)."""
+        with self._lock:
+            return CacheStats(self._hits, self._misses, len(self._entries), self.maxsize)
+
+    def clear(self) -> None:
+        """항목과 통계를 모두 지운다."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def _store(self, key, profile: SalaryProfile) -> None:
+        with self._lock:
+            self._entries[key] = profile
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+# 스칼라/배치 계산기가 공유하는 프로세스 전역 캐시
+SALARY_CACHE = SalaryCache()
+
+
+def salary_profile(
+    total_salary: int, rules=None, cache: SalaryCache | None = None
+) -> SalaryProfile:
+    """총급여액 파생값 (캐시 경유).
+
+    Args:
+        total_salary: 총급여액 (원)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+        cache: 사용할 캐시 (기본: SALARY_CACHE)
+    """
+    if rules is None:
+        from tax_rules import load_rules
+        rules = load_rules()
+    return (SALARY_CACHE if cache is None else cache).get(total_salary, rules)
+
+
+def salary_profiles_batch(total_salary, rules=None, cache: SalaryCache | None = None) -> dict:
+    """총급여액 배열의 파생값 열 (중복 급여는 한 번만 조회/계산).
+
+    고유 총급여액 수가 캐시 크기보다 많으면 캐시를 거치지 않고
+    고유값에 대해서만 배치 계산한다 (캐시 내용 보존).
+
+    Args:
+        total_salary: 총급여액 배열 (원)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+        cache: 사용할 캐시 (기본: SALARY_CACHE)
+
+    Returns:
+        dict: PROFILE_FIELDS 각 이름 -> total_salary와 같은 길이의 배열
+    """
+    if rules is None:
+        from tax_rules import load_rules
+        rules = load_rules()
+    cache = SALARY_CACHE if cache is None else cache
+
+    salary = np.atleast_1d(np.asarray(total_salary, dtype=np.int64))
+    unique, inverse = np.unique(salary, return_inverse=True)
+
+    if unique.size > cache.maxsize:
+        columns = _profile_columns_batch(unique, rules)
+    else:
+        profiles = cache.get_many(unique.tolist(), rules)
+        columns = {
+            name: np.array([getattr(profile, name) for profile in profiles])
+            for name in PROFILE_FIELDS
+        }
+    return {name: column[inverse] for name, column in columns.items()}
+
+
+def _build_profile(total_salary: int, rules) -> SalaryProfile:
+    """캐시 실패 시 스칼라 계산기 내부 함수로 파생값을 계산한다."""
+    from card_deduction import _calc_basic_limit, _calc_minimum_usage
+    from housing_deduction import _rent_credit_rate
+    from income_tax import _calc_credit_limit, _calc_earned_income_deduction
+    from medical_deduction import _calc_threshold
+    from pension_deduction import _pension_credit_rate
+
+    earned_income_deduction = _calc_earned_income_deduction(total_salary, rules)
+    return SalaryProfile(
+        earned_income_deduction=earned_income_deduction,
+        earned_income_amount=total_salary - earned_income_deduction,
+        earned_income_tax_credit_limit=_calc_credit_limit(total_salary, rules),
+        card_minimum_usage=_calc_minimum_usage(total_salary, rules),
+        card_basic_limit=_calc_basic_limit(total_salary, rules),
+        medical_threshold=_calc_threshold(total_salary, rules),
+        pension_rate=_pension_credit_rate(total_salary, rules),
+        rent_rate=_rent_credit_rate(total_salary, rules),
+    )
+
+
+def _build_profiles_batch(salaries, rules) -> list:
+    """캐시 실패분을 배치 계산기로 한 번에 계산한다."""
+    columns = _profile_columns_batch(np.asarray(salaries, dtype=np.int64), rules)
+    values = [columns[name].tolist() for name in PROFILE_FIELDS]
+    return [SalaryProfile(*row) for row in zip(*values)]
+
+
+def _profile_columns_batch(salary, rules) -> dict:
+    """PROFILE_FIELDS 각 이름 -> 배열 (_build_profile과 동일한 값)."""
+    from card_deduction import calc_basic_limit_batch
+    from income_tax import _calc_credit_limit_batch, calc_earned_income_deduction_batch
+
+    earned_income_deduction = calc_earned_income_deduction_batch(salary, rules)
+    return {
+        "earned_income_deduction": earned_income_deduction,
+        "earned_income_amount": salary - earned_income_deduction,
+        "earned_income_tax_credit_limit": _calc_credit_limit_batch(salary, rules),
+        "card_minimum_usage": apply_rate(salary, rules.CARD_MINIMUM_USAGE_RATE, rules),
+        "card_basic_limit": calc_basic_limit_batch(salary, rules),
+        "medical_threshold": apply_rate(salary, rules.MEDICAL_THRESHOLD_RATE, rules),
+        "pension_rate": np.where(
+            salary <= rules.PENSION_SALARY_THRESHOLD,
+            rules.PENSION_RATE_LOW_SALARY,
+            rules.PENSION_RATE_HIGH_SALARY,
+        ),
+        "rent_rate": np.where(
+            salary > rules.RENT_CREDIT_SALARY_LIMIT,
+            0.0,
+            np.where(
+                salary <= rules.RENT_CREDIT_SALARY_THRESHOLD,
+                rules.RENT_CREDIT_RATE_LOW,
+                rules.RENT_CREDIT_RATE_HIGH,
+            ),
+        ),
+    }
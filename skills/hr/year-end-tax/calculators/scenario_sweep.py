@@ -0,0 +1,79 @@
+"""
+연말정산 what-if 격자 계산 (scenario sweep)
+
+직원 1명의 기본 입력에 "연금저축 x 카드공제 x 의료비 세액공제" 같은 변동 축을 주면
+모든 조합의 연말정산 결과를 축 순서의 다차원 배열(텐서)로 돌려줍니다.
+
+calc_year_end_tax()를 조합마다 부르면 근로소득공제/인적공제처럼 고정 입력에만
+의존하는 단계도 매번 다시 계산합니다. sweep()은 calc_year_end_tax_batch()의 두 단계
+(total_calculator.prepare_settlement_batch / settle_prepared_batch)에
+축 방향으로만 늘린 배열(open mesh)을 넣으므로, 각 단계는 실제로 의존하는 축의
+크기만큼만 계산되고(고정 입력뿐이면 1번) 나머지는 브로드캐스트로 격자 전체에 퍼집니다.
+  - 근로소득공제/근로소득금액/세액공제 한도: total_salary 축이 없으면 1번
+  - 인적공제: num_dependents 등 인적공제 입력 축만큼
+  - 과세표준 이후: 소득공제 입력 축들의 곱만큼, 세액공제는 마지막 합산에서만 격자 전체
+
+결과는 calc_year_end_tax_batch()와 원소별로 같습니다 (총급여액 0 이하 가드 포함).
+
+Usage:
+    grid = sweep(
+        dict(total_salary=65_400_000, num_dependents=4, prepaid_tax=1_000_000),
+        dict(pension_savings=range(0, 6_000_001, 120_000),
+             card_deduction=range(0, 5_000_001, 100_000),
+             medical_tax_credit=range(0, 1_000_001, 50_000)),
+    )
+    grid["refund_amount"].shape  # (51, 51, 21)
+"""
+import numpy as np
+
+from records import RESULT_KEYS, TaxpayerInput
+from tax_rules import TaxRules, load_rules
+from total_calculator import (
+    COLUMN_FIELDS,
+    batch_columns,
+    prepare_settlement_batch,
+    settle_prepared_batch,
+)
+
+# 축으로 줄 수 있는 입력 (birth_orders는 행별 목록이라 고정 입력만 허용)
+SWEEP_FIELDS = COLUMN_FIELDS
+
+
+def sweep(base: dict, axes: dict, rules: TaxRules | None = None) -> dict:
+    """기본 입력 + 변동 축의 모든 조합에 대한 연말정산 결과 텐서.
+
+    Args:
+        base: calc_year_end_tax() 인자 dict (고정 입력, total_salary/num_dependents 필수)
+        axes: 입력 이름 -> 값 목록 (SWEEP_FIELDS, dict 순서가 텐서 축 순서). base보다 우선
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        dict: RESULT_KEYS 각 키 -> 모양 (len(축1), len(축2), ...)의 int64 배열
+              (축에 의존하지 않는 값은 읽기 전용 브로드캐스트 뷰)
+
+    Raises:
+        ValueError: 축 이름이 SWEEP_FIELDS에 없거나 빈 축
+    """
+    if rules is None:
+        rules = load_rules()
+    unknown = [name for name in axes if name not in SWEEP_FIELDS]
+    if unknown:
+        raise ValueError(f"축으로 줄 수 없는 입력입니다: {', '.join(unknown)}")
+
+    taxpayer = TaxpayerInput.from_kwargs(**{**base, **dict.fromkeys(axes, 0)})
+    shape = tuple(len(values) for values in axes.values())
+    if 0 in shape:
+        raise ValueError("빈 축이 있습니다")
+
+    # 마지막 축은 직원 1명 (출생순위 행 1개와 맞춤)
+    inputs = {name: getattr(taxpayer, name) for name in SWEEP_FIELDS}
+    inputs["total_salary"] = [taxpayer.total_salary]
+    for position, (name, values) in enumerate(axes.items()):
+        view = [1] * (len(shape) + 1)
+        view[position] = -1
+        inputs[name] = np.asarray(list(values)).reshape(view)
+
+    birth_orders = [list(taxpayer.birth_orders)] if taxpayer.birth_orders else None
+    prepared = prepare_settlement_batch(batch_columns(inputs), birth_orders)
+    result = settle_prepared_batch(prepared, rules)
+    return {key: np.broadcast_to(result[key], (*shape, 1))[..., 0] for key in RESULT_KEYS}
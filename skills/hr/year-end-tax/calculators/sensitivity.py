@@ -0,0 +1,137 @@
+"""
+직원별 환급액 민감도 보고서 (어느 입력이 환급액을 가장 크게 움직이나)
+
+정산 검토 기간에 "어느 영수증이 빠진 게 가장 아픈가?"에 답합니다.
+calc_year_end_tax_batch() 결과에서 각 직원에게 걸려 있는 구간/한도를 읽어
+금액 입력별 refund_amount의 편미분(기울기)을 해석적으로 구합니다 (입력별 재계산 없음).
+
+refund_amount = 결정세액 - 기납부세액이므로 모든 기울기는 0 이하입니다 (음수 = 환급 증가).
+
+  - 소득공제 입력 (국민연금, 건강/장기요양/고용보험, 주택자금, 카드, 기타):
+      -기본세율 x (1 - 근로소득세액공제 기울기)
+      과세표준 0원, 결정세액 0원, 카드/기타는 종합한도(2,500만원) 도달 시 0
+  - 근로소득세액공제 기울기: 산출세액 130만원 이하 55%, 초과 30%, 한도에 걸리면 0
+  - 연금저축/퇴직연금: -공제율(15%/12%), 연금저축 600만원/합산 900만원 한도 도달 시 0
+  - 세액공제 입력 (보험료/의료비/교육비/기부금/기타): -1
+  - 결정세액 0원인 직원은 모두 0
+
+구간 안에서의 정확한 기울기이며, 원 미만 절사(int())와 구간 경계 통과는 반영하지 않습니다.
+인원수/여부 입력과 총급여액/기납부세액은 영수증 금액이 아니므로 대상에서 제외합니다.
+
+Usage:
+    report = calc_refund_sensitivity_batch(inputs, unit=100_000)
+    report["medical_tax_credit"]  # 의료비 세액공제 10만원 추가 시 refund_amount 변화
+    [SENSITIVITY_FIELDS[k] for k in report["ranking"][0]]  # 첫 직원의 입력 순위
+"""
+import numpy as np
+
+from income_tax import calc_marginal_tax_rate_batch
+from tax_rules import TaxRules, load_rules
+from total_calculator import calc_year_end_tax_batch
+
+# 과세표준을 줄이는 소득공제 입력
+INCOME_DEDUCTION_FIELDS = (
+    "national_pension",
+    "health_insurance",
+    "long_term_care",
+    "employment_insurance",
+    "housing_loan_deduction",
+    "card_deduction",
+    "other_income_deductions",
+)
+
+# 결정세액을 직접 줄이는 세액공제 입력
+TAX_CREDIT_FIELDS = (
+    "pension_savings",
+    "retirement_pension",
+    "insurance_tax_credit",
+    "medical_tax_credit",
+    "education_tax_credit",
+    "donation_tax_credit",
+    "other_tax_credits",
+)
+
+SENSITIVITY_FIELDS = INCOME_DEDUCTION_FIELDS + TAX_CREDIT_FIELDS
+
+# 종합한도(2,500만원)에 합산되는 소득공제
+_LIMITED_FIELDS = ("card_deduction", "other_income_deductions")
+
+
+def calc_refund_sensitivity_batch(
+    inputs: dict,
+    unit: int = 100_000,
+    rules: TaxRules | None = None,
+) -> dict:
+    """입력별 refund_amount 한계 변화와 영향 순위 (직원 배열).
+
+    Args:
+        inputs: calc_year_end_tax_batch() 인자 dict (직원별 배열/스칼라)
+        unit: 입력 증가 단위 (원, 기본 10만원)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        dict (직원 수 길이 배열):
+            refund_amount: 현재 환급(-)/추가납부(+) 금액 (int64)
+            marginal_tax_rate: 소득공제 1원당 결정세액 감소액 (float64)
+            <SENSITIVITY_FIELDS 각 입력>: unit원 증가 시 refund_amount 변화 (float64, 0 이하)
+            ranking: (직원 수, len(SENSITIVITY_FIELDS)) SENSITIVITY_FIELDS 인덱스,
+                     환급액을 크게 늘리는 입력부터 (같으면 SENSITIVITY_FIELDS 순서)
+            top_input: 가장 영향이 큰 입력 이름 (영향이 없으면 "")
+    """
+    if rules is None:
+        rules = load_rules()
+
+    result = calc_year_end_tax_batch(**inputs, rules=rules)
+    salary = result["total_salary"]
+    size = salary.shape[0]
+
+    def column(name):
+        return np.broadcast_to(np.asarray(inputs.get(name, 0), dtype=np.int64), (size,))
+
+    active = result["determined_tax"] > 0
+    tax_rate = calc_marginal_tax_rate_batch(
+        result["taxable_income"],
+        result["calculated_tax"],
+        salary,
+        result["earned_income_tax_credit"],
+        rules,
+    )
+    tax_rate = np.where(active, tax_rate, 0.0)
+    limited = (
+        column("card_deduction") + column("other_income_deductions")
+        >= rules.TOTAL_DEDUCTION_LIMIT
+    )
+
+    report = {"refund_amount": result["refund_amount"], "marginal_tax_rate": tax_rate}
+    for name in INCOME_DEDUCTION_FIELDS:
+        slope = np.where(limited, 0.0, tax_rate) if name in _LIMITED_FIELDS else tax_rate
+        report[name] = -slope * unit
+
+    savings_slope, retirement_slope = _pension_slopes(
+        salary, column("pension_savings"), column("retirement_pension"), rules,
+    )
+    credit = np.where(active, 1.0, 0.0)
+    report["pension_savings"] = -savings_slope * credit * unit
+    report["retirement_pension"] = -retirement_slope * credit * unit
+    for name in TAX_CREDIT_FIELDS[2:]:
+        report[name] = -credit * unit
+
+    effects = np.stack([report[name] for name in SENSITIVITY_FIELDS], axis=1)
+    ranking = np.argsort(effects, axis=1, kind="stable")
+    top = np.asarray(SENSITIVITY_FIELDS)[ranking[:, 0]]
+    report["ranking"] = ranking
+    report["top_input"] = np.where(effects.min(axis=1) < 0, top, "")
+    return report
+
+
+def _pension_slopes(salary, pension_savings, retirement_pension, rules):
+    """연금저축/퇴직연금 1원당 연금계좌 세액공제 증가분 [p.164]."""
+    rate = np.where(
+        salary <= rules.PENSION_SALARY_THRESHOLD,
+        float(rules.PENSION_RATE_LOW_SALARY),
+        float(rules.PENSION_RATE_HIGH_SALARY),
+    )
+    savings_eligible = np.minimum(pension_savings, rules.PENSION_SAVINGS_LIMIT)
+    total_open = savings_eligible + retirement_pension < rules.PENSION_TOTAL_LIMIT
+    savings_open = (pension_savings < rules.PENSION_SAVINGS_LIMIT) & total_open
+    return np.where(savings_open, rate, 0.0), np.where(total_open, rate, 0.0)
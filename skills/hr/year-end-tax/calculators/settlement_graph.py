@@ -0,0 +1,349 @@
+"""
+증분 재계산 연말정산 그래프
+
+total_calculator의 Step 1~11을 이름 있는 노드(근로소득금액, 인적공제, 과세표준,
+산출세액, 각 세액공제, 결정세액 등)의 의존 그래프로 표현합니다.
+입력 항목 하나를 바꾸면 그 항목에 의존하는 노드만 다시 계산하고,
+다시 계산했는데 값이 그대로인 노드의 하위 노드는 건너뜁니다.
+update()는 실제로 다시 계산한 노드 이름을 반환하므로
+마법사/HR 포털에서 항목 하나를 고칠 때의 작업량을 확인할 수 있습니다.
+
+결과는 calc_year_end_tax()와 항상 같습니다 (총급여액 0 이하 가드 포함).
+
+Usage:
+    graph = SettlementGraph(TaxpayerInput(total_salary=65_400_000, num_dependents=4))
+    graph.update(medical_tax_credit=950_700)
+    # -> ('special_tax_credit', 'total_tax_credit', 'determined_tax', 'refund_amount')
+    graph.result().refund_amount
+"""
+import dataclasses
+from collections import namedtuple
+
+from income_tax import (
+    calc_taxable_income,
+    calc_calculated_tax,
+    calc_earned_income_tax_credit,
+)
+from personal_deduction import (
+    calc_basic_personal_deduction,
+    calc_additional_deduction,
+    calc_child_tax_credit,
+)
+from insurance_deduction import calc_insurance_income_deduction
+from pension_deduction import calc_pension_insurance_deduction, calc_pension_tax_credit
+from records import INPUT_FIELDS, RESULT_KEYS, SettlementResult, TaxpayerInput
+from salary_cache import salary_profile
+from tax_rules import TaxRules, load_rules
+from total_calculator import apply_deduction_limit
+
+# name: 노드 이름, inputs: 의존 입력 필드, deps: 의존 노드, compute(inputs, nodes, rules)
+Node = namedtuple("Node", ["name", "inputs", "deps", "compute"])
+
+
+def _salary_positive(i, n, rules):
+    # 총급여액 0 이하이면 모든 공제/세액이 0 (calc_year_end_tax 가드)
+    return i["total_salary"] > 0
+
+
+def _profile(i, n, rules):
+    return salary_profile(i["total_salary"], rules) if n["salary_positive"] else None
+
+
+def _personal_deduction(i, n, rules):
+    if not n["salary_positive"]:
+        return 0
+    return calc_basic_personal_deduction(i["num_dependents"], rules) + calc_additional_deduction(
+        elderly_count=i["elderly_count"],
+        disabled_count=i["disabled_count"],
+        is_single_parent=i["is_single_parent"],
+        is_woman_deduction=i["is_woman_deduction"],
+        rules=rules,
+    )
+
+
+def _pension_insurance_deduction(i, n, rules):
+    if not n["salary_positive"]:
+        return 0
+    return calc_pension_insurance_deduction(i["national_pension"])
+
+
+def _insurance_income_deduction(i, n, rules):
+    if not n["salary_positive"]:
+        return 0
+    return calc_insurance_income_deduction(
+        health_insurance=i["health_insurance"],
+        long_term_care=i["long_term_care"],
+        employment_insurance=i["employment_insurance"],
+    )
+
+
+def _limited_card_and_other(i, n, rules):
+    if not n["salary_positive"]:
+        return 0
+    return apply_deduction_limit(i["card_deduction"], i["other_income_deductions"], rules)
+
+
+def _taxable_income(i, n, rules):
+    total_deductions = n["total_income_deduction"] + n["limited_card_and_other"]
+    return calc_taxable_income(n["earned_income_amount"], total_deductions)
+
+
+def _earned_income_tax_credit(i, n, rules):
+    if not n["salary_positive"]:
+        return 0
+    return calc_earned_income_tax_credit(n["calculated_tax"], i["total_salary"], rules)
+
+
+def _child_tax_credit(i, n, rules):
+    if not n["salary_positive"]:
+        return 0
+    return calc_child_tax_credit(
+        children_over_8=i["children_over_8"],
+        birth_orders=list(i["birth_orders"]) or None,
+        rules=rules,
+    )
+
+
+def _pension_tax_credit(i, n, rules):
+    if not n["salary_positive"]:
+        return 0
+    return calc_pension_tax_credit(
+        total_salary=i["total_salary"],
+        pension_savings=i["pension_savings"],
+        retirement_pension=i["retirement_pension"],
+        rules=rules,
+    )
+
+
+def _special_tax_credit(i, n, rules):
+    if not n["salary_positive"]:
+        return 0
+    return (
+        i["insurance_tax_credit"]
+        + i["medical_tax_credit"]
+        + i["education_tax_credit"]
+        + i["donation_tax_credit"]
+    )
+
+
+def _total_tax_credit(i, n, rules):
+    other_tax_credits = i["other_tax_credits"] if n["salary_positive"] else 0
+    return (
+        n["earned_income_tax_credit"]
+        + n["child_tax_credit"]
+        + n["pension_tax_credit"]
+        + n["special_tax_credit"]
+        + other_tax_credits
+    )
+
+
+def _guarded_input(field):
+    """입력값을 그대로 쓰되 총급여액 0 이하이면 0인 노드."""
+    def compute(i, n, rules):
+        return i[field] if n["salary_positive"] else 0
+    return compute
+
+
+def _profile_field(field):
+    """총급여액 파생값 중 하나 (총급여액 0 이하이면 0)인 노드."""
+    def compute(i, n, rules):
+        profile = n["salary_profile"]
+        return getattr(profile, field) if profile is not None else 0
+    return compute
+
+
+# 위상 정렬 순서 (각 노드의 deps는 앞에 정의됨)
+NODES = (
+    Node("salary_positive", ("total_salary",), (), _salary_positive),
+    Node(
+        "total_salary", ("total_salary",), ("salary_positive",), _guarded_input("total_salary"),
+    ),
+    Node("salary_profile", ("total_salary",), ("salary_positive",), _profile),
+    # Step 1: 근로소득공제 및 근로소득금액
+    Node(
+        "earned_income_deduction", (), ("salary_profile",),
+        _profile_field("earned_income_deduction"),
+    ),
+    Node("earned_income_amount", (), ("salary_profile",), _profile_field("earned_income_amount")),
+    # Step 2~4: 인적공제, 연금보험료/보험료 소득공제
+    Node(
+        "personal_deduction",
+        ("num_dependents", "elderly_count", "disabled_count", "is_single_parent",
+         "is_woman_deduction"),
+        ("salary_positive",),
+        _personal_deduction,
+    ),
+    Node(
+        "pension_insurance_deduction", ("national_pension",), ("salary_positive",),
+        _pension_insurance_deduction,
+    ),
+    Node(
+        "insurance_income_deduction",
+        ("health_insurance", "long_term_care", "employment_insurance"),
+        ("salary_positive",),
+        _insurance_income_deduction,
+    ),
+    Node(
+        "housing_deduction", ("housing_loan_deduction",), ("salary_positive",),
+        _guarded_input("housing_loan_deduction"),
+    ),
+    Node(
+        "card_deduction", ("card_deduction",), ("salary_positive",),
+        _guarded_input("card_deduction"),
+    ),
+    # Step 5: 소득공제 합계 (카드공제 및 기타 제외)
+    Node(
+        "total_income_deduction", (),
+        ("personal_deduction", "pension_insurance_deduction", "insurance_income_deduction",
+         "housing_deduction"),
+        lambda i, n, rules: (
+            n["personal_deduction"]
+            + n["pension_insurance_deduction"]
+            + n["insurance_income_deduction"]
+            + n["housing_deduction"]
+        ),
+    ),
+    # Step 6: 소득공제 종합한도 적용 (카드 + 기타)
+    Node(
+        "limited_card_and_other", ("card_deduction", "other_income_deductions"),
+        ("salary_positive",), _limited_card_and_other,
+    ),
+    # Step 7~8: 과세표준, 산출세액
+    Node(
+        "taxable_income", (),
+        ("earned_income_amount", "total_income_deduction", "limited_card_and_other"),
+        _taxable_income,
+    ),
+    Node(
+        "calculated_tax", (), ("taxable_income",),
+        lambda i, n, rules: calc_calculated_tax(n["taxable_income"], rules),
+    ),
+    # Step 9: 세액공제
+    Node(
+        "earned_income_tax_credit", ("total_salary",), ("salary_positive", "calculated_tax"),
+        _earned_income_tax_credit,
+    ),
+    Node(
+        "child_tax_credit", ("children_over_8", "birth_orders"), ("salary_positive",),
+        _child_tax_credit,
+    ),
+    Node(
+        "pension_tax_credit", ("total_salary", "pension_savings", "retirement_pension"),
+        ("salary_positive",), _pension_tax_credit,
+    ),
+    Node(
+        "special_tax_credit",
+        ("insurance_tax_credit", "medical_tax_credit", "education_tax_credit",
+         "donation_tax_credit"),
+        ("salary_positive",),
+        _special_tax_credit,
+    ),
+    Node(
+        "total_tax_credit", ("other_tax_credits",),
+        ("salary_positive", "earned_income_tax_credit", "child_tax_credit",
+         "pension_tax_credit", "special_tax_credit"),
+        _total_tax_credit,
+    ),
+    # Step 10~11: 결정세액, 환급/추가납부
+    Node(
+        "determined_tax", (), ("calculated_tax", "total_tax_credit"),
+        lambda i, n, rules: max(0, n["calculated_tax"] - n["total_tax_credit"]),
+    ),
+    Node("prepaid_tax", ("prepaid_tax",), (), lambda i, n, rules: i["prepaid_tax"]),
+    Node(
+        "refund_amount", (), ("determined_tax", "prepaid_tax"),
+        lambda i, n, rules: n["determined_tax"] - n["prepaid_tax"],
+    ),
+)
+
+NODE_NAMES = tuple(node.name for node in NODES)
+
+
+class SettlementGraph:
+    """직원 1명의 연말정산 증분 계산 그래프.
+
+    Attributes:
+        rules: 과세연도 세법 규칙
+        last_evaluated: 직전 생성/update()에서 다시 계산한 노드 이름 (계산 순서)
+    """
+
+    __slots__ = ("rules", "last_evaluated", "_taxpayer", "_inputs", "_values")
+
+    def __init__(self, taxpayer: TaxpayerInput, rules: TaxRules | None = None):
+        """
+        Args:
+            taxpayer: 연말정산 입력 레코드
+            rules: 과세연도 세법 규칙 (기본: load_rules())
+        """
+        self.rules = load_rules() if rules is None else rules
+        self._taxpayer = taxpayer
+        self._inputs = {name: getattr(taxpayer, name) for name in INPUT_FIELDS}
+        self._values = {}
+        self.last_evaluated = self._evaluate(set(INPUT_FIELDS), full=True)
+
+    @property
+    def taxpayer(self) -> TaxpayerInput:
+        """현재 입력 레코드."""
+        return self._taxpayer
+
+    def update(self, **changes) -> tuple[str, ...]:
+        """입력 항목을 바꾸고 영향받는 노드만 다시 계산한다.
+
+        Args:
+            **changes: TaxpayerInput 필드 이름 -> 새 값 (birth_orders는 리스트 허용)
+
+        Returns:
+            다시 계산한 노드 이름 (계산 순서). 값이 그대로인 입력만 주면 빈 tuple
+
+        Raises:
+            TypeError: TaxpayerInput에 없는 필드 이름
+        """
+        if "birth_orders" in changes:
+            changes["birth_orders"] = tuple(changes["birth_orders"] or ())
+        taxpayer = dataclasses.replace(self._taxpayer, **changes)
+
+        changed = {name for name in changes if self._inputs[name] != changes[name]}
+        self._taxpayer = taxpayer
+        self._inputs.update(changes)
+        self.last_evaluated = self._evaluate(changed)
+        return self.last_evaluated
+
+    def value(self, name: str):
+        """노드 값 (e.g., 'taxable_income')."""
+        return self._values[name]
+
+    def result(self) -> SettlementResult:
+        """현재 입력의 연말정산 결과 (calc_year_end_tax()와 동일)."""
+        return SettlementResult(*(self._values[key] for key in RESULT_KEYS))
+
+    def _evaluate(self, changed_inputs: set, full: bool = False) -> tuple[str, ...]:
+        """변경 입력의 하위 노드를 위상 순서로 다시 계산한다 (값이 같으면 전파 중단)."""
+        inputs, values, rules = self._inputs, self._values, self.rules
+        changed_nodes = set()
+        evaluated = []
+        for node in NODES:
+            if not full and changed_inputs.isdisjoint(node.inputs) and changed_nodes.isdisjoint(
+                node.deps
+            ):
+                continue
+            value = node.compute(inputs, values, rules)
+            evaluated.append(node.name)
+            if full or values[node.name] != value:
+                values[node.name] = value
+                changed_nodes.add(node.name)
+        return tuple(evaluated)
+
+
+def downstream(field: str) -> tuple[str, ...]:
+    """입력 필드 하나가 바뀔 때 다시 계산될 수 있는 노드 (최대 범위, 계산 순서).
+
+    Raises:
+        KeyError: TaxpayerInput에 없는 필드 이름
+    """
+    if field not in INPUT_FIELDS:
+        raise KeyError(f"알 수 없는 입력 필드: {field}")
+    reached = set()
+    for node in NODES:
+        if field in node.inputs or not reached.isdisjoint(node.deps):
+            reached.add(node.name)
+    return tuple(name for name in NODE_NAMES if name in reached)
@@ -0,0 +1,205 @@
+"""
+스트리밍 연말정산 파이프라인 (CSV / JSON Lines)
+
+직원 행을 한 줄씩 읽어 calc_year_end_tax() 인자로 변환하고,
+결과를 한 줄씩 바로 씁니다. 모든 단계가 제너레이터로 연결되어 있어
+입력 크기와 관계없이 메모리 사용량이 일정합니다.
+표준입력/표준출력('-')을 지원하므로 Unix 파이프라인에 끼워 쓸 수 있습니다.
+
+입력 열 이름은 calc_year_end_tax()의 인자 이름과 같습니다.
+  - 빈 값/누락 열은 기본값 사용, 그 외 열은 무시
+  - is_single_parent, is_woman_deduction: true/false, 1/0, Y/N
+  - birth_orders: CSV는 "1;2" 형식, JSON Lines는 [1, 2]
+
+Usage:
+    hr_export | python settlement_stream.py - --format jsonl --id-column employee_id > results.jsonl
+    python settlement_stream.py employees.csv -o results.csv --tax-year 2024
+"""
+import argparse
+import csv
+import json
+import sys
+from pathlib import Path
+
+from records import INPUT_FIELDS
+from tax_rules import DEFAULT_TAX_YEAR, available_years, load_rules
+from total_calculator import BOOL_FIELDS, RESULT_KEYS, calc_year_end_tax
+
+LIST_FIELDS = frozenset({"birth_orders"})
+
+FORMATS = ("csv", "jsonl")
+
+
+def parse_employee(row: dict) -> dict:
+    """입력 행 1개를 calc_year_end_tax() 인자 dict로 변환한다.
+
+    Args:
+        row: 열 이름 -> 값 (CSV는 문자열, JSON Lines는 JSON 값)
+
+    Returns:
+        calc_year_end_tax(**kwargs)에 바로 넘길 수 있는 dict
+
+    Raises:
+        ValueError: 값 형식이 잘못된 경우 (메시지에 열 이름 포함)
+    """
+    kwargs = {}
+    for field in INPUT_FIELDS:
+        value = row.get(field)
+        if value is None or value == "":
+            continue
+        try:
+            if field in BOOL_FIELDS:
+                kwargs[field] = _parse_bool(value)
+            elif field in LIST_FIELDS:
+                kwargs[field] = _parse_int_list(value)
+            else:
+                kwargs[field] = _parse_int(value)
+        except ValueError as error:
+            raise ValueError(f"{field}: {error}") from error
+    return kwargs
+
+
+def _parse_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ("1", "true", "y", "yes"):
+        return True
+    if text in ("0", "false", "n", "no"):
+        return False
+    raise ValueError(f"bool 값이 아닙니다: {value!r}")
+
+
+def _parse_int(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"정수가 아닙니다: {value!r}") from None
+
+
+def _parse_int_list(value) -> list[int]:
+    if isinstance(value, list):
+        return [_parse_int(item) for item in value]
+    return [_parse_int(item) for item in str(value).split(";") if item.strip()]
+
+
+def detect_format(path: Path) -> str:
+    """파일 확장자로 형식을 판별한다 (.csv -> csv, 그 외 -> jsonl)."""
+    return "csv" if path.suffix.lower() == ".csv" else "jsonl"
+
+
+def iter_rows(handle, fmt: str):
+    """입력 스트림에서 행 dict를 한 줄씩 읽는다.
+
+    Args:
+        handle: 텍스트 입력 스트림
+        fmt: "csv" 또는 "jsonl"
+
+    Yields:
+        열 이름 -> 값 dict
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(handle)
+        return
+    for line in handle:
+        if line.strip():
+            yield json.loads(line)
+
+
+def settle_rows(rows, id_column: str | None = None, rules=None):
+    """행 스트림을 정산 결과 스트림으로 변환한다.
+
+    Args:
+        rows: 입력 행 dict의 iterable
+        id_column: 결과에 그대로 옮겨 쓸 직원 식별 열 (없으면 생략)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Yields:
+        calc_year_end_tax() 결과 dict (id_column 지정 시 맨 앞에 포함)
+
+    Raises:
+        ValueError: 행 값 형식이 잘못된 경우 (행 번호 포함, 1부터)
+    """
+    for line_number, row in enumerate(rows, start=1):
+        try:
+            kwargs = parse_employee(row)
+        except ValueError as error:
+            raise ValueError(f"{line_number}번째 행: {error}") from error
+        result = calc_year_end_tax(**kwargs, rules=rules)
+        if id_column:
+            yield {id_column: row.get(id_column), **result}
+        else:
+            yield result
+
+
+def write_rows(handle, rows, fmt: str, fieldnames) -> int:
+    """결과 행을 한 줄씩 출력 스트림에 쓴다.
+
+    Args:
+        handle: 텍스트 출력 스트림
+        rows: 결과 dict의 iterable
+        fmt: "csv" 또는 "jsonl"
+        fieldnames: CSV 헤더 열 순서
+
+    Returns:
+        쓴 행 수
+    """
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(handle, fieldnames=list(fieldnames), lineterminator="\n")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+        return count
+
+    for row in rows:
+        handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+def result_fieldnames(id_column: str | None = None) -> list[str]:
+    """결과 열 순서 (식별 열 + RESULT_KEYS)."""
+    return ([id_column] if id_column else []) + list(RESULT_KEYS)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="스트리밍 연말정산 파이프라인")
+    parser.add_argument("input", help="직원 입력 파일 (.csv/.jsonl), '-'는 표준입력")
+    parser.add_argument("-o", "--output", default="-",
+                        help="결과 파일 (.csv/.jsonl), '-'는 표준출력 (기본)")
+    parser.add_argument("--format", choices=FORMATS, default=None,
+                        help="입력 형식 (기본: 확장자, 표준입력은 csv)")
+    parser.add_argument("--output-format", choices=FORMATS, default=None,
+                        help="출력 형식 (기본: 확장자, 표준출력은 입력 형식)")
+    parser.add_argument("--id-column", default=None,
+                        help="결과에 그대로 옮겨 쓸 직원 식별 열 (e.g., employee_id)")
+    parser.add_argument("--tax-year", type=int, choices=available_years(), default=None,
+                        help=f"귀속 과세연도 (기본: {DEFAULT_TAX_YEAR})")
+    args = parser.parse_args(argv)
+
+    input_format = args.format or (
+        "csv" if args.input == "-" else detect_format(Path(args.input))
+    )
+    output_format = args.output_format or (
+        input_format if args.output == "-" else detect_format(Path(args.output))
+    )
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8", newline="")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+    try:
+        results = settle_rows(
+            iter_rows(source, input_format), args.id_column, load_rules(args.tax_year),
+        )
+        write_rows(sink, results, output_format, result_fieldnames(args.id_column))
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+과세연도별 세법 상수 (TaxRules)
+
+constants.py(당해 연도)와 constants_YYYY.py(다른 연도) 데이터 파일의 상수를
+연도별 불변 객체 TaxRules로 묶습니다. 모든 계산기는 rules 인자로 TaxRules를 받으며,
+생략하면 기본 과세연도(DEFAULT_TAX_YEAR) 규칙을 사용합니다.
+
+각 연도 데이터 파일은 load_rules(year)로 처음 요청될 때 한 번만 읽고,
+구간표(BracketTable)도 그때 한 번만 컴파일하여 같은 연도의 모든 호출이 공유합니다.
+따라서 한 프로세스에서 여러 연도(경정청구, 개정안 비교)를 동시에 계산할 수 있습니다.
+
+load_rules(year, exact=True)는 모든 공제율을 유리수로 바꾼 정확(정수) 계산 모드 규칙입니다
+(fixed_point 참고).
+
+Usage:
+    rules_2024 = load_rules(2024)
+    calc_year_end_tax(total_salary=65_400_000, num_dependents=4, rules=rules_2024)
+"""
+import importlib
+from threading import Lock
+from types import MappingProxyType
+
+from brackets import BracketTable
+from fixed_point import exact_constants
+
+DEFAULT_TAX_YEAR = 2025
+
+# 과세연도 -> 데이터 파일(모듈) 이름. 새 연도/개정안은 파일 추가 후 여기에 등록
+RULE_MODULES = {
+    2024: "constants_2024",
+    2025: "constants",
+}
+
+# 데이터 파일에 반드시 있어야 하는 상수
+REQUIRED_CONSTANTS = (
+    "TAX_YEAR",
+    "RULES_VERSION",
+    "EARNED_INCOME_DEDUCTION_BRACKETS",
+    "INCOME_TAX_BRACKETS",
+    "EARNED_INCOME_TAX_CREDIT_LIMITS",
+)
+
+_loaded: dict[tuple[int, bool], "TaxRules"] = {}
+_load_lock = Lock()
+
+
+class TaxRules:
+    """한 과세연도의 불변 세법 상수 묶음.
+
+    상수는 데이터 파일과 같은 이름의 속성으로 조회합니다
+    (e.g., rules.CARD_MINIMUM_USAGE_RATE). 리스트는 tuple, dict는 읽기 전용
+    매핑으로 변환되며, 속성 대입/삭제는 AttributeError를 발생시킵니다.
+
+    Attributes:
+        year: 과세연도 (TAX_YEAR)
+        version: 데이터 파일 버전 (RULES_VERSION, 정확 모드는 "+exact" 접미사)
+        exact: 정확(정수) 계산 모드 여부 (공제율이 Fraction)
+        rate_scale: 배치 계산 공제율 계수의 공통 분모 (기본 모드 1)
+        earned_income_deduction_table: 근로소득공제 구간표 [p.94]
+        income_tax_table: 기본세율 구간표 [p.83]
+        earned_income_tax_credit_limit_table: 근로소득세액공제 한도 구간표 [p.162]
+    """
+
+    def __init__(self, constants, exact: bool = False):
+        """
+        Args:
+            constants: 상수 이름 -> 값 매핑 (대문자 이름만 사용)
+            exact: True이면 float 공제율을 Fraction으로 바꾼 정확 계산 모드
+
+        Raises:
+            ValueError: 필수 상수가 없거나 구간표가 잘못된 경우
+        """
+        values = {name: value for name, value in constants.items() if name.isupper()}
+        missing = [name for name in REQUIRED_CONSTANTS if name not in values]
+        if missing:
+            raise ValueError(f"필수 상수가 없습니다: {', '.join(missing)}")
+
+        rate_scale = 1
+        if exact:
+            values, rate_scale = exact_constants(values)
+        values = {name: _freeze(value) for name, value in values.items()}
+
+        attributes = self.__dict__
+        attributes.update(values)
+        attributes["year"] = values["TAX_YEAR"]
+        attributes["version"] = values["RULES_VERSION"] + ("+exact" if exact else "")
+        attributes["exact"] = exact
+        attributes["rate_scale"] = rate_scale
+        attributes["earned_income_deduction_table"] = BracketTable(
+            values["EARNED_INCOME_DEDUCTION_BRACKETS"], rate_scale,
+        )
+        attributes["income_tax_table"] = BracketTable(values["INCOME_TAX_BRACKETS"], rate_scale)
+        attributes["earned_income_tax_credit_limit_table"] = BracketTable(
+            values["EARNED_INCOME_TAX_CREDIT_LIMITS"], rate_scale,
+        )
+        attributes["_constants"] = MappingProxyType(values)
+
+    @classmethod
+    def from_module(cls, module, exact: bool = False) -> "TaxRules":
+        """데이터 파일(모듈)의 대문자 상수로 생성."""
+        return cls(vars(module), exact)
+
+    @property
+    def constants(self):
+        """상수 이름 -> 값 (읽기 전용 매핑)."""
+        return self._constants
+
+    def __setattr__(self, name, value):
+        raise AttributeError("TaxRules는 변경할 수 없습니다")
+
+    def __delattr__(self, name):
+        raise AttributeError("TaxRules는 변경할 수 없습니다")
+
+    def __repr__(self) -> str:
+        return f"TaxRules(year={self.year}, version={self.version!r})"
+
+
+def load_rules(year: int | None = None, exact: bool = False) -> TaxRules:
+    """과세연도 규칙을 반환한다 (연도별 최초 1회만 데이터 파일을 읽음).
+
+    Args:
+        year: 과세연도 (기본: DEFAULT_TAX_YEAR)
+        exact: 정확(정수) 계산 모드 규칙 여부
+
+    Returns:
+        해당 연도/모드의 TaxRules (같은 연도/모드는 항상 같은 객체)
+
+    Raises:
+        KeyError: 등록되지 않은 과세연도
+        ValueError: 데이터 파일의 TAX_YEAR가 요청 연도와 다른 경우
+    """
+    if year is None:
+        year = DEFAULT_TAX_YEAR
+    key = (year, exact)
+    try:
+        return _loaded[key]
+    except KeyError:
+        pass
+
+    if year not in RULE_MODULES:
+        raise KeyError(
+            f"등록되지 않은 과세연도: {year} (가능: {', '.join(map(str, sorted(RULE_MODULES)))})"
+        )
+
+    with _load_lock:
+        if key not in _loaded:
+            rules = TaxRules.from_module(importlib.import_module(RULE_MODULES[year]), exact)
+            if rules.year != year:
+                raise ValueError(
+                    f"{RULE_MODULES[year]}의 TAX_YEAR({rules.year})가 {year}와 다릅니다"
+                )
+            _loaded[key] = rules
+    return _loaded[key]
+
+
+def available_years() -> tuple[int, ...]:
+    """등록된 과세연도 (오름차순)."""
+    return tuple(sorted(RULE_MODULES))
+
+
+def _freeze(value):
+    """리스트는 tuple로, dict는 읽기 전용 매핑으로 변환한다 (재귀)."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
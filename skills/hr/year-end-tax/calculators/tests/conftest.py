@@ -3,11 +3,50 @@ conftest.py for calculators tests.
 
 Adds the calculators directory to sys.path so tests can import
 modules despite the parent directory containing hyphens (year-end-tax).
+Also provides shared fixtures for random employee populations.
 """
 
 import sys
 from pathlib import Path
 
+import pytest
+
 _calculators_dir = str(Path(__file__).resolve().parent.parent)
 if _calculators_dir not in sys.path:
     sys.path.insert(0, _calculators_dir)
+
+
+@pytest.fixture(scope="session")
+def random_population():
+    """무작위 직원 모집단 열 dict를 만드는 함수.
+
+    random_population(seed, n, total_salary=(low, high), ...) 형식이며 열 정의는
+      - (low, high): rng.integers(low, high, n)
+      - [값, ...]: rng.choice(값 목록, n)
+      - 확률 (float): rng.random(n) < 확률 (bool 열)
+    열 순서대로 난수를 뽑으므로 같은 시드/정의면 같은 모집단이다.
+    """
+    np = pytest.importorskip("numpy")
+
+    def make(seed, n, **columns):
+        rng = np.random.default_rng(seed)
+        population = {}
+        for name, spec in columns.items():
+            if isinstance(spec, tuple):
+                population[name] = rng.integers(*spec, n)
+            elif isinstance(spec, list):
+                population[name] = rng.choice(spec, n)
+            else:
+                population[name] = rng.random(n) < spec
+        return population
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def row():
+    """열 dict의 index번째 직원 입력 (int dict)."""
+    def pick(columns, index):
+        return {name: int(column[index]) for name, column in columns.items()}
+
+    return pick
@@ -0,0 +1,111 @@
+"""
+전사 연말정산 일괄 실행기 테스트
+"""
+import csv
+import json
+
+import pytest
+
+from batch_runner import main, settle_employees
+from tax_rules import load_rules
+from total_calculator import calc_year_end_tax
+from test_data import CASE
+
+KANGMO_ROW = {
+    "employee_id": "E001",
+    "total_salary": "65400000",
+    "num_dependents": "4",
+    "national_pension": "2500000",
+    "health_insurance": "1300000",
+    "long_term_care": "400000",
+    "housing_loan_deduction": "1000000",
+    "card_deduction": "4895000",
+    "children_over_8": "1",
+    "birth_orders": "3",
+    "pension_savings": "2000000",
+    "retirement_pension": "1000000",
+    "insurance_tax_credit": "120000",
+    "medical_tax_credit": "950700",
+    "education_tax_credit": "630000",
+    "donation_tax_credit": "271818",
+    "prepaid_tax": "1000000",
+    "is_single_parent": "",
+}
+
+
+class TestSettleEmployees:
+    """병렬 정산은 입력 순서를 보존하고 스칼라 결과와 같아야 한다."""
+
+    def test_order_preserved_across_chunks(self):
+        """여러 청크/워커에 나뉘어도 입력 순서 유지."""
+        employees = [
+            {"total_salary": 20_000_000 + index * 1_000_000, "num_dependents": 1 + index % 3}
+            for index in range(25)
+        ]
+        results = settle_employees(employees, workers=2, chunk_size=4)
+        assert results == [calc_year_end_tax(**kwargs) for kwargs in employees]
+
+    def test_tax_year(self):
+        """워커는 요청된 과세연도 규칙으로 정산한다."""
+        employees = [
+            {"total_salary": 50_000_000, "num_dependents": 3, "children_over_8": index % 3}
+            for index in range(6)
+        ]
+        results = settle_employees(employees, workers=2, chunk_size=2, tax_year=2024)
+        rules = load_rules(2024)
+        assert results == [calc_year_end_tax(**kwargs, rules=rules) for kwargs in employees]
+        assert results != [calc_year_end_tax(**kwargs) for kwargs in employees]
+
+    def test_invalid_chunk_size(self):
+        """chunk_size 0 이하는 ValueError."""
+        with pytest.raises(ValueError):
+            settle_employees([], workers=1, chunk_size=0)
+
+
+class TestMain:
+    """CLI 입출력."""
+
+    def test_csv_to_csv_with_id_column(self, tmp_path, capsys):
+        """CSV 입력 -> CSV 결과 (식별 열 포함, 처리량 보고)."""
+        input_path = tmp_path / "employees.csv"
+        second = dict(KANGMO_ROW, employee_id="E002", total_salary="42000000", birth_orders="")
+        with open(input_path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.DictWriter(handle, fieldnames=list(KANGMO_ROW))
+            writer.writeheader()
+            writer.writerows([KANGMO_ROW, second])
+
+        output_path = tmp_path / "results.csv"
+        assert main([
+            str(input_path), "-o", str(output_path),
+            "--workers", "1", "--id-column", "employee_id",
+        ]) == 0
+
+        with open(output_path, encoding="utf-8") as handle:
+            rows = list(csv.DictReader(handle))
+        assert [row["employee_id"] for row in rows] == ["E001", "E002"]
+        assert int(rows[0]["refund_amount"]) == CASE["refund_amount"]
+        assert "2명 정산 완료" in capsys.readouterr().err
+
+    def test_jsonl_to_jsonl(self, tmp_path):
+        """JSON Lines 입력 -> JSON Lines 결과."""
+        input_path = tmp_path / "employees.jsonl"
+        input_path.write_text(
+            json.dumps({"total_salary": 50_000_000, "num_dependents": 1}) + "\n",
+            encoding="utf-8",
+        )
+        output_path = tmp_path / "results.jsonl"
+        main([str(input_path), "-o", str(output_path), "--workers", "1"])
+
+        result = json.loads(output_path.read_text(encoding="utf-8"))
+        assert result == calc_year_end_tax(total_salary=50_000_000, num_dependents=1)
+
+    def test_reports_line_number(self, tmp_path):
+        """형식 오류 행은 행 번호와 열 이름과 함께 ValueError."""
+        input_path = tmp_path / "employees.jsonl"
+        rows = [
+            {"total_salary": 50_000_000, "num_dependents": 1},
+            {"total_salary": "5천만원", "num_dependents": 1},
+        ]
+        input_path.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+        with pytest.raises(ValueError, match="2번째 행: total_salary"):
+            main([str(input_path), "-o", str(tmp_path / "results.jsonl"), "--workers", "1"])
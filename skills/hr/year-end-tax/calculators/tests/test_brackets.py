@@ -0,0 +1,103 @@
+"""
+구간표(BracketTable) 테스트
+
+constants.py 구간표 기준 스칼라(bisect) / 배열(np.searchsorted) 조회 검증.
+"""
+import pytest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from brackets import BracketTable
+from constants import (
+    EARNED_INCOME_DEDUCTION_BRACKETS,
+    INCOME_TAX_BRACKETS,
+)
+
+
+def _linear_find(brackets, value):
+    """기존 계산기의 선형 탐색 구간 판정."""
+    for index, (upper, *_) in enumerate(brackets):
+        if value <= upper:
+            return index
+    raise AssertionError("unreachable")
+
+
+# =============================================================================
+# 컴파일
+# =============================================================================
+class TestCompile:
+    """구간표 컴파일 검증."""
+
+    def test_lowers_are_previous_uppers(self):
+        """하한 = 직전 구간 상한 (첫 구간 0)."""
+        table = BracketTable(EARNED_INCOME_DEDUCTION_BRACKETS)
+        assert table.lowers == (0, 5_000_000, 15_000_000, 45_000_000, 100_000_000)
+
+    def test_columns(self):
+        """상한 이외의 열은 열 단위로 보관."""
+        table = BracketTable(INCOME_TAX_BRACKETS)
+        assert len(table) == 8
+        assert table.columns[0][1] == 1_260_000
+        assert table.columns[1][1] == 0.15
+
+    def test_empty_raises(self):
+        """빈 구간표."""
+        with pytest.raises(ValueError):
+            BracketTable([])
+
+    def test_unsorted_raises(self):
+        """상한이 오름차순이 아닌 경우."""
+        with pytest.raises(ValueError):
+            BracketTable([(10, 0.1), (5, 0.2), (float('inf'), 0.3)])
+
+    def test_finite_last_upper_raises(self):
+        """마지막 상한이 무한대가 아닌 경우."""
+        with pytest.raises(ValueError):
+            BracketTable([(10, 0.1), (20, 0.2)])
+
+
+# =============================================================================
+# 스칼라 조회 (bisect)
+# =============================================================================
+class TestScalarLookup:
+    """value <= 상한 인 첫 구간."""
+
+    @pytest.mark.parametrize("value", [
+        -1, 0, 1, 13_999_999, 14_000_000, 14_000_001, 50_000_000,
+        88_000_001, 1_000_000_000, 1_000_000_001,
+    ])
+    def test_find_matches_linear_scan(self, value):
+        """선형 탐색과 동일한 구간."""
+        table = BracketTable(INCOME_TAX_BRACKETS)
+        assert table.find(value) == _linear_find(INCOME_TAX_BRACKETS, value)
+
+    def test_row(self):
+        """row = (하한, 값...)."""
+        table = BracketTable(EARNED_INCOME_DEDUCTION_BRACKETS)
+        assert table.row(65_400_000) == (45_000_000, 12_000_000, 0.05)
+        assert table.row(5_000_000) == (0, 0, 0.70)
+
+
+# =============================================================================
+# 배열 조회 (np.searchsorted)
+# =============================================================================
+@pytest.mark.skipif(np is None, reason="numpy 미설치")
+class TestBatchLookup:
+    """배열 조회는 스칼라 조회와 동일."""
+
+    def test_find_batch_matches_scalar(self):
+        """경계값 포함 인덱스 일치."""
+        table = BracketTable(INCOME_TAX_BRACKETS)
+        values = np.array([0, 14_000_000, 14_000_001, 150_000_000, 2_000_000_000])
+        assert table.find_batch(values).tolist() == [table.find(int(v)) for v in values]
+
+    def test_rows_batch(self):
+        """행별 (하한, 값...) 배열."""
+        table = BracketTable(EARNED_INCOME_DEDUCTION_BRACKETS)
+        lower, base, rate = table.rows_batch(np.array([3_000_000, 65_400_000]))
+        assert lower.tolist() == [0, 45_000_000]
+        assert base.tolist() == [0, 12_000_000]
+        assert rate.tolist() == [0.70, 0.05]
@@ -3,9 +3,21 @@
 
 TDD: RED phase - 테스트를 먼저 작성합니다.
 """
+import pytest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from card_deduction import (
+    calc_basic_limit_batch,
     calc_card_deduction,
+    calc_card_deduction_batch,
+    calc_net_deductions_batch,
+    category_rates,
 )
+from tax_rules import load_rules
 from test_data import CASE, CARD_USAGE
 
 
@@ -562,3 +574,78 @@ class TestEdgeCases:
         result1 = calc_card_deduction(**kwargs)
         result2 = calc_card_deduction(**kwargs)
         assert result1 == result2
+
+
+# =============================================================================
+# 배치 계산 (calc_card_deduction_batch)
+# =============================================================================
+@pytest.mark.skipif(np is None, reason="numpy 미설치")
+class TestCardDeductionBatch:
+    """배치 waterfall은 스칼라 calc_card_deduction()과 행별로 일치해야 한다."""
+
+    def test_kangmo(self):
+        """이강모 사례: 4,895,000원."""
+        result = calc_card_deduction_batch(
+            np.array([65_400_000]),
+            credit_card=np.array([13_000_000]),
+            debit_cash=np.array([12_000_000]),
+            culture=np.array([1_000_000]),
+            traditional=np.array([3_000_000]),
+            transit=np.array([2_000_000]),
+        )
+        assert result.tolist() == [CASE["card_deduction"]]
+
+    def test_minimum_usage_spans_categories(self):
+        """최저사용금액이 여러 카테고리에 걸쳐 차감되는 경우."""
+        salary = np.array([40_000_000, 40_000_000, 40_000_000, 80_000_000])
+        credit = np.array([0, 3_000_000, 20_000_000, 5_000_000])
+        debit = np.array([2_000_000, 4_000_000, 0, 10_000_000])
+        culture = np.array([1_000_000, 2_000_000, 0, 3_000_000])
+        traditional = np.array([5_000_000, 3_000_000, 1_000_000, 4_000_000])
+        transit = np.array([9_000_000, 500_000, 0, 2_000_000])
+        result = calc_card_deduction_batch(salary, credit, debit, culture, traditional, transit)
+        expected = [
+            calc_card_deduction(*(int(column[row]) for column in (
+                salary, credit, debit, culture, traditional, transit,
+            )))
+            for row in range(salary.size)
+        ]
+        assert result.tolist() == expected
+
+    def test_matches_scalar_random(self):
+        """무작위 모집단 전 행 일치 (7천만원 경계 및 최저사용금액 미달 포함)."""
+        rng = np.random.default_rng(126)
+        size = 3_000
+        salary = rng.integers(0, 150_000_000, size)
+        salary[:10] = 70_000_000
+        columns = [rng.integers(0, 30_000_000, size) * (rng.random(size) < 0.7) for _ in range(5)]
+        result = calc_card_deduction_batch(salary, *columns)
+        for row in range(size):
+            expected = calc_card_deduction(int(salary[row]), *(int(c[row]) for c in columns))
+            assert result[row] == expected, row
+
+    def test_below_minimum_usage(self):
+        """총 사용액이 최저사용금액 이하이면 0원."""
+        result = calc_card_deduction_batch(
+            np.array([50_000_000, 50_000_000]),
+            credit_card=np.array([12_500_000, 10_000_000]),
+            debit_cash=0,
+        )
+        assert result.tolist() == [0, 0]
+
+    def test_basic_limit(self):
+        """기본 공제 한도: 7천만원 이하 min(20%, 300만원), 초과 250만원."""
+        salary = np.array([10_000_000, 15_000_000, 70_000_000, 70_000_001])
+        limit = calc_basic_limit_batch(salary, load_rules())
+        assert limit.tolist() == [2_000_000, 3_000_000, 3_000_000, 2_500_000]
+
+    def test_net_deductions_waterfall(self):
+        """최저사용금액은 신용카드 -> 체크카드 순으로 차감된다."""
+        rules = load_rules()
+        amounts = np.array([[6_000_000], [4_000_000], [0], [0], [0]])
+        net = calc_net_deductions_batch(amounts, np.array([8_000_000]), rules)
+        assert net.shape == (5, 1)
+        credit_rate, debit_rate = category_rates(rules)[:2]
+        assert net[0, 0] == 0
+        assert net[1, 0] / rules.rate_scale == pytest.approx(2_000_000 * debit_rate)
+        assert credit_rate < debit_rate
@@ -0,0 +1,152 @@
+"""
+결제수단별 신용카드 사용액 한계가치 테스트
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from card_deduction import calc_card_deduction
+from card_marginal import CATEGORIES, calc_card_marginal_batch
+from tax_rules import load_rules
+from total_calculator import calc_year_end_tax
+
+# 이강모 사례 카드 사용액 [p.212-219]
+KANGMO_USAGE = dict(
+    credit_card=13_000_000, debit_cash=12_000_000, culture=1_000_000,
+    traditional=3_000_000, transit=2_000_000,
+)
+
+
+@pytest.fixture(scope="module")
+def population(random_population):
+    inputs = random_population(
+        20, 300,
+        total_salary=(15_000_000, 150_000_000),
+        num_dependents=(1, 5),
+        **{category: (0, 20_000_000) for category in CATEGORIES},
+    )
+    usage = {category: inputs.pop(category) for category in CATEGORIES}
+    return inputs, usage
+
+
+def _difference(function, step):
+    """step 구간에서 선형이면 차분, 꺾이는 점을 지나면 None."""
+    base = function(0)
+    single, double = base - function(step), base - function(2 * step)
+    return single if abs(double - 2 * single) <= 2 else None
+
+
+class TestMarginalDeduction:
+    """해석적 기울기 = 꺾이는 점을 지나지 않는 차분."""
+
+    def test_matches_difference(self, population):
+        inputs, usage = population
+        result = calc_card_marginal_batch(inputs, usage, unit=1_000)
+        checked = 0
+        for index in range(len(inputs["total_salary"])):
+            salary = int(inputs["total_salary"][index])
+            amounts = [int(usage[category][index]) for category in CATEGORIES]
+            for position, category in enumerate(CATEGORIES):
+                def negative_deduction(extra):
+                    changed = list(amounts)
+                    changed[position] += extra
+                    return -calc_card_deduction(salary, *changed)
+
+                difference = _difference(negative_deduction, 1_000)
+                if difference is None:
+                    continue
+                checked += 1
+                assert abs(difference - result[f"{category}_deduction"][index]) <= 1
+        assert checked > 1_400
+
+    def test_below_minimum_usage(self):
+        result = calc_card_marginal_batch(
+            dict(total_salary=60_000_000, num_dependents=1), dict(credit_card=10_000_000),
+        )
+        for category in CATEGORIES:
+            assert result[f"{category}_deduction"][0] == 0
+
+    def test_frontier_rate(self):
+        """최저사용금액이 체크카드에서 끝나면 신용카드 추가 사용도 체크카드 공제율로 공제."""
+        rules = load_rules()
+        result = calc_card_marginal_batch(
+            dict(total_salary=40_000_000, num_dependents=1),
+            dict(credit_card=5_000_000, debit_cash=8_000_000),
+        )
+        assert result["credit_card_deduction"][0] == pytest.approx(1_000 * rules.CARD_RATE_DEBIT)
+        assert result["debit_cash_deduction"][0] == pytest.approx(1_000 * rules.CARD_RATE_DEBIT)
+        assert result["transit_deduction"][0] == pytest.approx(1_000 * rules.CARD_RATE_TRANSIT)
+
+    def test_culture_over_threshold(self):
+        result = calc_card_marginal_batch(
+            dict(total_salary=90_000_000, num_dependents=1), dict(credit_card=30_000_000),
+        )
+        assert result["culture_deduction"][0] == 0
+        assert result["credit_card_deduction"][0] > 0
+
+    def test_kangmo_case(self):
+        """이강모: 기본 한도 초과분(추가 공제)이 한도 전이라 모든 결제수단이 공제를 늘린다."""
+        result = calc_card_marginal_batch(
+            dict(total_salary=65_400_000, num_dependents=4), KANGMO_USAGE,
+        )
+        assert result["card_deduction"][0] == 4_895_000
+        # 최저사용금액이 체크카드에서 끝나므로 신용카드 추가 사용도 30%
+        assert result["credit_card_deduction"][0] == pytest.approx(300)
+        assert result["debit_cash_deduction"][0] == pytest.approx(300)
+        assert result["culture_deduction"][0] == pytest.approx(300)
+        assert result["traditional_deduction"][0] == pytest.approx(400)
+        assert result["transit_deduction"][0] == pytest.approx(400)
+
+
+class TestMarginalTaxSaving:
+    def test_matches_difference(self, population):
+        inputs, usage = population
+        result = calc_card_marginal_batch(inputs, usage, unit=100_000)
+        checked = 0
+        for index in range(0, len(inputs["total_salary"]), 3):
+            salary = int(inputs["total_salary"][index])
+            dependents = int(inputs["num_dependents"][index])
+            amounts = [int(usage[category][index]) for category in CATEGORIES]
+            for position, category in enumerate(CATEGORIES):
+                def changed(extra):
+                    values = list(amounts)
+                    values[position] += extra
+                    return values
+
+                def tax(extra):
+                    deduction = calc_card_deduction(salary, *changed(extra))
+                    return calc_year_end_tax(
+                        total_salary=salary, num_dependents=dependents, card_deduction=deduction,
+                    )["determined_tax"]
+
+                deduction_step = _difference(
+                    lambda extra: -calc_card_deduction(salary, *changed(extra)), 100_000,
+                )
+                tax_step = tax(0) - tax(100_000)
+                if deduction_step is None or abs(tax(0) - tax(200_000) - 2 * tax_step) > 30:
+                    continue
+                checked += 1
+                assert abs(tax_step - result[f"{category}_tax_saving"][index]) <= 30
+        assert checked > 300
+
+    def test_zero_when_no_tax(self):
+        result = calc_card_marginal_batch(
+            dict(total_salary=20_000_000, num_dependents=4, children_over_8=2),
+            dict(debit_cash=15_000_000),
+        )
+        assert result["marginal_tax_rate"][0] == 0
+        assert result["debit_cash_tax_saving"][0] == 0
+
+    def test_total_deduction_limit(self):
+        result = calc_card_marginal_batch(
+            dict(total_salary=60_000_000, num_dependents=1, other_income_deductions=25_000_000),
+            dict(debit_cash=40_000_000),
+        )
+        assert result["marginal_tax_rate"][0] == 0
+
+    def test_exact_mode(self, population):
+        inputs, usage = population
+        exact = calc_card_marginal_batch(inputs, usage, rules=load_rules(exact=True))
+        default = calc_card_marginal_batch(inputs, usage)
+        for category in CATEGORIES:
+            assert np.allclose(exact[f"{category}_deduction"], default[f"{category}_deduction"])
@@ -0,0 +1,126 @@
+"""
+Arrow/Parquet 열 단위 입출력 테스트
+"""
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+np = pytest.importorskip("numpy")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from columnar_io import (  # noqa: E402
+    input_columns,
+    read_inputs,
+    results_to_table,
+    run_calculator,
+    write_results,
+)
+from card_deduction import calc_card_deduction  # noqa: E402
+from ragged import RaggedArray  # noqa: E402
+from total_calculator import RESULT_KEYS, calc_year_end_tax  # noqa: E402
+from test_data import CASE  # noqa: E402
+
+
+@pytest.fixture
+def employees():
+    """이강모 + 단순 사례 2행 (카드 사용액 열 포함)."""
+    return pa.table({
+        "employee_id": pa.array(["E001", "E002"]),
+        "total_salary": pa.array([65_400_000, 42_000_000], type=pa.int64()),
+        "num_dependents": pa.array([4, 1], type=pa.int32()),
+        "national_pension": pa.array([2_500_000, None], type=pa.int64()),
+        "health_insurance": [1_300_000, 0],
+        "long_term_care": [400_000, 0],
+        "housing_loan_deduction": [1_000_000, 0],
+        "card_deduction": [4_895_000, 0],
+        "children_over_8": [1, 0],
+        "birth_orders": pa.array([[3], None], type=pa.list_(pa.int64())),
+        "pension_savings": [2_000_000, 0],
+        "retirement_pension": [1_000_000, 0],
+        "insurance_tax_credit": [120_000, 0],
+        "medical_tax_credit": [950_700, 0],
+        "education_tax_credit": [630_000, 0],
+        "donation_tax_credit": [271_818, 0],
+        "prepaid_tax": [1_000_000, 500_000],
+        "is_woman_deduction": pa.array([False, True]),
+        "credit_card": [13_000_000, 15_000_000],
+        "debit_cash": [12_000_000, 0],
+        "culture": [1_000_000, 0],
+        "traditional": [3_000_000, 0],
+        "transit": [2_000_000, 0],
+    })
+
+
+class TestReadInputs:
+    """Arrow 열 -> 배치 함수 인자."""
+
+    def test_only_needed_columns(self, employees):
+        """카드 계산기는 총급여 + 사용액 5개 열만 읽는다."""
+        inputs = read_inputs(employees, "card")
+        assert set(inputs) == set(input_columns("card"))
+        assert "num_dependents" not in inputs
+
+    def test_types(self, employees):
+        """정수 null -> 0, bool 유지, list -> RaggedArray."""
+        inputs = read_inputs(employees)
+        assert inputs["national_pension"].tolist() == [2_500_000, 0]
+        assert inputs["num_dependents"].dtype == np.int64
+        assert inputs["is_woman_deduction"].tolist() == [False, True]
+        assert isinstance(inputs["birth_orders"], RaggedArray)
+        assert inputs["birth_orders"].tolist() == [[3], []]
+
+    def test_missing_required_column(self):
+        """필수 열이 없으면 ValueError."""
+        with pytest.raises(ValueError, match="num_dependents"):
+            read_inputs(pa.table({"total_salary": [50_000_000]}))
+
+    def test_unknown_calculator(self, employees):
+        """알 수 없는 계산기는 KeyError."""
+        with pytest.raises(KeyError):
+            read_inputs(employees, "lottery")
+
+    def test_parquet_projection(self, employees, tmp_path):
+        """Parquet 파일에서 필요한 열만 읽는다."""
+        path = tmp_path / "employees.parquet"
+        pq.write_table(employees, path)
+        inputs = read_inputs(path, "pension")
+        assert set(inputs) == {"total_salary", "pension_savings", "retirement_pension"}
+
+    def test_parquet_missing_required(self, employees, tmp_path):
+        """의료비 필수 열이 없는 Parquet 파일."""
+        path = tmp_path / "employees.parquet"
+        pq.write_table(employees, path)
+        with pytest.raises(ValueError, match="other_dependent_medical"):
+            read_inputs(path, "medical")
+
+
+class TestRunAndWrite:
+    """배치 실행 및 int64 열 쓰기."""
+
+    def test_year_end_tax_matches_scalar(self, employees):
+        """통합 계산 결과 = 스칼라 계산."""
+        result = run_calculator(employees)
+        assert result["refund_amount"][0] == CASE["refund_amount"]
+        assert result["refund_amount"][1] == calc_year_end_tax(
+            total_salary=42_000_000, num_dependents=1,
+            is_woman_deduction=True, prepaid_tax=500_000,
+        )["refund_amount"]
+
+    def test_card_calculator(self, employees):
+        """카드 계산기 단독 실행."""
+        result = run_calculator(employees, "card")
+        assert result["card_deduction"].tolist() == [
+            CASE["card_deduction"], calc_card_deduction(42_000_000, 15_000_000, 0),
+        ]
+
+    def test_results_to_table_int64(self, employees):
+        """결과 열은 int64, 식별 열은 맨 앞."""
+        table = results_to_table(run_calculator(employees), ids=employees["employee_id"])
+        assert table.column_names == ["employee_id", *RESULT_KEYS]
+        assert all(table.schema.field(key).type == pa.int64() for key in RESULT_KEYS)
+
+    def test_write_results_roundtrip(self, employees, tmp_path):
+        """Parquet 쓰기 후 다시 읽기."""
+        path = tmp_path / "results.parquet"
+        write_results(path, run_calculator(employees, "card"))
+        table = pq.read_table(path)
+        assert table.column("card_deduction").to_pylist()[0] == CASE["card_deduction"]
@@ -3,8 +3,16 @@
 
 TDD: RED phase - 테스트를 먼저 작성합니다.
 """
+import pytest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from donation_deduction import (
     calc_donation_tax_credit,
+    calc_donation_tax_credit_batch,
 )
 from test_data import CASE, DONATION
 
@@ -332,3 +340,57 @@ class TestDonationTaxCredit:
         # special limit: 0, capped at 0
         # special credit: 0
         assert result == 150_909 + 150_909
+
+
+# =============================================================================
+# 배치 계산 (calc_donation_tax_credit_batch)
+# =============================================================================
+@pytest.mark.skipif(np is None, reason="numpy 미설치")
+class TestDonationTaxCreditBatch:
+    """배치 cascade는 스칼라 calc_donation_tax_credit()과 행별로 일치해야 한다."""
+
+    def test_kangmo(self):
+        """이강모 사례: 271,818원."""
+        result = calc_donation_tax_credit_batch(
+            np.array([CASE["earned_income_amount"]]),
+            political=np.array([DONATION["political"]]),
+            hometown=np.array([DONATION["hometown"]]),
+            special=np.array([DONATION["special"]]),
+        )
+        assert result.tolist() == [DONATION["total_credit"]]
+
+    def test_religious_switch_per_row(self):
+        """종교단체 기부금 유무에 따라 종교외 한도율 20%/30%가 행별로 달라진다."""
+        earned = np.array([10_000_000, 10_000_000])
+        non_religious = np.array([5_000_000, 5_000_000])
+        religious = np.array([0, 100_000])
+        result = calc_donation_tax_credit_batch(
+            earned, general_non_religious=non_religious, general_religious=religious,
+        )
+        assert result.tolist() == [
+            calc_donation_tax_credit(10_000_000, general_non_religious=5_000_000),
+            calc_donation_tax_credit(
+                10_000_000, general_non_religious=5_000_000, general_religious=100_000,
+            ),
+        ]
+        assert result[0] != result[1]
+
+    def test_matches_scalar_random(self):
+        """무작위 모집단 전 행 일치 (한도 소진 및 근로소득금액 0 이하 포함)."""
+        rng = np.random.default_rng(187)
+        size = 3_000
+        earned = rng.integers(-1_000_000, 120_000_000, size)
+        keys = (
+            "political", "hometown", "special", "esop",
+            "general_non_religious", "general_religious",
+        )
+        columns = {
+            key: rng.integers(0, 40_000_000, size) * (rng.random(size) < 0.4)
+            for key in keys
+        }
+        result = calc_donation_tax_credit_batch(earned, **columns)
+        for row in range(size):
+            expected = calc_donation_tax_credit(
+                int(earned[row]), **{key: int(values[row]) for key, values in columns.items()},
+            )
+            assert result[row] == expected, row
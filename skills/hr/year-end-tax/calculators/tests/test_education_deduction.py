@@ -3,8 +3,17 @@
 
 TDD: RED phase - 테스트를 먼저 작성합니다.
 """
+import pytest
+
+try:
+    import numpy as np
+    from ragged import RaggedArray
+except ImportError:
+    np = None
+
 from education_deduction import (
     calc_education_tax_credit,
+    calc_education_tax_credit_batch,
 )
 from test_data import CASE, EDUCATION
 
@@ -174,3 +183,53 @@ class TestEducationTaxCredit:
         )
         assert result == int(1_200_000 * 0.15)
         assert result == 180_000
+
+
+# =============================================================================
+# 배치 계산 (calc_education_tax_credit_batch, CSR 입력)
+# =============================================================================
+@pytest.mark.skipif(np is None, reason="numpy 미설치")
+class TestEducationTaxCreditBatch:
+    """자녀별 교육비를 CSR로 받는 배치 계산은 스칼라와 행별로 일치해야 한다."""
+
+    def test_kangmo(self):
+        """이강모 사례: 630,000원."""
+        school = 2_500_000 + 350_000 + 300_000 + 200_000
+        result = calc_education_tax_credit_batch(
+            self_education=np.array([EDUCATION["self_eligible"]]),
+            preschool_amounts=RaggedArray([0, 1], [EDUCATION["preschool_gym"]]),
+            school_amounts=RaggedArray([0, 1], [school]),
+        )
+        assert result.tolist() == [EDUCATION["tax_credit"]]
+
+    def test_matches_scalar(self):
+        """행마다 자녀 수가 다른 가정 (빈 행, 한도 초과 포함)."""
+        self_education = np.array([0, 5_000_000, 0, 1_000_000])
+        preschool = [[1_200_000, 4_000_000], None, [], [3_000_000]]
+        school = [[], [3_500_000, 100_000, 2_999_999], None, [7]]
+        university = [None, [10_000_000], [9_000_000, 8_000_000], []]
+        disabled = np.array([0, 0, 2_000_000, 0])
+
+        result = calc_education_tax_credit_batch(
+            self_education=self_education,
+            preschool_amounts=RaggedArray.from_lists(preschool),
+            school_amounts=RaggedArray.from_lists(school),
+            university_amounts=RaggedArray.from_lists(university),
+            disabled_special=disabled,
+        )
+        expected = [
+            calc_education_tax_credit(
+                int(self_education[row]), preschool[row], school[row],
+                university[row], int(disabled[row]),
+            )
+            for row in range(4)
+        ]
+        assert result.tolist() == expected
+
+    def test_accepts_row_lists(self):
+        """RaggedArray 대신 행별 리스트도 허용."""
+        result = calc_education_tax_credit_batch(
+            self_education=np.array([0, 0]),
+            university_amounts=[[10_000_000], [1_000_000, 1_000_000]],
+        )
+        assert result.tolist() == [1_350_000, 300_000]
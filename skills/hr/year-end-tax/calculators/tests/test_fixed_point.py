@@ -0,0 +1,211 @@
+"""
+정수 고정소수점(유리수) 계산 모드 테스트
+"""
+from fractions import Fraction
+
+import pytest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from fixed_point import exact_constants, exact_rate
+from tax_rules import load_rules
+from income_tax import calc_earned_income_deduction, calc_earned_income_deduction_batch
+from card_deduction import calc_card_deduction, calc_card_deduction_batch
+from donation_deduction import calc_donation_tax_credit, calc_donation_tax_credit_batch
+from medical_deduction import calc_medical_tax_credit, calc_medical_tax_credit_batch
+from total_calculator import calc_year_end_tax, calc_year_end_tax_batch
+from test_data import CASE, DONATION, MEDICAL
+
+EXACT = load_rules(exact=True)
+
+KANGMO_KWARGS = dict(
+    total_salary=65_400_000,
+    num_dependents=4,
+    national_pension=2_500_000,
+    health_insurance=1_300_000,
+    long_term_care=400_000,
+    housing_loan_deduction=1_000_000,
+    card_deduction=4_895_000,
+    children_over_8=1,
+    birth_orders=[3],
+    pension_savings=2_000_000,
+    retirement_pension=1_000_000,
+    insurance_tax_credit=120_000,
+    medical_tax_credit=950_700,
+    education_tax_credit=630_000,
+    donation_tax_credit=271_818,
+    prepaid_tax=1_000_000,
+)
+
+
+class TestExactRate:
+    """float 공제율 -> 유리수."""
+
+    @pytest.mark.parametrize("value, expected", [
+        (100 / 110, Fraction(10, 11)),
+        (0.15, Fraction(3, 20)),
+        (0.008, Fraction(1, 125)),
+        (0.5, Fraction(1, 2)),
+    ])
+    def test_small_denominator(self, value, expected):
+        assert exact_rate(value) == expected
+
+    def test_not_representable(self):
+        with pytest.raises(ValueError):
+            exact_rate(2 ** -40)
+
+    def test_constants_keep_infinity(self):
+        values, scale = exact_constants({"BRACKETS": [(1_000, 0.06), (float('inf'), 0.15)]})
+        assert values["BRACKETS"] == [(1_000, Fraction(3, 50)), (float('inf'), Fraction(3, 20))]
+        assert scale == 100
+
+
+class TestExactRules:
+    """load_rules(exact=True)."""
+
+    def test_rates_are_fractions(self):
+        assert EXACT.exact
+        assert EXACT.DONATION_POLITICAL_RATE_UNDER_100K == Fraction(10, 11)
+        assert EXACT.CARD_MINIMUM_USAGE_RATE == Fraction(1, 4)
+        assert EXACT.TOTAL_DEDUCTION_LIMIT == load_rules().TOTAL_DEDUCTION_LIMIT
+
+    def test_rate_scale(self):
+        """모든 공제율 분모의 최소공배수 (125 x 4 x 11)."""
+        assert EXACT.rate_scale == 5_500
+        assert load_rules().rate_scale == 1
+
+    def test_separate_from_default(self):
+        """기본 규칙과 별도 객체/버전 (salary_cache 키 분리)."""
+        assert load_rules(exact=True) is EXACT
+        assert EXACT is not load_rules()
+        assert EXACT.version == load_rules().version + "+exact"
+
+    def test_other_year(self):
+        assert load_rules(2024, exact=True).CHILD_CREDIT_1 == 150_000
+
+
+class TestKangmoCaseExact:
+    """이강모 사례를 정확 모드로 재현 [p.212-219]."""
+
+    def test_year_end_tax(self):
+        result = calc_year_end_tax(**KANGMO_KWARGS, rules=EXACT)
+        assert result == calc_year_end_tax(**KANGMO_KWARGS)
+        assert result["earned_income_deduction"] == CASE["earned_income_deduction"]
+        assert result["calculated_tax"] == CASE["calculated_tax"]
+        assert result["earned_income_tax_credit"] == CASE["earned_income_tax_credit"]
+        assert result["pension_tax_credit"] == CASE["pension_tax_credit"]
+        assert result["determined_tax"] == CASE["determined_tax"]
+        assert result["refund_amount"] == CASE["refund_amount"]
+        assert all(type(value) is int for value in result.values())
+
+    def test_card_deduction(self):
+        result = calc_card_deduction(
+            total_salary=65_400_000,
+            credit_card=13_000_000,
+            debit_cash=12_000_000,
+            culture=1_000_000,
+            traditional=3_000_000,
+            transit=2_000_000,
+            rules=EXACT,
+        )
+        assert result == CASE["card_deduction"]
+
+    def test_medical_tax_credit(self):
+        result = calc_medical_tax_credit(
+            total_salary=CASE["total_salary"],
+            other_dependent_medical=4_500_000,
+            self_etc_medical=1_800_000,
+            infertility_medical=MEDICAL["spouse_infertility"],
+            rules=EXACT,
+        )
+        assert result == MEDICAL["tax_credit"]
+
+    def test_donation_tax_credit(self):
+        """정치자금/고향사랑 10만원 이하 100/110 = 90,909원."""
+        result = calc_donation_tax_credit(
+            earned_income_amount=CASE["earned_income_amount"],
+            political=DONATION["political"],
+            hometown=DONATION["hometown"],
+            special=DONATION["special"],
+            rules=EXACT,
+        )
+        assert result == DONATION["total_credit"]
+
+
+class TestFloatDrift:
+    """float 모드의 반올림 오차가 정확 모드에서는 생기지 않는다."""
+
+    def test_earned_income_deduction(self):
+        """1,310,730 x 70% = 917,511원 (float는 917,510.999...로 1원 절사)."""
+        assert calc_earned_income_deduction(1_310_730, EXACT) == 917_511
+        assert calc_earned_income_deduction(1_310_730) == 917_510
+
+    @pytest.mark.skipif(np is None, reason="numpy 미설치")
+    def test_earned_income_deduction_batch(self):
+        result = calc_earned_income_deduction_batch(np.array([1_310_730]), EXACT)
+        assert result.tolist() == [917_511]
+
+
+@pytest.mark.skipif(np is None, reason="numpy 미설치")
+class TestBatchExact:
+    """정확 모드 배치 계산기는 int64만으로 스칼라 정확 모드와 일치."""
+
+    def test_year_end_tax_batch(self):
+        rng = np.random.default_rng(14)
+        n = 300
+        columns = dict(
+            total_salary=rng.integers(0, 1_500_000_000, n),
+            num_dependents=rng.integers(1, 6, n),
+            national_pension=rng.integers(0, 3_000_000, n),
+            card_deduction=rng.integers(0, 5_000_000, n),
+            children_over_8=rng.integers(0, 4, n),
+            pension_savings=rng.integers(0, 9_000_000, n),
+            retirement_pension=rng.integers(0, 9_000_000, n),
+        )
+        batch = calc_year_end_tax_batch(**columns, rules=EXACT)
+        for values in batch.values():
+            assert values.dtype == np.int64
+        for index in range(n):
+            expected = calc_year_end_tax(
+                **{name: int(column[index]) for name, column in columns.items()}, rules=EXACT,
+            )
+            assert {key: int(values[index]) for key, values in batch.items()} == expected
+
+    def test_card_batch(self):
+        rng = np.random.default_rng(15)
+        n = 300
+        salary = rng.integers(10_000_000, 150_000_000, n)
+        usage = [rng.integers(0, 30_000_000, n) for _ in range(5)]
+        batch = calc_card_deduction_batch(salary, *usage, rules=EXACT)
+        assert batch.dtype == np.int64
+        for index in range(n):
+            assert batch[index] == calc_card_deduction(
+                int(salary[index]), *(int(column[index]) for column in usage), rules=EXACT,
+            )
+
+    def test_medical_batch(self):
+        rng = np.random.default_rng(16)
+        n = 300
+        salary = rng.integers(10_000_000, 150_000_000, n)
+        medical = [rng.integers(0, 10_000_000, n) for _ in range(4)]
+        batch = calc_medical_tax_credit_batch(salary, *medical, rules=EXACT)
+        assert batch.dtype == np.int64
+        for index in range(n):
+            assert batch[index] == calc_medical_tax_credit(
+                int(salary[index]), *(int(column[index]) for column in medical), rules=EXACT,
+            )
+
+    def test_donation_batch(self):
+        rng = np.random.default_rng(17)
+        n = 300
+        earned = rng.integers(0, 100_000_000, n)
+        donations = [rng.integers(0, 40_000_000, n) for _ in range(6)]
+        batch = calc_donation_tax_credit_batch(earned, *donations, rules=EXACT)
+        assert batch.dtype == np.int64
+        for index in range(n):
+            assert batch[index] == calc_donation_tax_credit(
+                int(earned[index]), *(int(column[index]) for column in donations), rules=EXACT,
+            )
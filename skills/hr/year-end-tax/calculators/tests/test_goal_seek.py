@@ -0,0 +1,189 @@
+"""
+목표 환급액 역산 (goal-seek) 테스트
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from card_deduction import calc_card_deduction
+from donation_deduction import calc_donation_tax_credit
+from goal_seek import UNREACHABLE, solve_extra_amount, solve_extra_amount_batch
+from salary_cache import salary_profile
+from total_calculator import calc_year_end_tax
+
+
+@pytest.fixture(scope="module")
+def staff(random_population):
+    return random_population(
+        17, 60,
+        total_salary=(25_000_000, 120_000_000),
+        num_dependents=(1, 5),
+        national_pension=(0, 3_000_000),
+        pension_savings=(0, 4_000_000),
+        prepaid_tax=(1_000_000, 8_000_000),
+    )
+
+
+def _scalar_refund(inputs, lever, extra):
+    inputs = dict(inputs, **{lever: inputs.get(lever, 0) + extra})
+    return calc_year_end_tax(**inputs)["refund_amount"]
+
+
+class TestPensionLever:
+    """연금저축/IRP 추가 납입액."""
+
+    @pytest.mark.parametrize("lever", ["pension_savings", "retirement_pension"])
+    def test_minimal_against_scalar(self, staff, row, lever):
+        target = np.array([
+            calc_year_end_tax(**row(staff, index))["refund_amount"] - 300_000
+            for index in range(len(staff["total_salary"]))
+        ])
+        result = solve_extra_amount_batch(target, lever, staff)
+        for index in range(len(target)):
+            inputs = row(staff, index)
+            extra = int(result["extra"][index])
+            if not result["feasible"][index]:
+                assert extra == UNREACHABLE
+                assert _scalar_refund(inputs, lever, 9_000_000) > target[index]
+                continue
+            assert extra > 0
+            assert _scalar_refund(inputs, lever, extra) <= target[index]
+            assert _scalar_refund(inputs, lever, extra - 1) > target[index]
+            assert result["refund_amount"][index] == _scalar_refund(inputs, lever, extra)
+
+    def test_already_reached(self, staff):
+        result = solve_extra_amount_batch(10**12, "retirement_pension", staff)
+        assert np.all(result["extra"] == 0)
+        assert np.all(result["feasible"])
+
+    def test_unreachable(self, staff):
+        """결정세액 0원 아래로는 환급이 늘지 않는다."""
+        target = -staff["prepaid_tax"] - 1
+        result = solve_extra_amount_batch(target, "retirement_pension", staff)
+        assert np.all(result["extra"] == UNREACHABLE)
+        assert not np.any(result["feasible"])
+
+    def test_unit(self, staff):
+        target = -staff["prepaid_tax"] // 2
+        exact = solve_extra_amount_batch(target, "retirement_pension", staff)
+        rounded = solve_extra_amount_batch(target, "retirement_pension", staff, unit=10_000)
+        feasible = exact["feasible"] & rounded["feasible"]
+        assert np.all(rounded["extra"][feasible] % 10_000 == 0)
+        assert np.array_equal(
+            rounded["extra"][feasible], -(-exact["extra"][feasible] // 10_000) * 10_000,
+        )
+
+    def test_unit_within_max_extra(self, staff, row):
+        """unit 올림은 max_extra 이하 배수까지만 (15,000원 상한 -> 최대 10,000원)."""
+        base = solve_extra_amount_batch(10**12, "retirement_pension", staff)["refund_amount"]
+        target = base - 1_800
+        exact = solve_extra_amount_batch(target, "retirement_pension", staff, max_extra=15_000)
+        capped = solve_extra_amount_batch(
+            target, "retirement_pension", staff, max_extra=15_000, unit=10_000,
+        )
+        assert np.all(capped["extra"] <= 10_000)
+        assert np.array_equal(capped["feasible"], exact["feasible"] & (exact["extra"] <= 10_000))
+        # 상한 10,000원 초과가 필요한 행은 도달 불가, 환급액은 10,000원 적용 결과
+        dropped = exact["feasible"] & ~capped["feasible"]
+        assert np.any(dropped)
+        for index in np.flatnonzero(~capped["feasible"]):
+            assert capped["refund_amount"][index] == _scalar_refund(
+                row(staff, index), "retirement_pension", 10_000,
+            )
+
+    def test_scalar(self):
+        inputs = dict(total_salary=50_000_000, num_dependents=1, prepaid_tax=3_000_000)
+        base = calc_year_end_tax(**inputs)["refund_amount"]
+        extra = solve_extra_amount(base - 100_000, "retirement_pension", inputs)
+        assert _scalar_refund(inputs, "retirement_pension", extra) <= base - 100_000
+        assert _scalar_refund(inputs, "retirement_pension", extra - 1) > base - 100_000
+        assert solve_extra_amount(-10**9, "retirement_pension", inputs) is None
+
+
+class TestDonationLever:
+    def test_religious_zero_extra(self):
+        """종교단체 기부금 1원부터 종교외 한도가 20%로 줄어도 0원이 답이면 0원."""
+        inputs = dict(total_salary=50_000_000, num_dependents=1, prepaid_tax=3_000_000)
+        donations = dict(general_non_religious=12_000_000)
+        base = solve_extra_amount_batch(
+            10**12, "donation", inputs, donations=donations, donation_kind="general_religious",
+        )["refund_amount"]
+        result = solve_extra_amount_batch(
+            base, "donation", inputs, donations=donations, donation_kind="general_religious",
+        )
+        assert result["feasible"][0] and result["extra"][0] == 0
+        assert result["refund_amount"][0] == base[0]
+
+        # 1원부터 종교외 한도 20%: 환급이 줄었다가 다시 늘지만 0원 수준까지는 못 돌아온다
+        earned = salary_profile(50_000_000).earned_income_amount
+
+        def refund(extra):
+            credit = calc_donation_tax_credit(
+                earned, general_non_religious=12_000_000, general_religious=extra,
+            )
+            return calc_year_end_tax(**inputs, donation_tax_credit=credit)["refund_amount"]
+
+        assert refund(1) > refund(0) == base[0]
+        target = refund(0) + 300_000
+        extra = solve_extra_amount(
+            target, "donation", inputs, donations=donations, donation_kind="general_religious",
+        )
+        assert extra == 0
+        assert solve_extra_amount(
+            refund(0) - 1, "donation", inputs,
+            donations=donations, donation_kind="general_religious",
+        ) is None
+
+    def test_minimal_against_scalar(self, staff, row):
+        donations = dict(special=np.full(60, 200_000))
+        result = solve_extra_amount_batch(
+            -staff["prepaid_tax"] // 3, "donation", staff, donations=donations,
+        )
+        assert np.any(result["feasible"])
+        for index in np.flatnonzero(result["feasible"])[:15]:
+            inputs = row(staff, index)
+            earned = salary_profile(inputs["total_salary"]).earned_income_amount
+
+            def refund(extra):
+                credit = calc_donation_tax_credit(
+                    earned, special=200_000, general_non_religious=extra,
+                )
+                return calc_year_end_tax(**inputs, donation_tax_credit=credit)["refund_amount"]
+
+            extra = int(result["extra"][index])
+            target = -inputs["prepaid_tax"] // 3
+            assert refund(extra) <= target
+            assert extra == 0 or refund(extra - 1) > target
+
+
+class TestCardLever:
+    def test_minimal_against_scalar(self, staff, row):
+        usage = dict(credit_card=np.full(60, 5_000_000), debit_cash=np.full(60, 3_000_000))
+        base = solve_extra_amount_batch(10**12, "card", staff, card_usage=usage)
+        target = base["refund_amount"] - 50_000
+        result = solve_extra_amount_batch(
+            target, "card", staff, card_usage=usage, card_category="debit_cash",
+        )
+        assert np.any(result["feasible"])
+        for index in np.flatnonzero(result["feasible"])[:15]:
+            inputs = row(staff, index)
+
+            def refund(extra):
+                deduction = calc_card_deduction(
+                    inputs["total_salary"], 5_000_000, 3_000_000 + extra,
+                )
+                return calc_year_end_tax(**inputs, card_deduction=deduction)["refund_amount"]
+
+            extra = int(result["extra"][index])
+            assert refund(extra) <= target[index]
+            assert refund(extra - 1) > target[index]
+
+
+class TestValidation:
+    def test_unknown_lever(self, staff):
+        with pytest.raises(ValueError):
+            solve_extra_amount_batch(0, "insurance", staff)
+
+    def test_unit(self, staff):
+        with pytest.raises(ValueError):
+            solve_extra_amount_batch(0, "pension_savings", staff, unit=0)
@@ -0,0 +1,172 @@
+"""
+맞벌이 부부 공제 배분 최적화 테스트
+"""
+import itertools
+import random
+
+import pytest
+
+from household import (
+    MAX_SHARED_UNITS,
+    SharedItem,
+    Spouse,
+    _empty_state,
+    _item_state,
+    _settle_spouse,
+    _sum_states,
+    optimize_household,
+)
+from records import TaxpayerInput
+from tax_rules import load_rules
+
+RULES = load_rules()
+
+
+def _brute_force(first, second, items):
+    """모든 2^n 배분의 최소 결정세액 합계."""
+    best = None
+    for assignment in itertools.product((0, 1), repeat=len(items)):
+        states = [_empty_state(), _empty_state()]
+        for item, spouse in zip(items, assignment):
+            states[spouse] = _sum_states((states[spouse], _item_state(item)))
+        total = sum(
+            _settle_spouse(spouse, state, RULES)[1].determined_tax
+            for spouse, state in zip((first, second), states)
+        )
+        best = total if best is None else min(best, total)
+    return best
+
+
+def _random_household(seed):
+    rng = random.Random(seed)
+    spouses = tuple(
+        Spouse(
+            TaxpayerInput(
+                total_salary=rng.randrange(20_000_000, 150_000_000, 100_000),
+                num_dependents=1,
+                national_pension=rng.randrange(0, 3_000_000, 10_000),
+            ),
+            card_usage={"credit_card": rng.randrange(0, 30_000_000, 10_000)},
+            donations={"general_non_religious": rng.randrange(0, 10_000_000, 10_000)},
+        )
+        for _ in range(2)
+    )
+    items = []
+    for _ in range(rng.randint(5, 8)):
+        kind = rng.choice(["dependent", "medical", "card", "donation"])
+        if kind == "dependent":
+            items.append(SharedItem(kind, elderly=rng.random() < 0.3,
+                                    child_over_8=rng.random() < 0.5))
+        elif kind == "medical":
+            items.append(SharedItem(kind, "other_dependent_medical",
+                                    rng.randrange(0, 5_000_000, 10_000)))
+        elif kind == "card":
+            items.append(SharedItem(kind, rng.choice(["debit_cash", "traditional", "transit"]),
+                                    rng.randrange(0, 10_000_000, 10_000)))
+        else:
+            # 종교단체 기부금은 소액이어도 본인 종교외 기부금 한도를 30% -> 20%로 낮춘다
+            items.append(SharedItem(kind, rng.choice(["general_non_religious", "general_religious"]),
+                                    rng.choice([1_000, rng.randrange(0, 3_000_000, 10_000)])))
+    return spouses, items
+
+
+class TestOptimizeHousehold:
+    """분기 한정 탐색 = 전수 탐색 최솟값."""
+
+    @pytest.mark.parametrize("seed", range(24))
+    def test_matches_brute_force(self, seed):
+        (first, second), items = _random_household(seed)
+        plan = optimize_household(first, second, items)
+        assert plan.determined_tax == _brute_force(first, second, items)
+        assert len(plan.assignment) == len(items)
+
+    def test_plan_is_consistent(self):
+        (first, second), items = _random_household(100)
+        plan = optimize_household(first, second, items)
+        dependents = sum(1 for item in items if item.kind == "dependent")
+        assert (
+            plan.taxpayers[0].num_dependents + plan.taxpayers[1].num_dependents
+            == 2 + dependents
+        )
+        for spouse, taxpayer, result in zip((first, second), plan.taxpayers, plan.results):
+            assert result.total_salary == spouse.taxpayer.total_salary
+            assert result.card_deduction == taxpayer.card_deduction
+
+    def test_dependent_to_higher_earner(self):
+        """기본공제는 한계세율이 높은 배우자에게."""
+        high = Spouse(TaxpayerInput(total_salary=120_000_000, num_dependents=1))
+        low = Spouse(TaxpayerInput(total_salary=30_000_000, num_dependents=1))
+        plan = optimize_household(low, high, [SharedItem("dependent")])
+        assert plan.assignment == (1,)
+
+    def test_medical_to_lower_threshold(self):
+        """총급여 3% 기준금액이 낮은 배우자만 의료비 공제를 받는다."""
+        high = Spouse(TaxpayerInput(total_salary=100_000_000, num_dependents=1))
+        low = Spouse(TaxpayerInput(total_salary=40_000_000, num_dependents=1))
+        item = SharedItem("medical", "other_dependent_medical", 2_500_000)
+        plan = optimize_household(high, low, [item])
+        assert plan.assignment == (1,)
+        assert plan.results[1].special_tax_credit > 0
+
+    def test_religious_donation(self):
+        """종교단체 기부금 1천원이 종교외 한도를 낮춰 세액이 오르는 경우도 최적 배분."""
+        first = Spouse(
+            TaxpayerInput(total_salary=70_000_000, num_dependents=1),
+            donations={"general_non_religious": 12_000_000},
+        )
+        second = Spouse(
+            TaxpayerInput(total_salary=65_000_000, num_dependents=1),
+            donations={"general_non_religious": 9_000_000},
+        )
+        items = [
+            SharedItem("donation", "general_religious", 1_000),
+            SharedItem("dependent"),
+            SharedItem("medical", "other_dependent_medical", 3_000_000),
+            SharedItem("donation", "general_non_religious", 2_000_000),
+        ]
+        plan = optimize_household(first, second, items)
+        assert plan.determined_tax == _brute_force(first, second, items) == 7_972_350
+        assert plan.assignment == (1, 0, 1, 0)
+
+    def test_group_moves_together(self):
+        (first, second), items = _random_household(7)
+        items = [
+            SharedItem("dependent", child_over_8=True, group="child"),
+            SharedItem("medical", "other_dependent_medical", 3_000_000, group="child"),
+            *items,
+        ]
+        plan = optimize_household(first, second, items)
+        assert plan.assignment[0] == plan.assignment[1]
+
+    def test_no_items(self):
+        first = Spouse(TaxpayerInput(total_salary=50_000_000, num_dependents=1))
+        second = Spouse(TaxpayerInput(total_salary=0, num_dependents=1))
+        plan = optimize_household(first, second, [])
+        assert plan.assignment == ()
+        assert plan.results[1].determined_tax == 0
+
+    def test_pruning(self):
+        """메모이제이션 + 가지치기로 전수 탐색(2^n x 2)보다 적게 계산."""
+        (first, second), items = _random_household(3)
+        plan = optimize_household(first, second, items)
+        assert plan.settlements < 2 ** len(items) * 2
+
+
+class TestValidation:
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            SharedItem("insurance")
+
+    def test_unknown_category(self):
+        with pytest.raises(ValueError):
+            SharedItem("card", "gift_card", 1_000)
+
+    def test_negative_amount(self):
+        with pytest.raises(ValueError):
+            SharedItem("donation", "special", -1)
+
+    def test_too_many_units(self):
+        spouse = Spouse(TaxpayerInput(total_salary=50_000_000, num_dependents=1))
+        items = [SharedItem("dependent")] * (MAX_SHARED_UNITS + 1)
+        with pytest.raises(ValueError):
+            optimize_household(spouse, spouse, items)
@@ -5,12 +5,23 @@ TDD RED phase: Write tests first, then implement.
 All amounts in KRW (원).
 """
 
+import pytest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from income_tax import (
     calc_earned_income_deduction,
     calc_earned_income_amount,
     calc_taxable_income,
     calc_calculated_tax,
     calc_earned_income_tax_credit,
+    calc_earned_income_deduction_batch,
+    calc_calculated_tax_batch,
+    calc_earned_income_tax_credit_batch,
+    calc_marginal_tax_rate_batch,
 )
 from test_data import CASE
 
@@ -267,3 +278,70 @@ class TestCalcEarnedIncomeTaxCredit:
         assert calc_earned_income_tax_credit(
             CASE["calculated_tax"], CASE["total_salary"]
         ) == CASE["earned_income_tax_credit"]
+
+
+# =============================================================================
+# 배치 계산
+# =============================================================================
+# 구간 경계 및 경계 +-1원 포함 샘플
+BOUNDARY_AMOUNTS = [
+    -1, 0, 1, 3_000_000, 4_999_999, 5_000_000, 5_000_001, 14_000_000, 15_000_000,
+    33_000_000, 45_000_000, 50_000_000, 65_400_000, 70_000_000, 88_000_000,
+    100_000_000, 100_000_001, 120_000_000, 150_000_000, 300_000_000, 500_000_000,
+    1_000_000_000, 1_000_000_001, 2_345_678_901,
+]
+
+
+@pytest.mark.skipif(np is None, reason="numpy 미설치")
+class TestIncomeTaxBatch:
+    """배치 계산은 스칼라 함수와 원 단위까지 일치해야 한다."""
+
+    def test_earned_income_deduction(self):
+        """근로소득공제: 구간 경계 포함."""
+        result = calc_earned_income_deduction_batch(np.array(BOUNDARY_AMOUNTS))
+        assert result.tolist() == [calc_earned_income_deduction(x) for x in BOUNDARY_AMOUNTS]
+
+    def test_calculated_tax(self):
+        """산출세액: 구간 경계 포함."""
+        result = calc_calculated_tax_batch(np.array(BOUNDARY_AMOUNTS))
+        assert result.tolist() == [calc_calculated_tax(x) for x in BOUNDARY_AMOUNTS]
+
+    def test_earned_income_tax_credit(self):
+        """근로소득세액공제: 산출세액 x 총급여 조합."""
+        taxes = [0, 500_000, 1_300_000, 1_300_001, 4_182_750, 30_000_000]
+        pairs = [(tax, salary) for tax in taxes for salary in BOUNDARY_AMOUNTS]
+        result = calc_earned_income_tax_credit_batch(
+            np.array([tax for tax, _ in pairs]),
+            np.array([salary for _, salary in pairs]),
+        )
+        assert result.tolist() == [
+            calc_earned_income_tax_credit(tax, salary) for tax, salary in pairs
+        ]
+
+    def test_marginal_tax_rate(self):
+        """한계세율 = 과세표준 1만원 감소 시 (산출세액 - 근로소득세액공제) 감소분 / 1만원."""
+        taxable = np.array([0, 10_000_000, 30_000_000, 30_000_000, 80_000_000])
+        salary = np.array([20_000_000, 20_000_000, 40_000_000, 200_000_000, 120_000_000])
+
+        def net_tax(taxable_income):
+            calculated = calc_calculated_tax_batch(taxable_income)
+            return calculated, calculated - calc_earned_income_tax_credit_batch(calculated, salary)
+
+        calculated, net = net_tax(taxable)
+        rate = calc_marginal_tax_rate_batch(
+            taxable, calculated, salary, calc_earned_income_tax_credit_batch(calculated, salary),
+        )
+        expected = (net - net_tax(np.maximum(0, taxable - 10_000))[1]) / 10_000
+        assert rate == pytest.approx(expected, abs=1e-4)
+        # 한도 미달 6% x 45%, 한도 도달(총급여 2억) 15% 그대로
+        assert rate[1] == pytest.approx(0.06 * 0.45)
+        assert rate[3] == pytest.approx(0.15)
+
+    def test_kangmo(self):
+        """이강모 사례."""
+        salary = np.array([CASE["total_salary"]])
+        assert calc_earned_income_deduction_batch(salary)[0] == CASE["earned_income_deduction"]
+        assert calc_calculated_tax_batch(np.array([CASE["taxable_income"]]))[0] == CASE["calculated_tax"]
+        assert calc_earned_income_tax_credit_batch(
+            np.array([CASE["calculated_tax"]]), salary,
+        )[0] == CASE["earned_income_tax_credit"]
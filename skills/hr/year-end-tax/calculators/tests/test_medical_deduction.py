@@ -3,8 +3,16 @@
 
 TDD: RED phase - 테스트를 먼저 작성합니다.
 """
+import pytest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from medical_deduction import (
     calc_medical_tax_credit,
+    calc_medical_tax_credit_batch,
 )
 from test_data import CASE, MEDICAL
 
@@ -211,3 +219,48 @@ class TestMedicalTaxCredit:
         # other_dependent: 1,000,000 - 300,000 = 700,000
         # credit: 700,000 x 15% = 105,000
         assert result == 105_000
+
+
+# =============================================================================
+# 배치 계산 (calc_medical_tax_credit_batch)
+# =============================================================================
+@pytest.mark.skipif(np is None, reason="numpy 미설치")
+class TestMedicalTaxCreditBatch:
+    """배치 계산은 스칼라 calc_medical_tax_credit()과 행별로 일치해야 한다."""
+
+    def test_kangmo(self):
+        """이강모 사례: 950,700원."""
+        result = calc_medical_tax_credit_batch(
+            np.array([CASE["total_salary"]]),
+            other_dependent_medical=np.array([4_500_000]),
+            self_etc_medical=np.array([1_800_000]),
+            infertility_medical=np.array([MEDICAL["spouse_infertility"]]),
+        )
+        assert result.tolist() == [MEDICAL["tax_credit"]]
+
+    def test_threshold_carries_through_all_categories(self):
+        """기준금액이 네 카테고리를 차례로 넘어가는 경우."""
+        salary = np.array([100_000_000, 100_000_000, 100_000_000, 300_000_000])
+        other = np.array([1_000_000, 0, 0, 12_000_000])
+        self_etc = np.array([500_000, 1_000_000, 0, 0])
+        infertility = np.array([2_000_000, 3_000_000, 4_000_000, 1_000_000])
+        premature = np.array([1_000_000, 500_000, 0, 0])
+        result = calc_medical_tax_credit_batch(salary, other, self_etc, infertility, premature)
+        expected = [
+            calc_medical_tax_credit(*(int(column[row]) for column in (
+                salary, other, self_etc, infertility, premature,
+            )))
+            for row in range(salary.size)
+        ]
+        assert result.tolist() == expected
+
+    def test_matches_scalar_random(self):
+        """무작위 모집단 전 행 일치."""
+        rng = np.random.default_rng(172)
+        size = 3_000
+        salary = rng.integers(0, 200_000_000, size)
+        columns = [rng.integers(0, 15_000_000, size) * (rng.random(size) < 0.6) for _ in range(4)]
+        result = calc_medical_tax_credit_batch(salary, *columns)
+        for row in range(size):
+            expected = calc_medical_tax_credit(int(salary[row]), *(int(c[row]) for c in columns))
+            assert result[row] == expected, row
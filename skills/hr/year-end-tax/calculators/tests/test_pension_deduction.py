@@ -3,9 +3,17 @@
 
 TDD: RED phase - 테스트를 먼저 작성합니다.
 """
+import pytest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from pension_deduction import (
     calc_pension_insurance_deduction,
     calc_pension_tax_credit,
+    calc_pension_tax_credit_batch,
 )
 from test_data import CASE, PENSION
 
@@ -181,3 +189,32 @@ class TestPensionTaxCredit:
         )
         # 9,000,000 x 15% = 1,350,000
         assert result == 1_350_000
+
+
+# =============================================================================
+# 배치 계산
+# =============================================================================
+@pytest.mark.skipif(np is None, reason="numpy 미설치")
+class TestPensionTaxCreditBatch:
+    """연금계좌 세액공제 배치 계산."""
+
+    def test_matches_scalar(self):
+        """한도/공제율 경계 행별 일치."""
+        salary = np.array([40_000_000, 55_000_000, 55_000_001, 65_400_000, 90_000_000])
+        savings = np.array([7_000_000, 6_000_000, 2_000_000, 2_000_000, 0])
+        retirement = np.array([5_000_000, 0, 8_000_000, 1_000_000, 12_000_000])
+        result = calc_pension_tax_credit_batch(salary, savings, retirement)
+        expected = [
+            calc_pension_tax_credit(int(s), int(p), int(r))
+            for s, p, r in zip(salary, savings, retirement)
+        ]
+        assert result.tolist() == expected
+
+    def test_kangmo(self):
+        """이강모 사례: 360,000원."""
+        result = calc_pension_tax_credit_batch(
+            np.array([CASE["total_salary"]]),
+            np.array([PENSION["pension_savings"]]),
+            np.array([PENSION["retirement_pension"]]),
+        )
+        assert result[0] == PENSION["tax_credit"]
@@ -0,0 +1,99 @@
+"""
+연금계좌 납입액 최적화 테스트
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pension_deduction import calc_pension_tax_credit
+from pension_optimizer import optimize_pension, optimize_pension_batch
+from tax_rules import load_rules
+from total_calculator import calc_year_end_tax
+
+RULES = load_rules()
+
+
+@pytest.fixture(scope="module")
+def staff(random_population):
+    return random_population(
+        19, 400,
+        total_salary=(15_000_000, 200_000_000),
+        num_dependents=(1, 6),
+        national_pension=(0, 3_000_000),
+        card_deduction=(0, 3_000_000),
+        children_over_8=(0, 3),
+        pension_savings=(0, 8_000_000),
+        retirement_pension=(0, 5_000_000),
+    )
+
+
+class TestOptimizePensionBatch:
+    @pytest.mark.parametrize("prefer", ["pension_savings", "retirement_pension"])
+    def test_minimal_contribution_zeroes_tax(self, staff, row, prefer):
+        plan = optimize_pension_batch(staff, prefer)
+        for index in range(len(staff["total_salary"])):
+            inputs = row(staff, index)
+            salary = inputs["total_salary"]
+            savings = int(plan["pension_savings"][index])
+            retirement = int(plan["retirement_pension"][index])
+            useful = int(plan["useful_contribution"][index])
+            assert savings + retirement == useful
+            assert savings <= RULES.PENSION_SAVINGS_LIMIT
+            assert useful <= RULES.PENSION_TOTAL_LIMIT
+
+            inputs.update(pension_savings=savings, retirement_pension=retirement)
+            result = calc_year_end_tax(**inputs)
+            assert result["determined_tax"] == plan["determined_tax"][index]
+            assert result["pension_tax_credit"] == plan["pension_tax_credit"][index]
+            if useful < RULES.PENSION_TOTAL_LIMIT:
+                assert result["determined_tax"] == 0
+            if useful > 0:
+                # 1원이라도 적게 내면 결정세액이 남는다
+                limit = RULES.PENSION_SAVINGS_LIMIT
+                less = calc_pension_tax_credit(
+                    salary, min(useful - 1, limit), max(0, useful - 1 - limit),
+                )
+                assert less < plan["tax_before_pension"][index]
+
+    def test_prefer_retirement(self, staff):
+        plan = optimize_pension_batch(staff, "retirement_pension")
+        assert np.all(plan["pension_savings"] == 0)
+        assert np.array_equal(plan["retirement_pension"], plan["useful_contribution"])
+
+    def test_tax_before_pension(self, staff, row):
+        plan = optimize_pension_batch(staff)
+        inputs = row(staff, 0)
+        inputs.update(pension_savings=0, retirement_pension=0)
+        assert plan["tax_before_pension"][0] == calc_year_end_tax(**inputs)["determined_tax"]
+
+    def test_excess(self):
+        """결정세액이 적은 직원의 900만원 납입은 대부분 세액공제 효과가 없다."""
+        plan = optimize_pension(dict(
+            total_salary=30_000_000, num_dependents=4, children_over_8=2,
+            pension_savings=6_000_000, retirement_pension=3_000_000,
+        ))
+        assert plan["useful_contribution"] < 9_000_000
+        assert plan["excess"] == 9_000_000 - plan["useful_contribution"]
+        assert plan["determined_tax"] == 0
+
+    def test_high_earner_capped(self):
+        plan = optimize_pension(dict(total_salary=300_000_000, num_dependents=1))
+        assert plan["useful_contribution"] == RULES.PENSION_TOTAL_LIMIT
+        assert plan["pension_savings"] == RULES.PENSION_SAVINGS_LIMIT
+        assert plan["pension_tax_credit"] == int(9_000_000 * RULES.PENSION_RATE_HIGH_SALARY)
+        assert plan["determined_tax"] > 0
+
+    def test_zero_salary(self):
+        plan = optimize_pension(dict(total_salary=0, num_dependents=1, pension_savings=1_000_000))
+        assert plan["useful_contribution"] == 0
+        assert plan["excess"] == 1_000_000
+
+    def test_exact_mode(self, staff):
+        exact = load_rules(exact=True)
+        plan = optimize_pension_batch(staff, rules=exact)
+        capped = plan["useful_contribution"] < RULES.PENSION_TOTAL_LIMIT
+        assert np.all(plan["determined_tax"][capped] == 0)
+
+    def test_unknown_preference(self, staff):
+        with pytest.raises(ValueError):
+            optimize_pension_batch(staff, "isa")
@@ -5,10 +5,20 @@ TDD RED phase: Write tests first, then implement.
 All amounts in KRW (원).
 """
 
+import pytest
+
+try:
+    import numpy as np
+    from ragged import RaggedArray
+except ImportError:
+    np = None
+
 from personal_deduction import (
     calc_basic_personal_deduction,
     calc_additional_deduction,
     calc_child_tax_credit,
+    calc_additional_deduction_batch,
+    calc_child_tax_credit_batch,
 )
 from test_data import CASE, CHILD
 
@@ -190,3 +200,56 @@ class TestCalcChildTaxCredit:
             CHILD["children_over_8"],
             birth_orders=[CHILD["birth_order"]],
         ) == CHILD["total_credit"]
+
+
+# =============================================================================
+# 배치 계산
+# =============================================================================
+@pytest.mark.skipif(np is None, reason="numpy 미설치")
+class TestPersonalDeductionBatch:
+    """배치 계산은 스칼라 함수와 행별로 일치해야 한다."""
+
+    def test_additional_deduction_single_parent_priority(self):
+        """한부모와 부녀자 동시 해당 시 한부모 우선 (행별)."""
+        result = calc_additional_deduction_batch(
+            elderly_count=np.array([1, 0, 0]),
+            disabled_count=np.array([0, 1, 0]),
+            is_single_parent=np.array([True, False, False]),
+            is_woman_deduction=np.array([True, True, False]),
+        )
+        assert result.tolist() == [
+            calc_additional_deduction(1, 0, True, True),
+            calc_additional_deduction(0, 1, False, True),
+            0,
+        ]
+
+    def test_child_tax_credit_matches_scalar(self):
+        """8세 이상 자녀 수 + 출생순위 리스트."""
+        children = np.array([0, 1, 2, 3, 5, 1])
+        birth_orders = [None, [3], [2], [], [1, 2], [4, 5]]
+        result = calc_child_tax_credit_batch(children, birth_orders)
+        expected = [
+            calc_child_tax_credit(int(count), orders)
+            for count, orders in zip(children, birth_orders)
+        ]
+        assert result.tolist() == expected
+
+    def test_child_tax_credit_kangmo(self):
+        """이강모 사례: 950,000원."""
+        result = calc_child_tax_credit_batch(np.array([1]), [[CHILD["birth_order"]]])
+        assert result[0] == CHILD["total_credit"]
+
+    def test_child_tax_credit_csr_birth_orders(self):
+        """출생순위를 CSR(offsets + values)로 전달."""
+        birth_orders = RaggedArray(offsets=[0, 1, 1, 4], values=[3, 1, 2, 3])
+        result = calc_child_tax_credit_batch(np.array([1, 0, 2]), birth_orders)
+        assert result.tolist() == [
+            calc_child_tax_credit(1, [3]),
+            calc_child_tax_credit(0, []),
+            calc_child_tax_credit(2, [1, 2, 3]),
+        ]
+
+    def test_child_tax_credit_row_count_mismatch(self):
+        """출생순위 행 수가 다르면 ValueError."""
+        with pytest.raises(ValueError):
+            calc_child_tax_credit_batch(np.array([1, 0]), [[1]])
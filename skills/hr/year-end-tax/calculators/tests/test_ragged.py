@@ -0,0 +1,54 @@
+"""
+CSR 가변 길이 배열(RaggedArray) 테스트
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ragged import RaggedArray, as_ragged  # noqa: E402
+
+
+class TestRaggedArray:
+    """offsets + values 구성 및 행별 합계."""
+
+    def test_from_lists(self):
+        """None과 빈 리스트는 길이 0 행."""
+        ragged = RaggedArray.from_lists([[1, 2], None, [], [3]])
+        assert ragged.offsets.tolist() == [0, 2, 2, 2, 3]
+        assert ragged.values.tolist() == [1, 2, 3]
+        assert len(ragged) == 4
+        assert ragged.lengths.tolist() == [2, 0, 0, 1]
+        assert ragged.row_ids.tolist() == [0, 0, 3]
+
+    def test_tolist_roundtrip(self):
+        """행별 리스트 왕복 변환."""
+        rows = [[5], [], [1, 2, 3]]
+        assert RaggedArray.from_lists(rows).tolist() == rows
+
+    def test_segment_sum_with_empty_rows(self):
+        """빈 행의 합계는 0."""
+        ragged = RaggedArray([0, 0, 3, 3, 4], [1, 2, 3, 10])
+        assert ragged.segment_sum().tolist() == [0, 6, 0, 10]
+
+    def test_segment_sum_of_transformed_values(self):
+        """values를 변환한 배열의 행별 합계."""
+        ragged = RaggedArray.from_lists([[4_000_000, 1_000_000], [3_500_000]])
+        capped = np.minimum(ragged.values, 3_000_000)
+        assert ragged.segment_sum(capped).tolist() == [4_000_000, 3_000_000]
+
+    def test_as_ragged_passthrough(self):
+        """RaggedArray는 그대로 반환."""
+        ragged = RaggedArray([0, 1], [7])
+        assert as_ragged(ragged) is ragged
+        assert as_ragged([[7]]).values.tolist() == [7]
+
+    @pytest.mark.parametrize("offsets, values", [
+        ([1, 2], [1, 2]),       # 0으로 시작하지 않음
+        ([0, 2, 1], [1, 2]),    # 감소
+        ([0, 1], [1, 2]),       # 마지막 offset != values 길이
+        ([], []),               # 빈 offsets
+    ])
+    def test_invalid_offsets(self, offsets, values):
+        """잘못된 offsets는 ValueError."""
+        with pytest.raises(ValueError):
+            RaggedArray(offsets, values)
@@ -0,0 +1,152 @@
+"""
+총급여액별 실효세율/한계세율 곡선 테스트
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from card_deduction import calc_card_deduction
+from housing_deduction import calc_rent_tax_credit
+from income_tax import calc_earned_income_tax_credit_batch
+from rate_curves import _evaluate, calc_rate_curves
+from tax_rules import load_rules
+from total_calculator import calc_year_end_tax
+
+FAMILY = dict(num_dependents=4, children_over_8=2, pension_savings=3_000_000)
+CARD_USAGE = dict(credit_card=20_000_000)
+ANNUAL_RENT = 6_000_000
+
+
+@pytest.fixture(scope="module")
+def curves():
+    return calc_rate_curves(FAMILY, card_usage=CARD_USAGE, annual_rent=ANNUAL_RENT)
+
+
+def _scalar_tax(salary):
+    return calc_year_end_tax(
+        total_salary=salary,
+        **FAMILY,
+        card_deduction=calc_card_deduction(salary, CARD_USAGE["credit_card"], 0),
+        other_tax_credits=calc_rent_tax_credit(salary, ANNUAL_RENT),
+    )["determined_tax"]
+
+
+class TestCurves:
+    def test_grid(self, curves):
+        salary = curves["salary"]
+        assert salary[0] == 10_000_000 and salary[-1] == 300_000_000
+        assert np.all(np.diff(salary) == 10_000)
+        for key in ("determined_tax", "effective_rate", "marginal_rate"):
+            assert curves[key].shape == salary.shape
+
+    def test_matches_scalar(self, curves):
+        for index in range(0, curves["salary"].size, 997):
+            salary = int(curves["salary"][index])
+            assert curves["determined_tax"][index] == _scalar_tax(salary), salary
+
+    def test_rates(self, curves):
+        tax, salary = curves["determined_tax"], curves["salary"]
+        assert np.allclose(curves["effective_rate"], tax / salary)
+        assert np.allclose(curves["marginal_rate"][:-1], np.diff(tax) / 10_000)
+        assert curves["marginal_rate"][-1] == curves["marginal_rate"][-2]
+
+    def test_exact_mode(self, curves):
+        exact = calc_rate_curves(
+            FAMILY, card_usage=CARD_USAGE, annual_rent=ANNUAL_RENT, rules=load_rules(exact=True),
+        )
+        assert np.abs(exact["determined_tax"] - curves["determined_tax"]).max() <= 1
+
+    def test_invalid_range(self):
+        with pytest.raises(ValueError):
+            calc_rate_curves(salary_step=0)
+        with pytest.raises(ValueError):
+            calc_rate_curves(salary_min=50_000_000, salary_max=40_000_000)
+
+
+class TestKinks:
+    def test_sorted_and_in_range(self, curves):
+        kinks = curves["kink_salary"]
+        assert np.all(np.diff(kinks) >= 0)
+        assert kinks.min() >= 10_000_000 and kinks.max() <= 300_000_000
+        assert kinks.dtype == np.int64
+
+    def test_rule_thresholds(self, curves):
+        kinks = dict(zip(curves["kink_label"], curves["kink_salary"]))
+        assert kinks["card_salary_threshold"] == 70_000_001
+        assert kinks["pension_salary_threshold"] == 55_000_001
+        assert kinks["rent_salary_threshold"] == 55_000_001
+        assert kinks["rent_salary_limit"] == 80_000_001
+        labels = list(curves["kink_label"])
+        assert labels.count("earned_income_deduction_bracket") == 3
+        assert "earned_income_tax_credit_limit_floor" in labels
+
+    def test_thresholds_only_when_used(self):
+        labels = set(calc_rate_curves(dict(num_dependents=1))["kink_label"])
+        assert not labels & {
+            "card_salary_threshold", "card_minimum_usage", "pension_salary_threshold",
+            "rent_salary_threshold", "rent_salary_limit",
+        }
+        assert "income_tax_bracket" in labels
+
+    def test_crossings_exact(self, curves):
+        """과세표준/세액 기준 꺾이는 점: 1원 전과 그 금액에서 조건이 바뀐다."""
+        rules = load_rules()
+        profile = dict(FAMILY)
+        checks = {
+            "tax_floor": lambda r: r["determined_tax"] > 0,
+            "earned_income_tax_credit_rate": (
+                lambda r: r["calculated_tax"] > rules.EARNED_INCOME_TAX_CREDIT_THRESHOLD
+            ),
+            "card_minimum_usage": lambda r: r["card_deduction"] < 1,
+            "earned_income_tax_credit_cap": lambda r: calc_earned_income_tax_credit_batch(
+                r["calculated_tax"], r["total_salary"], credit_limit=10**15,
+            ) > r["earned_income_tax_credit"],
+        }
+        seen = set()
+        for point, label in zip(curves["kink_salary"], curves["kink_label"]):
+            result = _evaluate(
+                np.array([point - 1, point]), profile, CARD_USAGE, ANNUAL_RENT, rules,
+            )
+            if label == "income_tax_bracket":
+                uppers = [int(upper) for upper in rules.income_tax_table.uppers[:-1]]
+                before, after = result["taxable_income"]
+                assert any(before <= upper < after for upper in uppers), point
+            elif label in checks:
+                before, after = checks[label](result)
+                assert before != after, (label, point)
+            else:
+                continue
+            seen.add(label)
+        assert seen == {"income_tax_bracket", *checks}
+
+    def test_bracket_kinks_match_curve(self, curves):
+        """결정세액 0원 하한을 벗어난 뒤 기본세율 구간 경계를 지나면 한계세율이 오른다."""
+        salary, marginal = curves["salary"], curves["marginal_rate"]
+        kinks = dict(zip(curves["kink_label"], curves["kink_salary"]))
+        for point, label in zip(curves["kink_salary"], curves["kink_label"]):
+            if label != "income_tax_bracket" or point < kinks["tax_floor"]:
+                continue
+            index = int(np.searchsorted(salary, point))
+            before, after = marginal[index - 3], marginal[index + 2]
+            assert after > before, point
+
+    def test_credit_cap(self):
+        """근로소득세액공제가 한도에 걸리는 총급여액부터 공제 기울기가 0 (한계세율 상승)."""
+        rules = load_rules()
+        profile = dict(num_dependents=1)
+        curves = calc_rate_curves(profile)
+        kinks = dict(zip(curves["kink_label"], curves["kink_salary"]))
+        point = int(kinks["earned_income_tax_credit_cap"])
+        assert 28_670_000 < point <= 28_680_000
+
+        result = _evaluate(np.array([point - 1, point]), profile, None, 0, rules)
+        uncapped = calc_earned_income_tax_credit_batch(
+            result["calculated_tax"], result["total_salary"], credit_limit=10**15,
+        )
+        assert result["earned_income_tax_credit"].tolist() == [740_000, 740_000]
+        assert uncapped[0] == 740_000 < uncapped[1]
+
+        index = int(np.searchsorted(curves["salary"], point))
+        marginal = curves["marginal_rate"]
+        assert marginal[index - 2] == pytest.approx(0.0893)
+        assert marginal[index] == pytest.approx(0.1275)
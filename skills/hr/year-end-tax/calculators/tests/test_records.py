@@ -0,0 +1,95 @@
+"""
+연말정산 입력/결과 레코드 테스트
+"""
+import dataclasses
+import inspect
+import sys
+
+import pytest
+
+from records import INPUT_FIELDS, RESULT_KEYS, SettlementResult, TaxpayerInput
+from total_calculator import calc_year_end_tax, settle
+from test_data import CASE
+
+KANGMO_KWARGS = dict(
+    total_salary=65_400_000,
+    num_dependents=4,
+    national_pension=2_500_000,
+    health_insurance=1_300_000,
+    long_term_care=400_000,
+    housing_loan_deduction=1_000_000,
+    card_deduction=4_895_000,
+    children_over_8=1,
+    birth_orders=[3],
+    pension_savings=2_000_000,
+    retirement_pension=1_000_000,
+    insurance_tax_credit=120_000,
+    medical_tax_credit=950_700,
+    education_tax_credit=630_000,
+    donation_tax_credit=271_818,
+    prepaid_tax=1_000_000,
+)
+
+
+class TestTaxpayerInput:
+    """입력 레코드."""
+
+    def test_fields_match_calc_year_end_tax(self):
+        """필드 이름/순서 = calc_year_end_tax() 인자 (rules 제외)."""
+        parameters = tuple(inspect.signature(calc_year_end_tax).parameters)
+        assert INPUT_FIELDS + ("rules",) == parameters
+
+    def test_frozen(self):
+        taxpayer = TaxpayerInput(total_salary=30_000_000, num_dependents=1)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            taxpayer.total_salary = 0
+
+    def test_slots(self):
+        """__dict__ 없이 고정 슬롯만 사용."""
+        taxpayer = TaxpayerInput(total_salary=30_000_000, num_dependents=1)
+        assert not hasattr(taxpayer, "__dict__")
+
+    def test_kwargs_round_trip(self):
+        """from_kwargs() -> to_kwargs() 왕복 (birth_orders 리스트 유지)."""
+        taxpayer = TaxpayerInput.from_kwargs(**KANGMO_KWARGS)
+        assert taxpayer.birth_orders == (3,)
+        kwargs = taxpayer.to_kwargs()
+        assert {name: kwargs[name] for name in KANGMO_KWARGS} == KANGMO_KWARGS
+
+    def test_empty_birth_orders_to_none(self):
+        taxpayer = TaxpayerInput.from_kwargs(total_salary=30_000_000, num_dependents=1)
+        assert taxpayer.to_kwargs()["birth_orders"] is None
+
+
+class TestSettlementResult:
+    """결과 레코드."""
+
+    def test_keys_order(self):
+        """필드 순서 = 기존 반환 dict 키 순서."""
+        assert tuple(calc_year_end_tax(**KANGMO_KWARGS)) == RESULT_KEYS
+
+    def test_dict_round_trip(self):
+        result = calc_year_end_tax(**KANGMO_KWARGS)
+        assert SettlementResult.from_dict(result).to_dict() == result
+
+    def test_smaller_than_dict(self):
+        """직원별 보관 크기가 dict보다 작음."""
+        result = settle(TaxpayerInput.from_kwargs(**KANGMO_KWARGS))
+        assert sys.getsizeof(result) < sys.getsizeof(result.to_dict())
+
+
+class TestSettle:
+    """settle(TaxpayerInput) -> SettlementResult."""
+
+    def test_kangmo_case(self):
+        """이강모 사례 [p.212-219]."""
+        result = settle(TaxpayerInput.from_kwargs(**KANGMO_KWARGS))
+        assert isinstance(result, SettlementResult)
+        assert result.earned_income_deduction == CASE["earned_income_deduction"]
+        assert result.personal_deduction == CASE["personal_deduction"]
+
+    @pytest.mark.parametrize("total_salary", [0, -1, 14_000_000, 65_400_000, 150_000_000])
+    def test_matches_calc_year_end_tax(self, total_salary):
+        kwargs = {**KANGMO_KWARGS, "total_salary": total_salary}
+        result = settle(TaxpayerInput.from_kwargs(**kwargs))
+        assert result.to_dict() == calc_year_end_tax(**kwargs)
@@ -0,0 +1,176 @@
+"""
+연말 지출 Monte Carlo 환급액 예측 테스트
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from card_deduction import calc_card_deduction_batch
+from donation_deduction import calc_donation_tax_credit_batch
+from medical_deduction import calc_medical_tax_credit_batch
+from refund_forecast import _draw_totals, _fit, forecast_refunds
+from salary_cache import salary_profiles_batch
+from tax_rules import load_rules
+from total_calculator import calc_year_end_tax_batch
+
+N = 60
+
+
+@pytest.fixture(scope="module")
+def company():
+    rng = np.random.default_rng(24)
+    inputs = dict(
+        total_salary=rng.integers(20_000_000, 150_000_000, N),
+        num_dependents=rng.integers(1, 5, N),
+        children_over_8=rng.integers(0, 3, N),
+        pension_savings=rng.choice([0, 3_000_000], N),
+        education_tax_credit=rng.choice([0, 300_000], N),
+        prepaid_tax=rng.integers(0, 8_000_000, N),
+        birth_orders=[[1] if k % 7 == 0 else [] for k in range(N)],
+    )
+    card = dict(
+        credit_card=rng.integers(0, 2_000_000, (N, 9)),
+        debit_cash=rng.integers(0, 1_000_000, (N, 9)),
+        transit=rng.integers(0, 100_000, (N, 9)),
+    )
+    medical = dict(self_etc_medical=rng.integers(0, 300_000, (N, 9)))
+    donation = dict(general_non_religious=rng.integers(0, 100_000, (N, 9)))
+    return inputs, card, medical, donation
+
+
+def _settle(inputs, card, medical, donation, rules=None):
+    """연간 합계로 직접 계산한 refund_amount."""
+    salary = inputs["total_salary"]
+    earned = salary_profiles_batch(salary, rules)["earned_income_amount"]
+    return calc_year_end_tax_batch(
+        **inputs,
+        card_deduction=calc_card_deduction_batch(
+            salary, card["credit_card"], card["debit_cash"], transit=card["transit"], rules=rules,
+        ),
+        medical_tax_credit=calc_medical_tax_credit_batch(
+            salary, 0, medical["self_etc_medical"], rules=rules,
+        ),
+        donation_tax_credit=calc_donation_tax_credit_batch(
+            earned, general_non_religious=donation["general_non_religious"], rules=rules,
+        ),
+        rules=rules,
+    )["refund_amount"]
+
+
+def _annual(monthly):
+    return {name: values.sum(axis=1) for name, values in monthly.items()}
+
+
+class TestSettlement:
+    def test_full_year_is_deterministic(self, company):
+        """12개월 기록이 모두 있으면 표본과 무관하게 직접 계산과 같다."""
+        inputs, card, medical, donation = company
+        full = [
+            {name: np.hstack([values, values[:, :3]]) for name, values in group.items()}
+            for group in (card, medical, donation)
+        ]
+        forecast = forecast_refunds(inputs, *full, samples=5, seed=1)
+        expected = _settle(inputs, *map(_annual, full))
+        assert np.all(forecast["total_refund"] == expected.sum())
+        assert np.allclose(forecast["mean_refund"], expected)
+        assert forecast["refund_liability"][0] == np.maximum(0, -expected).sum()
+
+    def test_constant_spending(self, company):
+        """월 지출이 일정하면(분산 0) 남은 달은 같은 금액으로 채운다."""
+        inputs, card, medical, donation = company
+        flat = [
+            {name: np.repeat(values[:, :1], 9, axis=1) for name, values in group.items()}
+            for group in (card, medical, donation)
+        ]
+        forecast = forecast_refunds(inputs, *flat, samples=3, seed=2)
+        annual = [
+            {name: values[:, 0] * 12 for name, values in group.items()} for group in flat
+        ]
+        assert np.all(forecast["total_refund"] == _settle(inputs, *annual).sum())
+
+    def test_no_spending_series(self, company):
+        """지출 기록이 없으면 inputs 그대로 1회 계산과 같다."""
+        inputs = dict(company[0], card_deduction=2_000_000, medical_tax_credit=150_000)
+        forecast = forecast_refunds(inputs, samples=4)
+        expected = calc_year_end_tax_batch(**inputs)["refund_amount"]
+        assert np.all(forecast["total_refund"] == expected.sum())
+
+    def test_exact_mode(self, company):
+        inputs, card, medical, donation = company
+        rules = load_rules(exact=True)
+        forecast = forecast_refunds(inputs, card, medical, donation, samples=20, seed=3)
+        exact = forecast_refunds(inputs, card, medical, donation, samples=20, seed=3, rules=rules)
+        assert np.abs(exact["total_refund"] - forecast["total_refund"]).max() <= 5 * N
+
+
+class TestSampling:
+    def test_chunk_size_invariant(self, company):
+        inputs, card, medical, donation = company
+        whole = forecast_refunds(inputs, card, medical, donation, samples=30, seed=7)
+        for chunk_size in (1, 7, 30):
+            chunked = forecast_refunds(
+                inputs, card, medical, donation, samples=30, seed=7, chunk_size=chunk_size,
+            )
+            assert np.array_equal(chunked["total_refund"], whole["total_refund"])
+            assert np.allclose(chunked["mean_refund"], whole["mean_refund"])
+
+    def test_chunk_memory_bound(self, company, monkeypatch):
+        """연말정산 격자는 chunk_size 표본씩만 계산한다."""
+        import refund_forecast
+
+        shapes = []
+        original = refund_forecast.settle_prepared_batch
+
+        def recording(prepared, rules):
+            shapes.append(prepared["card_deduction"].shape)
+            return original(prepared, rules)
+
+        monkeypatch.setattr(refund_forecast, "settle_prepared_batch", recording)
+        inputs, card, medical, donation = company
+        forecast_refunds(inputs, card, medical, donation, samples=25, chunk_size=10)
+        assert shapes == [(10, N), (10, N), (5, N)]
+
+    def test_draw_moments(self):
+        """남은 달 합계의 평균/분산 = 남은 개월 수 x 월평균/월분산."""
+        monthly = np.array([[100_000, 300_000, 200_000, 400_000, 0, 200_000, 100_000, 300_000,
+                             200_000]] * 2)
+        monthly[1] = 0
+        fitted = {"card": _fit(dict(credit_card=monthly), 2)}
+        normals = np.random.default_rng(0).standard_normal((200_000, 1, 2))
+        totals = _draw_totals(fitted, normals)["card"]["credit_card"]
+        remaining = totals[:, 0] - monthly[0].sum()
+        assert remaining.mean() == pytest.approx(3 * monthly[0].mean(), rel=0.01)
+        assert remaining.var() == pytest.approx(3 * monthly[0].var(ddof=1), rel=0.05)
+        assert np.all(totals[:, 1] == 0)
+        assert remaining.min() >= 0
+
+    def test_percentiles(self, company):
+        inputs, card, medical, donation = company
+        forecast = forecast_refunds(
+            inputs, card, medical, donation, samples=200, seed=11, percentiles=(10, 50, 90),
+        )
+        values = forecast["percentiles"]
+        assert list(values) == [10, 50, 90]
+        assert values[10] <= values[50] <= values[90]
+        assert values[50] == pytest.approx(np.median(forecast["total_refund"]))
+        liability = forecast["liability_percentiles"]
+        assert 0 <= liability[10] <= liability[90]
+
+    def test_more_spending_lowers_refund_amount(self, company):
+        """지출 기록이 늘면 공제가 늘어 refund_amount는 줄거나 같다."""
+        inputs, card, medical, donation = company
+        base = forecast_refunds(inputs, card, medical, donation, samples=10, seed=5)
+        doubled = {name: values * 2 for name, values in card.items()}
+        more = forecast_refunds(inputs, doubled, medical, donation, samples=10, seed=5)
+        assert np.all(more["mean_refund"] <= base["mean_refund"] + 1e-9)
+
+    def test_invalid(self, company):
+        inputs, card, _, _ = company
+        with pytest.raises(ValueError):
+            forecast_refunds(inputs, card, samples=0)
+        with pytest.raises(ValueError):
+            forecast_refunds(inputs, card, chunk_size=0)
+        with pytest.raises(ValueError):
+            forecast_refunds(inputs, dict(credit_card=card["credit_card"][:, 0]))
+        with pytest.raises(ValueError):
+            forecast_refunds(inputs, dict(credit_card=np.zeros((N, 13), dtype=np.int64)))
@@ -0,0 +1,179 @@
+"""
+과세연도 간 재정산 및 차이 계산 테스트
+"""
+import csv
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from records import RESULT_KEYS
+from resettlement import columns_from_employees, diff_fieldnames, main, resettle_batch
+from settlement_stream import parse_employee
+from tax_rules import load_rules
+from total_calculator import calc_year_end_tax, calc_year_end_tax_batch
+
+KANGMO = dict(
+    total_salary=65_400_000,
+    num_dependents=4,
+    national_pension=2_500_000,
+    health_insurance=1_300_000,
+    long_term_care=400_000,
+    housing_loan_deduction=1_000_000,
+    card_deduction=4_895_000,
+    children_over_8=1,
+    birth_orders=[3],
+    pension_savings=2_000_000,
+    retirement_pension=1_000_000,
+    insurance_tax_credit=120_000,
+    medical_tax_credit=950_700,
+    education_tax_credit=630_000,
+    donation_tax_credit=271_818,
+    prepaid_tax=1_000_000,
+)
+
+
+@pytest.fixture(scope="module")
+def population(random_population):
+    n = 500
+    columns = random_population(
+        25, n,
+        total_salary=(10_000_000, 200_000_000),
+        num_dependents=(1, 6),
+        elderly_count=(0, 2),
+        is_single_parent=0.1,
+        is_woman_deduction=0.2,
+        national_pension=(0, 5_000_000),
+        health_insurance=(0, 4_000_000),
+        card_deduction=(0, 20_000_000),
+        other_income_deductions=(0, 10_000_000),
+        children_over_8=(0, 4),
+        pension_savings=(0, 8_000_000),
+        medical_tax_credit=(0, 1_000_000),
+        prepaid_tax=(0, 10_000_000),
+    )
+    columns["total_salary"][:2] = [0, -1]
+    columns["birth_orders"] = [[k % 3 + 1] if k % 4 == 0 else [] for k in range(n)]
+    return columns
+
+
+class TestResettleBatch:
+    @pytest.mark.parametrize("exact", [False, True])
+    def test_matches_batch(self, population, exact):
+        before, after = load_rules(2024, exact), load_rules(2025, exact)
+        result = resettle_batch(population, before, after)
+        expected_before = calc_year_end_tax_batch(**population, rules=before)
+        expected_after = calc_year_end_tax_batch(**population, rules=after)
+        for key in RESULT_KEYS:
+            assert np.array_equal(result["before"][key], expected_before[key]), key
+            assert np.array_equal(result["after"][key], expected_after[key]), key
+            assert np.array_equal(
+                result["diff"][key], expected_after[key] - expected_before[key],
+            ), key
+
+    def test_kangmo_child_credit(self):
+        """2024 -> 2025 귀속: 8세 이상 자녀 1명 공제 15만원 -> 25만원."""
+        inputs = dict(KANGMO, birth_orders=[KANGMO["birth_orders"]])
+        result = resettle_batch(inputs, load_rules(2024), load_rules(2025))
+        before = calc_year_end_tax(**KANGMO, rules=load_rules(2024))
+        after = calc_year_end_tax(**KANGMO, rules=load_rules(2025))
+        assert result["diff"]["child_tax_credit"][0] == 100_000
+        for key in RESULT_KEYS:
+            assert result["diff"][key][0] == after[key] - before[key], key
+        assert result["changed"][0]
+
+    def test_changed_flags(self, population):
+        result = resettle_batch(population, load_rules(2024), load_rules(2025))
+        expected = np.zeros(len(population["total_salary"]), dtype=bool)
+        for key in RESULT_KEYS:
+            expected |= result["diff"][key] != 0
+        assert np.array_equal(result["changed"], expected)
+        # 총급여액 0 이하는 규칙과 무관
+        assert not result["changed"][:2].any()
+        # 2024/2025 귀속 차이는 8세 이상 자녀 공제뿐 (기부금 세액공제는 입력 금액)
+        assert result["changed"].any() and not result["changed"].all()
+        no_child = population["children_over_8"] == 0
+        assert not result["changed"][no_child].any()
+
+    def test_same_rules(self, population):
+        rules = load_rules(2025)
+        result = resettle_batch(population, rules, rules)
+        assert result["after"] is result["before"]
+        assert not result["changed"].any()
+
+    def test_birth_orders_length(self):
+        with pytest.raises(ValueError):
+            resettle_batch(
+                dict(total_salary=[50_000_000, 60_000_000], num_dependents=2, birth_orders=[[1]]),
+                load_rules(2024), load_rules(2025),
+            )
+
+
+class TestColumnsFromEmployees:
+    def test_defaults(self):
+        columns = columns_from_employees([KANGMO, dict(total_salary=30_000_000, num_dependents=1)])
+        assert columns["card_deduction"].tolist() == [4_895_000, 0]
+        assert columns["is_single_parent"].dtype == bool
+        assert columns["birth_orders"] == [[3], []]
+        result = resettle_batch(columns, load_rules(2024), load_rules(2025))
+        assert result["after"]["refund_amount"][0] == calc_year_end_tax(**KANGMO)["refund_amount"]
+
+
+class TestMain:
+    def _write_csv(self, path, rows):
+        with open(path, "w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=["employee_id", *KANGMO])
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+
+    def _rows(self):
+        kangmo = {
+            **KANGMO, "employee_id": "E001", "birth_orders": "3",
+        }
+        single = {"employee_id": "E002", "total_salary": 40_000_000, "num_dependents": 1}
+        return [kangmo, single]
+
+    def test_csv_diff(self, tmp_path):
+        input_path = tmp_path / "employees.csv"
+        output_path = tmp_path / "amended.csv"
+        self._write_csv(input_path, self._rows())
+        assert main([
+            str(input_path), "-o", str(output_path), "--from-year", "2024", "--to-year", "2025",
+            "--id-column", "employee_id", "--chunk-size", "1",
+        ]) == 0
+        with open(output_path, encoding="utf-8") as handle:
+            rows = list(csv.DictReader(handle))
+        assert list(rows[0]) == diff_fieldnames("employee_id")
+        assert [row["employee_id"] for row in rows] == ["E001", "E002"]
+        assert rows[0]["changed"] == "True" and rows[1]["changed"] == "False"
+        assert int(rows[0]["child_tax_credit"]) == 100_000
+        before = calc_year_end_tax(**KANGMO, rules=load_rules(2024))["refund_amount"]
+        after = calc_year_end_tax(**KANGMO, rules=load_rules(2025))["refund_amount"]
+        assert int(rows[0]["refund_amount"]) == after - before
+
+    def test_only_changed_jsonl(self, tmp_path, capsys):
+        input_path = tmp_path / "employees.csv"
+        self._write_csv(input_path, self._rows())
+        main([
+            str(input_path), "--from-year", "2024", "--id-column", "employee_id",
+            "--only-changed", "-o", str(tmp_path / "amended.jsonl"),
+        ])
+        lines = (tmp_path / "amended.jsonl").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["employee_id"] for line in lines] == ["E001"]
+        assert "2명 재정산 (2024 -> 2025), 1행 출력" in capsys.readouterr().err
+
+    def test_reports_line_number(self, tmp_path):
+        input_path = tmp_path / "employees.csv"
+        rows = self._rows()
+        rows[1]["total_salary"] = "abc"
+        self._write_csv(input_path, rows)
+        with pytest.raises(ValueError, match="2번째 행"):
+            main([str(input_path), "--from-year", "2024", "-o", str(tmp_path / "out.csv")])
+
+    def test_parse_matches_stream(self):
+        row = {key: str(value) for key, value in KANGMO.items() if key != "birth_orders"}
+        kwargs = parse_employee({**row, "birth_orders": "3"})
+        columns = columns_from_employees([kwargs])
+        assert columns["birth_orders"] == [[3]]
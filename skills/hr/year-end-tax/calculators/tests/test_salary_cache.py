@@ -0,0 +1,155 @@
+"""
+총급여액 파생값 캐시(salary_cache) 테스트
+"""
+import pytest
+
+import constants
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from salary_cache import (
+    PROFILE_FIELDS,
+    SALARY_CACHE,
+    SalaryCache,
+    SalaryProfile,
+    salary_profile,
+    salary_profiles_batch,
+)
+from tax_rules import TaxRules, load_rules
+from income_tax import calc_earned_income_deduction, calc_earned_income_amount
+from total_calculator import calc_year_end_tax
+from test_data import CASE
+
+
+class TestSalaryProfile:
+    """스칼라 조회."""
+
+    def test_kangmo_case(self):
+        """이강모 사례 [p.212-219]."""
+        profile = salary_profile(65_400_000, cache=SalaryCache())
+        assert profile.earned_income_deduction == CASE["earned_income_deduction"]
+        assert profile.earned_income_amount == CASE["earned_income_amount"]
+        assert profile.card_minimum_usage == 16_350_000
+        assert profile.medical_threshold == 1_962_000
+
+    def test_matches_calculators(self):
+        salary = 48_000_000
+        profile = salary_profile(salary, cache=SalaryCache())
+        assert profile.earned_income_deduction == calc_earned_income_deduction(salary)
+        assert profile.earned_income_amount == calc_earned_income_amount(salary)
+
+    def test_rent_rate_over_limit(self):
+        """총급여 8천만원 초과는 월세 세액공제 대상 아님 [p.202]."""
+        assert salary_profile(90_000_000, cache=SalaryCache()).rent_rate == 0.0
+
+
+class TestSalaryCache:
+    """LRU 캐시 동작과 통계."""
+
+    def test_hits_and_misses(self):
+        cache = SalaryCache()
+        rules = load_rules()
+        first = cache.get(65_400_000, rules)
+        assert cache.get(65_400_000, rules) is first
+        cache.get(42_000_000, rules)
+        assert cache.stats() == (1, 2, 2, cache.maxsize)
+
+    def test_lru_eviction(self):
+        """가장 오래 쓰지 않은 항목부터 제거."""
+        cache = SalaryCache(maxsize=2)
+        rules = load_rules()
+        cache.get(10_000_000, rules)
+        cache.get(20_000_000, rules)
+        cache.get(10_000_000, rules)  # 10,000,000을 최근 사용으로
+        cache.get(30_000_000, rules)  # 20,000,000 제거
+        assert len(cache) == 2
+        cache.get(10_000_000, rules)
+        cache.get(20_000_000, rules)
+        assert cache.stats().hits == 2
+        assert cache.stats().misses == 4
+
+    def test_keyed_by_rules_version(self):
+        """같은 총급여액도 과세연도 규칙 버전별로 따로 보관."""
+        cache = SalaryCache()
+        cache.get(65_400_000, load_rules(2024))
+        cache.get(65_400_000, load_rules(2025))
+        assert cache.stats().misses == 2
+        assert len(cache) == 2
+
+    def test_keyed_by_rules_object(self):
+        """같은 버전이라도 상수를 고친 개정안 규칙은 캐시를 공유하지 않는다."""
+        stock = load_rules()
+        brackets = list(constants.EARNED_INCOME_DEDUCTION_BRACKETS)
+        brackets[0] = (*brackets[0][:2], 0.90)
+        amended = TaxRules(dict(vars(constants), EARNED_INCOME_DEDUCTION_BRACKETS=brackets))
+        assert amended.version == stock.version
+
+        SALARY_CACHE.clear()
+        calc_year_end_tax(4_000_000, 1, rules=stock)
+        result = calc_year_end_tax(4_000_000, 1, rules=amended)
+        assert result["earned_income_deduction"] == 3_600_000
+        assert salary_profile(3_000_000, amended).earned_income_deduction == 2_700_000
+        assert salary_profile(3_000_000, stock).earned_income_deduction == 2_100_000
+
+    def test_clear(self):
+        cache = SalaryCache()
+        cache.get(65_400_000, load_rules())
+        cache.clear()
+        assert cache.stats() == (0, 0, 0, cache.maxsize)
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            SalaryCache(maxsize=0)
+
+    def test_shared_by_calculators(self):
+        """calc_year_end_tax()는 전역 캐시를 거친다."""
+        SALARY_CACHE.clear()
+        calc_year_end_tax(total_salary=65_400_000, num_dependents=4)
+        calc_year_end_tax(total_salary=65_400_000, num_dependents=1)
+        stats = SALARY_CACHE.stats()
+        assert stats.misses == 1
+        assert stats.hits > 0
+
+
+@pytest.mark.skipif(np is None, reason="numpy 미설치")
+class TestSalaryProfilesBatch:
+    """배치 조회 (고유 총급여액만 조회/계산)."""
+
+    def test_matches_scalar(self):
+        rng = np.random.default_rng(12)
+        salary = rng.integers(0, 200_000_000, 300)
+        salary[:50] = 65_400_000  # 중복 급여
+        batch = salary_profiles_batch(salary, cache=SalaryCache())
+        assert set(batch) == set(PROFILE_FIELDS)
+        for index in range(salary.size):
+            expected = salary_profile(int(salary[index]), cache=SalaryCache())
+            assert SalaryProfile(
+                *(batch[name][index].item() for name in PROFILE_FIELDS)
+            ) == expected
+
+    def test_unique_salaries_looked_up_once(self):
+        cache = SalaryCache()
+        salary = np.array([30_000_000, 65_400_000, 30_000_000, 65_400_000])
+        salary_profiles_batch(salary, cache=cache)
+        assert cache.stats() == (0, 2, 2, cache.maxsize)
+
+    def test_scalar_hits_after_batch(self):
+        """배치 경로가 채운 항목을 스칼라 경로가 재사용."""
+        cache = SalaryCache()
+        salary_profiles_batch(np.array([42_000_000, 65_400_000]), cache=cache)
+        salary_profile(65_400_000, cache=cache)
+        assert cache.stats().hits == 1
+
+    def test_bypass_when_more_uniques_than_maxsize(self):
+        """고유 급여가 캐시보다 많으면 캐시를 건드리지 않는다."""
+        cache = SalaryCache(maxsize=2)
+        cache.get(65_400_000, load_rules())
+        salary = np.array([10_000_000, 20_000_000, 30_000_000])
+        batch = salary_profiles_batch(salary, cache=cache)
+        assert batch["earned_income_deduction"].tolist() == [
+            calc_earned_income_deduction(value) for value in salary.tolist()
+        ]
+        assert cache.stats() == (0, 1, 1, 2)
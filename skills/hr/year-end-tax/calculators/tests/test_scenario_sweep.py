@@ -0,0 +1,125 @@
+"""
+연말정산 what-if 격자 계산 테스트
+"""
+import itertools
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from records import RESULT_KEYS
+from salary_cache import SalaryCache
+from scenario_sweep import sweep
+from tax_rules import load_rules
+from total_calculator import calc_year_end_tax, calc_year_end_tax_batch
+
+KANGMO_BASE = dict(
+    total_salary=65_400_000,
+    num_dependents=4,
+    national_pension=2_500_000,
+    health_insurance=1_300_000,
+    long_term_care=400_000,
+    housing_loan_deduction=1_000_000,
+    children_over_8=1,
+    birth_orders=[3],
+    insurance_tax_credit=120_000,
+    education_tax_credit=630_000,
+    donation_tax_credit=271_818,
+    prepaid_tax=1_000_000,
+)
+
+
+def _flat_batch(base, axes, rules=None):
+    """격자를 행으로 펼쳐 calc_year_end_tax_batch()로 계산 (고정 입력은 행마다 반복)."""
+    names = list(axes)
+    rows = list(itertools.product(*axes.values()))
+    columns = {name: np.array([row[k] for row in rows]) for k, name in enumerate(names)}
+    fixed = {name: value for name, value in base.items() if name not in axes}
+    if "total_salary" in fixed:
+        fixed["total_salary"] = np.full(len(rows), fixed["total_salary"])
+    birth_orders = fixed.pop("birth_orders", None)
+    if birth_orders is not None:
+        fixed["birth_orders"] = [birth_orders] * len(rows)
+    return calc_year_end_tax_batch(**fixed, **columns, rules=rules)
+
+
+class TestSweep:
+    """격자 결과 = 펼친 배치 계산 결과."""
+
+    def test_matches_batch(self):
+        axes = dict(
+            pension_savings=range(0, 7_000_001, 1_000_000),
+            card_deduction=range(0, 6_000_001, 1_500_000),
+            medical_tax_credit=(0, 500_000, 950_700),
+        )
+        grid = sweep(KANGMO_BASE, axes)
+        flat = _flat_batch(KANGMO_BASE, axes)
+        for key in RESULT_KEYS:
+            assert grid[key].shape == (8, 5, 3)
+            assert np.array_equal(grid[key].ravel(), flat[key]), key
+
+    def test_kangmo_point(self):
+        grid = sweep(KANGMO_BASE, dict(
+            card_deduction=[0, 4_895_000],
+            pension_savings=[2_000_000],
+            retirement_pension=[1_000_000],
+            medical_tax_credit=[950_700],
+        ))
+        expected = calc_year_end_tax(
+            **KANGMO_BASE, card_deduction=4_895_000, pension_savings=2_000_000,
+            retirement_pension=1_000_000, medical_tax_credit=950_700,
+        )
+        assert {key: int(grid[key][1, 0, 0, 0]) for key in RESULT_KEYS} == expected
+
+    def test_salary_and_personal_axes(self):
+        axes = dict(
+            total_salary=(-1, 0, 14_000_000, 55_000_000, 55_000_001, 150_000_000),
+            num_dependents=(1, 3),
+            is_single_parent=(False, True),
+            other_income_deductions=(0, 30_000_000),
+        )
+        base = dict(
+            total_salary=0, num_dependents=1, prepaid_tax=500_000, pension_savings=3_000_000,
+        )
+        grid = sweep(base, axes)
+        flat = _flat_batch(base, axes)
+        for key in RESULT_KEYS:
+            assert np.array_equal(grid[key].ravel(), flat[key]), key
+
+    def test_exact_mode(self):
+        rules = load_rules(exact=True)
+        axes = dict(total_salary=(13_107_300, 65_400_000), pension_savings=(0, 1_234_567))
+        grid = sweep(KANGMO_BASE, axes, rules)
+        flat = _flat_batch(KANGMO_BASE, axes, rules)
+        assert np.array_equal(grid["determined_tax"].ravel(), flat["determined_tax"])
+
+    def test_no_axes(self):
+        grid = sweep(KANGMO_BASE, {})
+        assert grid["determined_tax"].shape == ()
+        assert int(grid["determined_tax"]) == calc_year_end_tax(**KANGMO_BASE)["determined_tax"]
+
+    def test_hoisted_salary_profile(self, monkeypatch):
+        """총급여액 축이 없으면 총급여액 파생값은 1개만 계산."""
+        import total_calculator
+
+        sizes = []
+        original = total_calculator.salary_profiles_batch
+
+        def counting(salary, rules):
+            sizes.append(salary.size)
+            return original(salary, rules, cache=SalaryCache())
+
+        monkeypatch.setattr(total_calculator, "salary_profiles_batch", counting)
+        grid = sweep(KANGMO_BASE, dict(
+            pension_savings=range(50), card_deduction=range(50), medical_tax_credit=range(20),
+        ))
+        assert sizes == [1]
+        assert grid["refund_amount"].shape == (50, 50, 20)
+
+    def test_unknown_axis(self):
+        with pytest.raises(ValueError):
+            sweep(KANGMO_BASE, dict(birth_orders=[[1], [2]]))
+
+    def test_empty_axis(self):
+        with pytest.raises(ValueError):
+            sweep(KANGMO_BASE, dict(card_deduction=[]))
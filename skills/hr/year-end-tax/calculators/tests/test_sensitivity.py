@@ -0,0 +1,139 @@
+"""
+직원별 환급액 민감도 보고서 테스트
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from sensitivity import SENSITIVITY_FIELDS, calc_refund_sensitivity_batch
+from tax_rules import load_rules
+from total_calculator import calc_year_end_tax_batch
+
+KANGMO = dict(
+    total_salary=65_400_000,
+    num_dependents=4,
+    national_pension=2_500_000,
+    health_insurance=1_300_000,
+    long_term_care=400_000,
+    housing_loan_deduction=1_000_000,
+    card_deduction=4_895_000,
+    children_over_8=1,
+    pension_savings=2_000_000,
+    retirement_pension=1_000_000,
+    insurance_tax_credit=120_000,
+    medical_tax_credit=950_700,
+    education_tax_credit=630_000,
+    donation_tax_credit=271_818,
+    prepaid_tax=1_000_000,
+)
+
+
+@pytest.fixture(scope="module")
+def population(random_population):
+    return random_population(
+        23, 400,
+        total_salary=(15_000_000, 200_000_000),
+        num_dependents=(1, 5),
+        children_over_8=(0, 3),
+        national_pension=(0, 5_000_000),
+        health_insurance=(0, 4_000_000),
+        card_deduction=(0, 6_000_000),
+        other_income_deductions=[0, 5_000_000, 22_000_000],
+        pension_savings=[0, 3_000_000, 6_000_000, 8_000_000],
+        retirement_pension=[0, 2_000_000, 4_000_000],
+        medical_tax_credit=(0, 1_000_000),
+        prepaid_tax=(0, 10_000_000),
+    )
+
+
+def _refund(inputs, name, extra):
+    changed = dict(inputs)
+    changed[name] = np.asarray(inputs.get(name, 0)) + extra
+    return calc_year_end_tax_batch(**changed)["refund_amount"]
+
+
+class TestSlopes:
+    """해석적 기울기 = 구간 경계를 지나지 않는 차분."""
+
+    def test_matches_difference(self, population):
+        unit = 10_000
+        report = calc_refund_sensitivity_batch(population, unit=unit)
+        checked = 0
+        for name in SENSITIVITY_FIELDS:
+            base = _refund(population, name, 0)
+            single = _refund(population, name, unit) - base
+            double = _refund(population, name, 2 * unit) - base
+            linear = np.abs(double - 2 * single) <= 2
+            checked += int(linear.sum())
+            assert np.all(np.abs(single - report[name])[linear] <= 2), name
+        assert checked > 0.9 * len(SENSITIVITY_FIELDS) * 400
+
+    def test_kangmo_case(self):
+        report = calc_refund_sensitivity_batch(KANGMO)
+        # 근로소득세액공제가 한도에 걸려 있으므로 소득공제는 기본세율 15% 그대로
+        assert report["marginal_tax_rate"][0] == pytest.approx(0.15)
+        assert report["card_deduction"][0] == pytest.approx(-15_000)
+        assert report["pension_savings"][0] == pytest.approx(-12_000)
+        assert report["medical_tax_credit"][0] == pytest.approx(-100_000)
+
+    def test_zero_tax(self):
+        report = calc_refund_sensitivity_batch(
+            dict(total_salary=20_000_000, num_dependents=4, children_over_8=2, prepaid_tax=300_000),
+        )
+        assert report["refund_amount"][0] == -300_000
+        for name in SENSITIVITY_FIELDS:
+            assert report[name][0] == 0
+        assert report["top_input"][0] == ""
+
+    def test_limits(self):
+        report = calc_refund_sensitivity_batch(dict(
+            total_salary=np.array([60_000_000, 60_000_000]),
+            num_dependents=1,
+            card_deduction=np.array([20_000_000, 0]),
+            other_income_deductions=np.array([5_000_000, 0]),
+            pension_savings=np.array([6_000_000, 7_000_000]),
+            retirement_pension=np.array([0, 3_000_000]),
+        ))
+        # 종합한도 도달: 카드/기타 0, 다른 소득공제는 그대로
+        assert report["card_deduction"][0] == 0
+        assert report["other_income_deductions"][0] == 0
+        assert report["national_pension"][0] < 0
+        # 연금저축 한도 도달, 합산 한도 전: 퇴직연금만 공제
+        assert report["pension_savings"][0] == 0
+        assert report["retirement_pension"][0] < 0
+        # 합산 한도 도달
+        assert report["pension_savings"][1] == 0
+        assert report["retirement_pension"][1] == 0
+
+    def test_non_positive_salary(self):
+        report = calc_refund_sensitivity_batch(
+            dict(total_salary=np.array([0, -1]), num_dependents=1, prepaid_tax=100),
+        )
+        for name in SENSITIVITY_FIELDS:
+            assert np.all(report[name] == 0)
+
+    def test_exact_mode(self, population):
+        exact = calc_refund_sensitivity_batch(population, rules=load_rules(exact=True))
+        default = calc_refund_sensitivity_batch(population)
+        for name in SENSITIVITY_FIELDS:
+            assert np.allclose(exact[name], default[name]), name
+
+
+class TestRanking:
+    def test_sorted_by_effect(self, population):
+        report = calc_refund_sensitivity_batch(population)
+        effects = np.stack([report[name] for name in SENSITIVITY_FIELDS], axis=1)
+        ranked = np.take_along_axis(effects, report["ranking"], axis=1)
+        assert np.all(np.diff(ranked, axis=1) >= 0)
+        assert sorted(report["ranking"][0]) == list(range(len(SENSITIVITY_FIELDS)))
+
+    def test_top_input(self):
+        report = calc_refund_sensitivity_batch(dict(
+            total_salary=np.array([65_400_000, 65_400_000]),
+            num_dependents=4,
+            card_deduction=np.array([0, 30_000_000]),
+        ))
+        # 세액공제는 1원당 1원: 같은 영향이면 SENSITIVITY_FIELDS 순서
+        assert report["top_input"][0] == "insurance_tax_credit"
+        order = [SENSITIVITY_FIELDS[k] for k in report["ranking"][1]]
+        assert order.index("national_pension") < order.index("card_deduction")
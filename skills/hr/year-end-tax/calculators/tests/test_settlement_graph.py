@@ -0,0 +1,147 @@
+"""
+증분 재계산 연말정산 그래프 테스트
+"""
+import random
+
+import pytest
+
+from records import RESULT_KEYS, TaxpayerInput
+from settlement_graph import NODE_NAMES, SettlementGraph, downstream
+from tax_rules import load_rules
+from total_calculator import calc_year_end_tax
+from test_data import CASE
+
+KANGMO_KWARGS = dict(
+    total_salary=65_400_000,
+    num_dependents=4,
+    national_pension=2_500_000,
+    health_insurance=1_300_000,
+    long_term_care=400_000,
+    housing_loan_deduction=1_000_000,
+    card_deduction=4_895_000,
+    children_over_8=1,
+    birth_orders=[3],
+    pension_savings=2_000_000,
+    retirement_pension=1_000_000,
+    insurance_tax_credit=120_000,
+    medical_tax_credit=950_700,
+    education_tax_credit=630_000,
+    donation_tax_credit=271_818,
+    prepaid_tax=1_000_000,
+)
+
+
+def _graph(**overrides):
+    return SettlementGraph(TaxpayerInput.from_kwargs(**{**KANGMO_KWARGS, **overrides}))
+
+
+class TestSettlementGraph:
+    """초기 계산은 calc_year_end_tax()와 동일."""
+
+    def test_kangmo_case(self):
+        """이강모 사례 [p.212-219]."""
+        graph = _graph()
+        assert graph.result().to_dict() == calc_year_end_tax(**KANGMO_KWARGS)
+        assert graph.value("earned_income_deduction") == CASE["earned_income_deduction"]
+        assert graph.last_evaluated == NODE_NAMES
+
+    def test_result_keys_are_nodes(self):
+        assert set(RESULT_KEYS) <= set(NODE_NAMES)
+
+    def test_rules(self):
+        graph = SettlementGraph(
+            TaxpayerInput.from_kwargs(**KANGMO_KWARGS), rules=load_rules(2024)
+        )
+        assert graph.result().to_dict() == calc_year_end_tax(
+            **KANGMO_KWARGS, rules=load_rules(2024)
+        )
+
+
+class TestUpdate:
+    """입력 변경 시 하위 노드만 재계산."""
+
+    def test_medical_only_touches_credits(self):
+        graph = _graph()
+        evaluated = graph.update(medical_tax_credit=1_200_000)
+        assert evaluated == (
+            "special_tax_credit", "total_tax_credit", "determined_tax", "refund_amount",
+        )
+        assert graph.result().to_dict() == calc_year_end_tax(
+            **{**KANGMO_KWARGS, "medical_tax_credit": 1_200_000}
+        )
+
+    def test_card_recomputes_tax_path(self):
+        graph = _graph()
+        evaluated = graph.update(card_deduction=6_000_000)
+        assert "calculated_tax" in evaluated
+        assert "personal_deduction" not in evaluated
+        assert "child_tax_credit" not in evaluated
+
+    def test_unchanged_value_stops_propagation(self):
+        """한도 초과분 변경처럼 노드 값이 그대로이면 하위 노드는 건너뛴다."""
+        graph = _graph(card_deduction=20_000_000, other_income_deductions=10_000_000)
+        evaluated = graph.update(other_income_deductions=12_000_000)
+        assert evaluated == ("limited_card_and_other",)
+
+    def test_same_value_is_noop(self):
+        graph = _graph()
+        assert graph.update(medical_tax_credit=950_700) == ()
+
+    def test_birth_orders_list(self):
+        graph = _graph()
+        graph.update(birth_orders=[1, 2])
+        assert graph.taxpayer.birth_orders == (1, 2)
+        assert graph.result().to_dict() == calc_year_end_tax(
+            **{**KANGMO_KWARGS, "birth_orders": [1, 2]}
+        )
+
+    def test_salary_guard(self):
+        """총급여액 0 이하로 바꾸면 calc_year_end_tax() 가드와 같은 결과."""
+        graph = _graph()
+        graph.update(total_salary=0)
+        assert graph.result().to_dict() == calc_year_end_tax(
+            **{**KANGMO_KWARGS, "total_salary": 0}
+        )
+        graph.update(total_salary=65_400_000)
+        assert graph.result().to_dict() == calc_year_end_tax(**KANGMO_KWARGS)
+
+    def test_unknown_field(self):
+        with pytest.raises(TypeError):
+            _graph().update(bonus=1)
+
+    def test_random_edits_match_full_recompute(self):
+        rng = random.Random(13)
+        graph = _graph()
+        kwargs = dict(KANGMO_KWARGS)
+        for _ in range(200):
+            field = rng.choice([
+                "total_salary", "num_dependents", "elderly_count", "national_pension",
+                "health_insurance", "card_deduction", "other_income_deductions",
+                "children_over_8", "pension_savings", "retirement_pension",
+                "medical_tax_credit", "other_tax_credits", "prepaid_tax",
+            ])
+            value = rng.randint(0, 100_000_000) if field != "num_dependents" else rng.randint(1, 6)
+            if field in ("elderly_count", "children_over_8"):
+                value = rng.randint(0, 3)
+            kwargs[field] = value
+            graph.update(**{field: value})
+            assert graph.result().to_dict() == calc_year_end_tax(**kwargs)
+
+
+class TestDownstream:
+    """입력 필드별 최대 영향 범위."""
+
+    def test_medical(self):
+        assert downstream("medical_tax_credit") == (
+            "special_tax_credit", "total_tax_credit", "determined_tax", "refund_amount",
+        )
+
+    def test_prepaid_tax(self):
+        assert downstream("prepaid_tax") == ("prepaid_tax", "refund_amount")
+
+    def test_salary_reaches_everything_salary_dependent(self):
+        assert "calculated_tax" in downstream("total_salary")
+
+    def test_unknown_field(self):
+        with pytest.raises(KeyError):
+            downstream("bonus")
@@ -0,0 +1,173 @@
+"""
+스트리밍 연말정산 파이프라인 테스트
+"""
+import io
+import json
+import sys
+
+import pytest
+
+from settlement_stream import (
+    iter_rows,
+    main,
+    parse_employee,
+    result_fieldnames,
+    settle_rows,
+    write_rows,
+)
+from tax_rules import load_rules
+from total_calculator import RESULT_KEYS, calc_year_end_tax
+from test_data import CASE
+
+KANGMO_ROW = {
+    "employee_id": "E001",
+    "total_salary": "65400000",
+    "num_dependents": "4",
+    "national_pension": "2500000",
+    "health_insurance": "1300000",
+    "long_term_care": "400000",
+    "housing_loan_deduction": "1000000",
+    "card_deduction": "4895000",
+    "children_over_8": "1",
+    "birth_orders": "3",
+    "pension_savings": "2000000",
+    "retirement_pension": "1000000",
+    "insurance_tax_credit": "120000",
+    "medical_tax_credit": "950700",
+    "education_tax_credit": "630000",
+    "donation_tax_credit": "271818",
+    "prepaid_tax": "1000000",
+    "is_single_parent": "",
+}
+
+KANGMO_CSV = (
+    ",".join(KANGMO_ROW) + "\n" + ",".join(KANGMO_ROW.values()) + "\n"
+)
+
+
+class TestParseEmployee:
+    """입력 행 -> calc_year_end_tax() 인자 변환."""
+
+    def test_csv_strings(self):
+        """CSV 문자열 값: 정수/리스트 변환, 빈 값과 모르는 열은 제외."""
+        kwargs = parse_employee(KANGMO_ROW)
+        assert kwargs["total_salary"] == 65_400_000
+        assert kwargs["birth_orders"] == [3]
+        assert "is_single_parent" not in kwargs
+        assert "employee_id" not in kwargs
+        assert calc_year_end_tax(**kwargs)["refund_amount"] == CASE["refund_amount"]
+
+    def test_json_values(self):
+        """JSON 값: bool/리스트 그대로."""
+        kwargs = parse_employee({
+            "total_salary": 30_000_000, "num_dependents": 1,
+            "is_woman_deduction": True, "birth_orders": [1, 2],
+        })
+        assert kwargs["is_woman_deduction"] is True
+        assert kwargs["birth_orders"] == [1, 2]
+
+    @pytest.mark.parametrize("text, expected", [
+        ("true", True), ("Y", True), ("1", True), ("false", False), ("N", False), ("0", False),
+    ])
+    def test_bool_strings(self, text, expected):
+        """bool 문자열."""
+        kwargs = parse_employee({"total_salary": "1", "num_dependents": "1", "is_single_parent": text})
+        assert kwargs["is_single_parent"] is expected
+
+    def test_invalid_bool(self):
+        """해석할 수 없는 bool 값은 ValueError."""
+        with pytest.raises(ValueError, match="is_single_parent"):
+            parse_employee({"total_salary": "1", "num_dependents": "1", "is_single_parent": "maybe"})
+
+    def test_invalid_int_names_field(self):
+        """정수가 아닌 값은 열 이름과 함께 ValueError."""
+        with pytest.raises(ValueError, match="national_pension: 정수가 아닙니다: '1,000'"):
+            parse_employee({"total_salary": "1", "national_pension": "1,000"})
+        with pytest.raises(ValueError, match="birth_orders"):
+            parse_employee({"birth_orders": "1;x"})
+
+    def test_multiple_birth_orders(self):
+        """CSV 출생순위 "1;2"."""
+        assert parse_employee({"birth_orders": "1;2"})["birth_orders"] == [1, 2]
+
+
+class TestStreaming:
+    """행 단위 지연 처리."""
+
+    def test_iter_rows_is_lazy(self):
+        """입력을 끝까지 읽기 전에 첫 행을 내보낸다."""
+        consumed = []
+
+        def lines():
+            for index in range(3):
+                consumed.append(index)
+                yield json.dumps({"total_salary": 30_000_000, "num_dependents": 1}) + "\n"
+
+        rows = iter_rows(lines(), "jsonl")
+        next(rows)
+        assert consumed == [0]
+
+    def test_settle_rows_with_id_column(self):
+        """식별 열은 결과 맨 앞에 옮겨 쓴다."""
+        rows = iter_rows(io.StringIO(KANGMO_CSV), "csv")
+        result = next(settle_rows(rows, id_column="employee_id"))
+        assert list(result)[0] == "employee_id"
+        assert result["employee_id"] == "E001"
+        assert result["refund_amount"] == CASE["refund_amount"]
+
+    def test_settle_rows_with_rules(self):
+        """지정한 과세연도 규칙으로 정산한다."""
+        rows = iter_rows(io.StringIO(KANGMO_CSV), "csv")
+        result = next(settle_rows(rows, rules=load_rules(2024)))
+        expected = calc_year_end_tax(**parse_employee(KANGMO_ROW), rules=load_rules(2024))
+        assert result == expected
+
+    def test_settle_rows_reports_line_number(self):
+        """형식 오류 행은 행 번호와 함께 ValueError."""
+        rows = [
+            {"total_salary": "30000000", "num_dependents": "1"},
+            {"total_salary": "abc", "num_dependents": "1"},
+        ]
+        results = settle_rows(rows)
+        next(results)
+        with pytest.raises(ValueError, match="2번째 행: total_salary"):
+            next(results)
+
+    def test_write_rows_csv(self):
+        """CSV 출력: 헤더 + 행."""
+        output = io.StringIO()
+        result = calc_year_end_tax(total_salary=50_000_000, num_dependents=1)
+        count = write_rows(output, iter([result, result]), "csv", result_fieldnames())
+        lines = output.getvalue().splitlines()
+        assert count == 2
+        assert lines[0].split(",") == list(RESULT_KEYS)
+        assert len(lines) == 3
+
+
+class TestMain:
+    """표준입력/표준출력 CLI."""
+
+    def test_stdin_csv_to_stdout_jsonl(self, monkeypatch, capsys):
+        """stdin CSV -> stdout JSON Lines."""
+        monkeypatch.setattr(sys, "stdin", io.StringIO(KANGMO_CSV))
+        assert main(["-", "--output-format", "jsonl", "--id-column", "employee_id"]) == 0
+        result = json.loads(capsys.readouterr().out)
+        assert result["employee_id"] == "E001"
+        assert result["determined_tax"] == CASE["determined_tax"]
+
+    def test_file_to_file(self, tmp_path):
+        """파일 입력 -> 파일 출력 (확장자로 형식 판별)."""
+        input_path = tmp_path / "employees.jsonl"
+        input_path.write_text(
+            "\n".join(
+                json.dumps({"total_salary": salary, "num_dependents": 1})
+                for salary in (30_000_000, 60_000_000)
+            ) + "\n",
+            encoding="utf-8",
+        )
+        output_path = tmp_path / "results.csv"
+        main([str(input_path), "-o", str(output_path)])
+
+        lines = output_path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 3
+        assert lines[1].startswith("30000000,")
@@ -0,0 +1,146 @@
+"""
+과세연도별 세법 규칙(TaxRules) 테스트
+"""
+import pytest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import constants
+import tax_rules
+from tax_rules import TaxRules, available_years, load_rules
+from personal_deduction import calc_child_tax_credit
+from total_calculator import calc_year_end_tax, calc_year_end_tax_batch
+from test_data import CASE
+
+KANGMO_KWARGS = dict(
+    total_salary=65_400_000,
+    num_dependents=4,
+    national_pension=2_500_000,
+    health_insurance=1_300_000,
+    long_term_care=400_000,
+    housing_loan_deduction=1_000_000,
+    card_deduction=4_895_000,
+    children_over_8=1,
+    birth_orders=[3],
+    pension_savings=2_000_000,
+    retirement_pension=1_000_000,
+    insurance_tax_credit=120_000,
+    medical_tax_credit=950_700,
+    education_tax_credit=630_000,
+    donation_tax_credit=271_818,
+    prepaid_tax=1_000_000,
+)
+
+
+class TestLoadRules:
+    """연도별 지연 로드 및 공유."""
+
+    def test_default_year(self):
+        assert load_rules().year == tax_rules.DEFAULT_TAX_YEAR == constants.TAX_YEAR
+
+    def test_same_object_per_year(self):
+        """같은 연도는 항상 같은 객체 (구간표 포함)."""
+        assert load_rules() is load_rules(2025)
+        assert load_rules(2025).income_tax_table is load_rules(2025).income_tax_table
+
+    def test_years_side_by_side(self):
+        """여러 연도 규칙을 한 프로세스에서 동시에 사용."""
+        rules_2024, rules_2025 = load_rules(2024), load_rules(2025)
+        assert rules_2024.CHILD_CREDIT_1 == 150_000
+        assert rules_2025.CHILD_CREDIT_1 == 250_000
+        assert rules_2024.version != rules_2025.version
+
+    def test_available_years(self):
+        assert available_years() == (2024, 2025)
+
+    def test_unknown_year(self):
+        with pytest.raises(KeyError, match="2019"):
+            load_rules(2019)
+
+    def test_year_mismatch(self, monkeypatch):
+        """데이터 파일의 TAX_YEAR가 요청 연도와 다르면 ValueError."""
+        monkeypatch.setitem(tax_rules.RULE_MODULES, 2023, "constants")
+        with pytest.raises(ValueError, match="TAX_YEAR"):
+            load_rules(2023)
+
+
+class TestTaxRules:
+    """불변 상수 묶음."""
+
+    def test_constants_as_attributes(self):
+        rules = load_rules()
+        assert rules.CARD_MINIMUM_USAGE_RATE == constants.CARD_MINIMUM_USAGE_RATE
+        assert rules.constants["TOTAL_DEDUCTION_LIMIT"] == constants.TOTAL_DEDUCTION_LIMIT
+
+    def test_immutable(self):
+        rules = load_rules()
+        with pytest.raises(AttributeError):
+            rules.CHILD_CREDIT_1 = 0
+        with pytest.raises(AttributeError):
+            del rules.CHILD_CREDIT_1
+        with pytest.raises(TypeError):
+            rules.constants["CHILD_CREDIT_1"] = 0
+
+    def test_nested_values_frozen(self):
+        """구간표는 tuple, dict는 읽기 전용 매핑."""
+        rules = load_rules()
+        assert isinstance(rules.INCOME_TAX_BRACKETS, tuple)
+        assert isinstance(rules.INCOME_TAX_BRACKETS[0], tuple)
+        with pytest.raises(TypeError):
+            rules.HOUSING_MORTGAGE_LIMITS_POST_2024["other_15y"] = 0
+
+    def test_missing_required_constant(self):
+        with pytest.raises(ValueError, match="RULES_VERSION"):
+            TaxRules({"TAX_YEAR": 2030})
+
+    def test_repr(self):
+        assert repr(load_rules(2025)) == "TaxRules(year=2025, version='2025.1')"
+
+
+class TestCalculatorsWithRules:
+    """계산기는 rules 인자의 연도 규칙을 적용한다."""
+
+    def test_default_matches_kangmo_case(self):
+        """기본(2025) 규칙은 이강모 사례와 일치 [p.212-219]."""
+        result = calc_year_end_tax(**KANGMO_KWARGS)
+        assert result["child_tax_credit"] == CASE["child_tax_credit"]
+        assert calc_year_end_tax(**KANGMO_KWARGS, rules=load_rules(2025)) == result
+
+    def test_child_credit_2024(self):
+        """2024 귀속 8세 이상 자녀: 1명 15만원, 2명 35만원, 3명 65만원."""
+        rules = load_rules(2024)
+        assert calc_child_tax_credit(1, rules=rules) == 150_000
+        assert calc_child_tax_credit(2, rules=rules) == 350_000
+        assert calc_child_tax_credit(3, rules=rules) == 650_000
+
+    def test_year_end_tax_2024(self):
+        """같은 입력을 2024 규칙으로 재정산하면 자녀세액공제만 달라진다."""
+        result_2025 = calc_year_end_tax(**KANGMO_KWARGS)
+        result_2024 = calc_year_end_tax(**KANGMO_KWARGS, rules=load_rules(2024))
+        assert result_2025["child_tax_credit"] - result_2024["child_tax_credit"] == 100_000
+        assert result_2024["calculated_tax"] == result_2025["calculated_tax"]
+
+    @pytest.mark.skipif(np is None, reason="numpy 미설치")
+    def test_batch_2024_matches_scalar(self):
+        rules = load_rules(2024)
+        rng = np.random.default_rng(11)
+        salary = rng.integers(10_000_000, 150_000_000, 500)
+        dependents = rng.integers(1, 6, 500)
+        children = rng.integers(0, 5, 500)
+        batch = calc_year_end_tax_batch(
+            total_salary=salary,
+            num_dependents=dependents,
+            children_over_8=children,
+            rules=rules,
+        )
+        for index in range(500):
+            expected = calc_year_end_tax(
+                total_salary=int(salary[index]),
+                num_dependents=int(dependents[index]),
+                children_over_8=int(children[index]),
+                rules=rules,
+            )
+            assert {key: int(values[index]) for key, values in batch.items()} == expected
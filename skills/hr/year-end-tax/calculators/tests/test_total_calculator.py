@@ -5,8 +5,16 @@ TDD: RED phase - 테스트를 먼저 작성합니다.
 """
 import pytest
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from total_calculator import (
+    RESULT_KEYS,
+    apply_deduction_limit,
     calc_year_end_tax,
+    calc_year_end_tax_batch,
 )
 from test_data import CASE
 
@@ -527,3 +535,128 @@ class TestDeductionLimit:
         )
         # card_deduction(4,895,000) + other_income_deductions(0) < 25,000,000
         assert result["card_deduction"] == 4_895_000
+
+    def test_apply_deduction_limit(self):
+        """합계가 2,500만원을 넘으면 2,500만원까지만."""
+        assert apply_deduction_limit(4_895_000, 1_000_000) == 5_895_000
+        assert apply_deduction_limit(20_000_000, 8_000_000) == 25_000_000
+
+
+# =============================================================================
+# 배치 계산 (calc_year_end_tax_batch)
+# =============================================================================
+KANGMO_KWARGS = {
+    "total_salary": 65_400_000,
+    "num_dependents": 4,
+    "national_pension": 2_500_000,
+    "health_insurance": 1_300_000,
+    "long_term_care": 400_000,
+    "housing_loan_deduction": 1_000_000,
+    "card_deduction": 4_895_000,
+    "children_over_8": 1,
+    "pension_savings": 2_000_000,
+    "retirement_pension": 1_000_000,
+    "insurance_tax_credit": 120_000,
+    "medical_tax_credit": 950_700,
+    "education_tax_credit": 630_000,
+    "donation_tax_credit": 271_818,
+    "prepaid_tax": 1_000_000,
+}
+
+
+@pytest.mark.skipif(np is None, reason="numpy 미설치")
+class TestYearEndTaxBatch:
+    """배치 계산은 스칼라 calc_year_end_tax()와 행별로 정확히 일치해야 한다."""
+
+    @pytest.fixture
+    def population(self):
+        """무작위 직원 2,000명 (총급여 0 이하 행 포함)."""
+        rng = np.random.default_rng(2025)
+        size = 2_000
+        columns = {
+            "total_salary": rng.integers(-1_000_000, 400_000_000, size),
+            "num_dependents": rng.integers(1, 7, size),
+            "elderly_count": rng.integers(0, 3, size),
+            "disabled_count": rng.integers(0, 2, size),
+            "is_single_parent": rng.random(size) < 0.1,
+            "is_woman_deduction": rng.random(size) < 0.2,
+            "national_pension": rng.integers(0, 3_000_000, size),
+            "health_insurance": rng.integers(0, 3_000_000, size),
+            "long_term_care": rng.integers(0, 500_000, size),
+            "employment_insurance": rng.integers(0, 500_000, size),
+            "housing_loan_deduction": rng.integers(0, 5_000_000, size),
+            "card_deduction": rng.integers(0, 20_000_000, size),
+            "other_income_deductions": rng.integers(0, 10_000_000, size),
+            "children_over_8": rng.integers(0, 5, size),
+            "pension_savings": rng.integers(0, 8_000_000, size),
+            "retirement_pension": rng.integers(0, 8_000_000, size),
+            "insurance_tax_credit": rng.integers(0, 300_000, size),
+            "medical_tax_credit": rng.integers(0, 1_000_000, size),
+            "education_tax_credit": rng.integers(0, 1_000_000, size),
+            "donation_tax_credit": rng.integers(0, 500_000, size),
+            "other_tax_credits": rng.integers(0, 300_000, size),
+            "prepaid_tax": rng.integers(0, 20_000_000, size),
+        }
+        birth_orders = [
+            [int(order) for order in rng.integers(1, 5, rng.integers(0, 3))] or None
+            for _ in range(size)
+        ]
+        return columns, birth_orders
+
+    def test_kangmo_case(self):
+        """이강모 사례 1행 배치 = PDF 값."""
+        columns = {key: np.array([value]) for key, value in KANGMO_KWARGS.items()}
+        result = calc_year_end_tax_batch(**columns, birth_orders=[[3]])
+        assert result["determined_tax"][0] == CASE["determined_tax"]
+        assert result["refund_amount"][0] == CASE["refund_amount"]
+
+    def test_result_keys_and_dtype(self):
+        """결과는 RESULT_KEYS 순서의 int64 열."""
+        result = calc_year_end_tax_batch(
+            total_salary=np.array([30_000_000, 80_000_000]),
+            num_dependents=np.array([1, 3]),
+        )
+        assert tuple(result) == RESULT_KEYS
+        for key, values in result.items():
+            assert values.dtype == np.int64, key
+            assert values.shape == (2,), key
+
+    def test_matches_scalar(self, population):
+        """무작위 모집단 전 행이 스칼라 계산과 일치."""
+        columns, birth_orders = population
+        result = calc_year_end_tax_batch(**columns, birth_orders=birth_orders)
+
+        for row in range(len(birth_orders)):
+            kwargs = {key: values[row].item() for key, values in columns.items()}
+            expected = calc_year_end_tax(**kwargs, birth_orders=birth_orders[row])
+            for key in RESULT_KEYS:
+                assert result[key][row] == expected[key], (row, key)
+
+    def test_scalar_defaults_broadcast(self):
+        """스칼라 인자는 전 행에 공통 적용."""
+        result = calc_year_end_tax_batch(
+            total_salary=np.array([50_000_000, 60_000_000]),
+            num_dependents=1,
+            prepaid_tax=500_000,
+        )
+        assert result["prepaid_tax"].tolist() == [500_000, 500_000]
+        assert result["personal_deduction"].tolist() == [1_500_000, 1_500_000]
+
+    def test_non_positive_salary_rows(self):
+        """총급여 0 이하 행: 기납부세액만 환급."""
+        result = calc_year_end_tax_batch(
+            total_salary=np.array([0, -5_000_000]),
+            num_dependents=np.array([1, 2]),
+            prepaid_tax=np.array([100_000, 0]),
+        )
+        assert result["total_salary"].tolist() == [0, 0]
+        assert result["personal_deduction"].tolist() == [0, 0]
+        assert result["refund_amount"].tolist() == [-100_000, 0]
+
+    def test_length_mismatch_raises(self):
+        """열 길이가 다르면 ValueError."""
+        with pytest.raises(ValueError):
+            calc_year_end_tax_batch(
+                total_salary=np.array([50_000_000, 60_000_000]),
+                num_dependents=np.array([1, 2, 3]),
+            )
@@ -0,0 +1,100 @@
+"""
+12개월 원천징수 시뮬레이터 테스트
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tax_rules import load_rules
+from total_calculator import calc_year_end_tax
+from withholding_simulator import MONTHS, project_months, simulate_year_batch
+from withholding_table import WithholdingTable, calc_monthly_withholding_batch
+
+
+@pytest.fixture(scope="module")
+def payroll():
+    rng = np.random.default_rng(16)
+    base = rng.integers(2_000_000, 9_000_000, 200)
+    bonus = np.zeros((200, MONTHS), dtype=np.int64)
+    bonus[:, 11] = rng.integers(0, 5_000_000, 200)  # 12월 상여
+    return base[:, np.newaxis] + bonus
+
+
+class TestSimulateYear:
+    """월별 원천징수 -> 기납부세액 -> 연말정산."""
+
+    def test_prepaid_is_sum_of_withholding(self, payroll):
+        result = simulate_year_batch(payroll, dependents=3, children=1)
+        assert result["monthly_withholding"].shape == payroll.shape
+        assert np.array_equal(result["prepaid_tax"], result["monthly_withholding"].sum(axis=1))
+        assert np.array_equal(result["cumulative_withholding"][:, -1], result["prepaid_tax"])
+        assert np.all(np.diff(result["cumulative_withholding"], axis=1) >= 0)
+
+    def test_monthly_withholding_matches_formula(self, payroll):
+        result = simulate_year_batch(payroll, dependents=2)
+        expected = calc_monthly_withholding_batch(payroll[:, 11], 2)
+        assert np.array_equal(result["monthly_withholding"][:, 11], expected)
+
+    def test_settlement_matches_scalar(self, payroll):
+        dependents = np.arange(200) % 5 + 1
+        result = simulate_year_batch(
+            payroll, dependents, children=0, national_pension=2_000_000, medical_tax_credit=300_000,
+        )
+        for index in range(0, 200, 17):
+            expected = calc_year_end_tax(
+                total_salary=int(payroll[index].sum()),
+                num_dependents=int(dependents[index]),
+                national_pension=2_000_000,
+                medical_tax_credit=300_000,
+                prepaid_tax=int(result["prepaid_tax"][index]),
+            )
+            assert {key: int(result[key][index]) for key in expected} == expected
+
+    def test_deductions_produce_refund(self):
+        """간이세액표에 없는 공제(연금보험료, 특별세액공제)만큼 환급."""
+        payroll = np.full((1, MONTHS), 5_000_000)
+        result = simulate_year_batch(
+            payroll, dependents=1, national_pension=2_700_000, insurance_tax_credit=120_000,
+        )
+        assert result["refund_amount"][0] < 0
+
+    def test_monthly_dependents_use_december(self):
+        """연중 가족 수 변동: 월별 원천징수는 해당 월, 연말정산은 12월 값."""
+        payroll = np.full((1, MONTHS), 6_000_000)
+        dependents = np.array([[1] * 6 + [3] * 6])
+        result = simulate_year_batch(payroll, dependents)
+        withholding = result["monthly_withholding"][0]
+        assert withholding[0] > withholding[11]
+        assert result["personal_deduction"][0] == 3 * load_rules().PERSONAL_DEDUCTION_PER_PERSON
+
+    def test_with_table(self, payroll):
+        table = WithholdingTable.build(salary_max=10_000_000, salary_step=1_000)
+        result = simulate_year_batch(payroll, dependents=3, children=1, table=table)
+        expected = table.lookup_batch(payroll.ravel(), 3, 1).reshape(payroll.shape)
+        assert np.array_equal(result["monthly_withholding"], expected)
+
+    def test_rules(self, payroll):
+        result = simulate_year_batch(payroll, 3, 2, rules=load_rules(2024))
+        assert np.all(result["child_tax_credit"] == 350_000)
+
+    def test_invalid_shape(self):
+        with pytest.raises(ValueError):
+            simulate_year_batch(np.zeros((3, 11)), 1)
+
+
+class TestProjectMonths:
+    """미지급 월 채우기."""
+
+    def test_repeats_last_month(self):
+        paid = np.array([[100, 200, 300]])
+        assert project_months(paid, 5).tolist() == [[100, 200, 300, 300, 300]]
+
+    def test_full_year_unchanged(self):
+        paid = np.arange(24).reshape(2, 12)
+        assert np.array_equal(project_months(paid), paid)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            project_months(np.zeros((2, 13)))
+        with pytest.raises(ValueError):
+            project_months(np.zeros(12))
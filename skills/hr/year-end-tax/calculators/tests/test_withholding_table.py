@@ -0,0 +1,116 @@
+"""
+근로소득 간이세액표 생성기 테스트
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tax_rules import load_rules
+from total_calculator import calc_year_end_tax
+from withholding_table import (
+    MAX_CHILDREN,
+    MAX_DEPENDENTS,
+    WithholdingTable,
+    calc_monthly_withholding_batch,
+    main,
+)
+
+
+def _expected(monthly_salary, dependents, children=0, rules=None):
+    """같은 산식을 calc_year_end_tax()로 계산 (연 결정세액 / 12, 10원 미만 절사)."""
+    result = calc_year_end_tax(
+        total_salary=monthly_salary * 12,
+        num_dependents=dependents,
+        children_over_8=children,
+        rules=rules,
+    )
+    return result["determined_tax"] // 12 // 10 * 10
+
+
+@pytest.fixture(scope="module")
+def table():
+    return WithholdingTable.build(salary_max=3_000_000, salary_step=50_000)
+
+
+class TestMonthlyWithholding:
+    """간이세액표 산식."""
+
+    @pytest.mark.parametrize("monthly_salary", [0, 1_000_000, 3_500_000, 5_450_000, 20_000_000])
+    @pytest.mark.parametrize("dependents, children", [(1, 0), (4, 1), (4, 3), (11, 10)])
+    def test_matches_year_end_tax(self, monthly_salary, dependents, children):
+        result = calc_monthly_withholding_batch(monthly_salary, dependents, children)
+        assert int(result) == _expected(monthly_salary, dependents, children)
+
+    def test_rounded_down_to_10_won(self):
+        result = calc_monthly_withholding_batch(np.arange(1_000_000, 9_000_000, 7_777), 1)
+        assert np.all(result % 10 == 0)
+
+    def test_more_dependents_less_tax(self):
+        result = calc_monthly_withholding_batch(5_000_000, np.arange(1, 12))
+        assert np.all(np.diff(result) <= 0)
+
+
+class TestWithholdingTable:
+    """격자 생성과 O(1) 조회."""
+
+    def test_shape(self, table):
+        assert table.cells.shape == (60, MAX_DEPENDENTS, MAX_CHILDREN + 1)
+        assert table.salary_max == 3_000_000
+        assert table.tax_year == load_rules().year
+
+    def test_cells_use_bracket_midpoint(self, table):
+        """구간 [2,500,000, 2,550,000)의 세액은 중간값 2,525,000 기준."""
+        assert table.lookup(2_500_000, 3, 1) == _expected(2_525_000, 3, 1)
+        assert table.lookup(2_549_999, 3, 1) == _expected(2_525_000, 3, 1)
+
+    def test_outside_range_computed_directly(self, table):
+        assert table.lookup(4_123_000, 2) == _expected(4_123_000, 2)
+
+    def test_invalid_dependents(self, table):
+        with pytest.raises(ValueError):
+            table.lookup(2_000_000, 0)
+        with pytest.raises(ValueError):
+            table.lookup(2_000_000, 12)
+        with pytest.raises(ValueError):
+            table.lookup(2_000_000, 3, MAX_CHILDREN + 1)
+
+    def test_lookup_batch_matches_lookup(self, table):
+        rng = np.random.default_rng(15)
+        salary = rng.integers(0, 5_000_000, 500)
+        dependents = rng.integers(1, MAX_DEPENDENTS + 1, 500)
+        children = rng.integers(0, MAX_CHILDREN + 1, 500)
+        batch = table.lookup_batch(salary, dependents, children)
+        assert batch.tolist() == [
+            table.lookup(int(s), int(d), int(c)) for s, d, c in zip(salary, dependents, children)
+        ]
+
+    def test_save_load_round_trip(self, table, tmp_path):
+        path = tmp_path / "withholding.npz"
+        table.save(path)
+        loaded = WithholdingTable.load(path)
+        assert np.array_equal(loaded.cells, table.cells)
+        assert (loaded.salary_min, loaded.salary_step) == (table.salary_min, table.salary_step)
+        assert loaded.version == table.version
+        assert loaded.lookup(9_000_000, 1) == table.lookup(9_000_000, 1)
+
+    def test_rules_year(self):
+        """2024 규칙 표는 자녀세액공제가 작아 세액이 같거나 크다."""
+        grid = dict(salary_max=6_000_000, salary_step=500_000)
+        table_2024 = WithholdingTable.build(load_rules(2024), **grid)
+        table_2025 = WithholdingTable.build(load_rules(2025), **grid)
+        assert np.all(table_2024.cells >= table_2025.cells)
+        assert table_2024.lookup(5_200_000, 3, 1) == _expected(5_250_000, 3, 1, load_rules(2024))
+
+    def test_invalid_range(self):
+        with pytest.raises(ValueError):
+            WithholdingTable.build(salary_max=0)
+
+
+class TestMain:
+    """CLI."""
+
+    def test_writes_table(self, tmp_path, capsys):
+        path = tmp_path / "table.npz"
+        assert main(["-o", str(path), "--salary-max", "1000000", "--salary-step", "100000"]) == 0
+        assert WithholdingTable.load(path).cells.shape[0] == 10
+        assert "구간" in capsys.readouterr().err
@@ -11,25 +11,43 @@ References:
   - 인적공제/자녀세액공제: personal_deduction.py
   - 연금공제: pension_deduction.py
   - 소득공제 종합한도: 조특법 제132조의2 [p.147]
+
+rules 인자로 과세연도별 세법 규칙(tax_rules.TaxRules)을 선택합니다 (기본 2025).
+
+settle()은 같은 과정을 records.TaxpayerInput -> records.SettlementResult로,
+calc_year_end_tax_batch()는 직원 단위 열(NumPy int64 배열)로 수행합니다.
+배치 계산은 규칙과 무관한 prepare_settlement_batch()와 규칙별 settle_prepared_batch()
+두 단계로 나뉘며, 재정산(resettlement)/격자 계산(scenario_sweep) 등이 이 단계를 재사용합니다.
 """
+try:
+    import numpy as np
+    from ragged import as_ragged
+except ImportError:  # numpy는 calc_year_end_tax_batch에서만 필요
+    np = None
+
 from income_tax import (
-    calc_earned_income_deduction,
-    calc_earned_income_amount,
     calc_taxable_income,
     calc_calculated_tax,
     calc_earned_income_tax_credit,
+    calc_calculated_tax_batch,
+    calc_earned_income_tax_credit_batch,
 )
 from personal_deduction import (
     calc_basic_personal_deduction,
     calc_additional_deduction,
     calc_child_tax_credit,
+    calc_additional_deduction_batch,
+    calc_child_tax_credit_batch,
 )
 from insurance_deduction import calc_insurance_income_deduction
 from pension_deduction import (
     calc_pension_insurance_deduction,
     calc_pension_tax_credit,
+    calc_pension_tax_credit_batch,
 )
-from constants import TOTAL_DEDUCTION_LIMIT
+from tax_rules import TaxRules, load_rules
+from records import INPUT_FIELDS, RESULT_KEYS, SettlementResult, TaxpayerInput
+from salary_cache import salary_profile, salary_profiles_batch
 
 
 def calc_year_end_tax(
@@ -60,6 +78,8 @@ def calc_year_end_tax(
     other_tax_credits: int = 0,
     # 기납부
     prepaid_tax: int = 0,
+    # 과세연도
+    rules: TaxRules | None = None,
 ) -> dict:
     """통합 연말정산 계산 [p.94, p.162]
 
@@ -90,36 +110,86 @@ def calc_year_end_tax(
         donation_tax_credit: 기부금 세액공제 (사전 계산값)
         other_tax_credits: 기타 세액공제
         prepaid_tax: 기납부세액
+        rules: 과세연도 세법 규칙 (기본: load_rules())
 
     Returns:
         dict with all intermediate and final values
     """
+    return _settle(
+        total_salary, num_dependents, elderly_count, disabled_count,
+        is_single_parent, is_woman_deduction, national_pension, health_insurance,
+        long_term_care, employment_insurance, housing_loan_deduction, card_deduction,
+        other_income_deductions, children_over_8, birth_orders, pension_savings,
+        retirement_pension, insurance_tax_credit, medical_tax_credit,
+        education_tax_credit, donation_tax_credit, other_tax_credits, prepaid_tax,
+        load_rules() if rules is None else rules,
+    ).to_dict()
+
+
+def settle(taxpayer: TaxpayerInput, rules: TaxRules | None = None) -> SettlementResult:
+    """통합 연말정산 계산 (레코드 버전) [p.94, p.162]
+
+    calc_year_end_tax()와 같은 계산을 수행하되, 입력과 결과를
+    불변 __slots__ 레코드로 주고받습니다 (직원별 dict 할당 없음).
+
+    Args:
+        taxpayer: 연말정산 입력 레코드
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        연말정산 결과 레코드
+    """
+    return _settle(
+        taxpayer.total_salary, taxpayer.num_dependents, taxpayer.elderly_count,
+        taxpayer.disabled_count, taxpayer.is_single_parent, taxpayer.is_woman_deduction,
+        taxpayer.national_pension, taxpayer.health_insurance, taxpayer.long_term_care,
+        taxpayer.employment_insurance, taxpayer.housing_loan_deduction,
+        taxpayer.card_deduction, taxpayer.other_income_deductions,
+        taxpayer.children_over_8, taxpayer.birth_orders, taxpayer.pension_savings,
+        taxpayer.retirement_pension, taxpayer.insurance_tax_credit,
+        taxpayer.medical_tax_credit, taxpayer.education_tax_credit,
+        taxpayer.donation_tax_credit, taxpayer.other_tax_credits, taxpayer.prepaid_tax,
+        load_rules() if rules is None else rules,
+    )
+
+
+def _settle(
+    total_salary, num_dependents, elderly_count, disabled_count,
+    is_single_parent, is_woman_deduction, national_pension, health_insurance,
+    long_term_care, employment_insurance, housing_loan_deduction, card_deduction,
+    other_income_deductions, children_over_8, birth_orders, pension_savings,
+    retirement_pension, insurance_tax_credit, medical_tax_credit,
+    education_tax_credit, donation_tax_credit, other_tax_credits, prepaid_tax, rules,
+) -> SettlementResult:
+    """Step 1~11 계산 본체 (인자 순서 = calc_year_end_tax())."""
     # Guard: 총급여액은 음수일 수 없음
     if total_salary <= 0:
-        return {
-            "total_salary": 0, "earned_income_deduction": 0,
-            "earned_income_amount": 0, "personal_deduction": 0,
-            "pension_insurance_deduction": 0, "insurance_income_deduction": 0,
-            "housing_deduction": 0, "card_deduction": 0,
-            "total_income_deduction": 0, "taxable_income": 0,
-            "calculated_tax": 0, "earned_income_tax_credit": 0,
-            "child_tax_credit": 0, "pension_tax_credit": 0,
-            "special_tax_credit": 0, "total_tax_credit": 0,
-            "determined_tax": 0, "prepaid_tax": prepaid_tax,
-            "refund_amount": -prepaid_tax,
-        }
-
-    # Step 1: 근로소득공제 및 근로소득금액
-    earned_income_deduction = calc_earned_income_deduction(total_salary)
-    earned_income_amount = calc_earned_income_amount(total_salary)
+        return SettlementResult(
+            total_salary=0, earned_income_deduction=0,
+            earned_income_amount=0, personal_deduction=0,
+            pension_insurance_deduction=0, insurance_income_deduction=0,
+            housing_deduction=0, card_deduction=0,
+            total_income_deduction=0, taxable_income=0,
+            calculated_tax=0, earned_income_tax_credit=0,
+            child_tax_credit=0, pension_tax_credit=0,
+            special_tax_credit=0, total_tax_credit=0,
+            determined_tax=0, prepaid_tax=prepaid_tax,
+            refund_amount=-prepaid_tax,
+        )
+
+    # Step 1: 근로소득공제 및 근로소득금액 (총급여액 파생값 캐시)
+    profile = salary_profile(total_salary, rules)
+    earned_income_deduction = profile.earned_income_deduction
+    earned_income_amount = profile.earned_income_amount
 
     # Step 2: 인적공제
-    basic_personal = calc_basic_personal_deduction(num_dependents)
+    basic_personal = calc_basic_personal_deduction(num_dependents, rules)
     additional_personal = calc_additional_deduction(
         elderly_count=elderly_count,
         disabled_count=disabled_count,
         is_single_parent=is_single_parent,
         is_woman_deduction=is_woman_deduction,
+        rules=rules,
     )
     personal_deduction = basic_personal + additional_personal
 
@@ -142,8 +212,8 @@ def calc_year_end_tax(
     )
 
     # Step 6: 소득공제 종합한도 적용 (카드 + 기타)
-    limited_card_and_other = _apply_deduction_limit(
-        card_deduction, other_income_deductions,
+    limited_card_and_other = apply_deduction_limit(
+        card_deduction, other_income_deductions, rules,
     )
 
     # Step 7: 과세표준
@@ -151,22 +221,24 @@ def calc_year_end_tax(
     taxable_income = calc_taxable_income(earned_income_amount, total_deductions)
 
     # Step 8: 산출세액
-    calculated_tax = calc_calculated_tax(taxable_income)
+    calculated_tax = calc_calculated_tax(taxable_income, rules)
 
     # Step 9: 세액공제
     earned_income_tax_credit = calc_earned_income_tax_credit(
-        calculated_tax, total_salary,
+        calculated_tax, total_salary, rules,
     )
 
     child_tax_credit = calc_child_tax_credit(
         children_over_8=children_over_8,
         birth_orders=birth_orders,
+        rules=rules,
     )
 
     pension_tax_credit = calc_pension_tax_credit(
         total_salary=total_salary,
         pension_savings=pension_savings,
         retirement_pension=retirement_pension,
+        rules=rules,
     )
 
     special_tax_credit = (
@@ -190,32 +262,33 @@ def calc_year_end_tax(
     # Step 11: 환급/추가납부
     refund_amount = determined_tax - prepaid_tax
 
-    return {
-        "total_salary": total_salary,
-        "earned_income_deduction": earned_income_deduction,
-        "earned_income_amount": earned_income_amount,
-        "personal_deduction": personal_deduction,
-        "pension_insurance_deduction": pension_insurance_deduction,
-        "insurance_income_deduction": insurance_income_deduction,
-        "housing_deduction": housing_loan_deduction,
-        "card_deduction": card_deduction,
-        "total_income_deduction": total_income_deduction,
-        "taxable_income": taxable_income,
-        "calculated_tax": calculated_tax,
-        "earned_income_tax_credit": earned_income_tax_credit,
-        "child_tax_credit": child_tax_credit,
-        "pension_tax_credit": pension_tax_credit,
-        "special_tax_credit": special_tax_credit,
-        "total_tax_credit": total_tax_credit,
-        "determined_tax": determined_tax,
-        "prepaid_tax": prepaid_tax,
-        "refund_amount": refund_amount,
-    }
+    return SettlementResult(
+        total_salary=total_salary,
+        earned_income_deduction=earned_income_deduction,
+        earned_income_amount=earned_income_amount,
+        personal_deduction=personal_deduction,
+        pension_insurance_deduction=pension_insurance_deduction,
+        insurance_income_deduction=insurance_income_deduction,
+        housing_deduction=housing_loan_deduction,
+        card_deduction=card_deduction,
+        total_income_deduction=total_income_deduction,
+        taxable_income=taxable_income,
+        calculated_tax=calculated_tax,
+        earned_income_tax_credit=earned_income_tax_credit,
+        child_tax_credit=child_tax_credit,
+        pension_tax_credit=pension_tax_credit,
+        special_tax_credit=special_tax_credit,
+        total_tax_credit=total_tax_credit,
+        determined_tax=determined_tax,
+        prepaid_tax=prepaid_tax,
+        refund_amount=refund_amount,
+    )
 
 
-def _apply_deduction_limit(
+def apply_deduction_limit(
     card_deduction: int,
     other_income_deductions: int,
+    rules: TaxRules | None = None,
 ) -> int:
     """소득공제 종합한도 적용 (조특법 제132조의2) [p.147]
 
@@ -225,9 +298,275 @@ def _apply_deduction_limit(
     Args:
         card_deduction: 신용카드등 소득공제
         other_income_deductions: 기타 소득공제
+        rules: 과세연도 세법 규칙 (기본: load_rules())
 
     Returns:
         한도 적용 후 합산 소득공제액
     """
+    if rules is None:
+        rules = load_rules()
+
     combined = card_deduction + other_income_deductions
-    return min(combined, TOTAL_DEDUCTION_LIMIT)
+    return min(combined, rules.TOTAL_DEDUCTION_LIMIT)
+
+
+# =============================================================================
+# 배치 계산 (NumPy int64 배열)
+# =============================================================================
+# 배치 열 입력 (birth_orders는 행별 목록이라 별도 인자)
+COLUMN_FIELDS = tuple(name for name in INPUT_FIELDS if name != "birth_orders")
+BOOL_FIELDS = ("is_single_parent", "is_woman_deduction")
+
+
+def calc_year_end_tax_batch(
+    total_salary,
+    num_dependents,
+    elderly_count=0,
+    disabled_count=0,
+    is_single_parent=False,
+    is_woman_deduction=False,
+    national_pension=0,
+    health_insurance=0,
+    long_term_care=0,
+    employment_insurance=0,
+    housing_loan_deduction=0,
+    card_deduction=0,
+    other_income_deductions=0,
+    children_over_8=0,
+    birth_orders=None,
+    pension_savings=0,
+    retirement_pension=0,
+    insurance_tax_credit=0,
+    medical_tax_credit=0,
+    education_tax_credit=0,
+    donation_tax_credit=0,
+    other_tax_credits=0,
+    prepaid_tax=0,
+    rules=None,
+) -> dict:
+    """통합 연말정산 배치 계산 [p.94, p.162]
+
+    calc_year_end_tax()의 Step 1~11을 직원 N명의 열 단위 배열 연산으로
+    수행합니다. 각 인자는 길이 N의 배열(또는 전원 공통인 스칼라)이며,
+    결과는 calc_year_end_tax()와 행별로 정확히 일치합니다.
+
+    규칙과 무관한 단계는 prepare_settlement_batch(), 규칙별 단계는
+    settle_prepared_batch()가 수행합니다 (여러 규칙/격자에서 재사용할 때 직접 호출).
+
+    Args:
+        calc_year_end_tax()와 동일. 단, birth_orders는 행별 출생순위
+        (ragged.RaggedArray 또는 e.g., [[3], [], None])
+
+    Returns:
+        dict: RESULT_KEYS 각 키 -> 길이 N의 int64 배열
+    """
+    salary = np.atleast_1d(np.asarray(total_salary, dtype=np.int64))
+    columns = batch_columns(
+        dict(
+            total_salary=salary,
+            num_dependents=num_dependents,
+            elderly_count=elderly_count,
+            disabled_count=disabled_count,
+            is_single_parent=is_single_parent,
+            is_woman_deduction=is_woman_deduction,
+            national_pension=national_pension,
+            health_insurance=health_insurance,
+            long_term_care=long_term_care,
+            employment_insurance=employment_insurance,
+            housing_loan_deduction=housing_loan_deduction,
+            card_deduction=card_deduction,
+            other_income_deductions=other_income_deductions,
+            children_over_8=children_over_8,
+            pension_savings=pension_savings,
+            retirement_pension=retirement_pension,
+            insurance_tax_credit=insurance_tax_credit,
+            medical_tax_credit=medical_tax_credit,
+            education_tax_credit=education_tax_credit,
+            donation_tax_credit=donation_tax_credit,
+            other_tax_credits=other_tax_credits,
+            prepaid_tax=prepaid_tax,
+        ),
+        salary.shape[0],
+    )
+    return settle_prepared_batch(prepare_settlement_batch(columns, birth_orders), rules)
+
+
+def batch_columns(inputs: dict, size: int | None = None) -> dict:
+    """calc_year_end_tax_batch() 인자 dict -> COLUMN_FIELDS 열 (여부 입력 bool, 나머지 int64).
+
+    없는 입력은 0(False)이고 birth_orders는 무시합니다.
+
+    Args:
+        inputs: 입력 이름 -> 배열/스칼라
+        size: 주면 모든 열을 길이 size로 브로드캐스트 (읽기 전용 뷰),
+              생략하면 각 값의 모양 그대로 (서로 브로드캐스트되는 격자 입력)
+    """
+    columns = {}
+    for name in COLUMN_FIELDS:
+        column = np.asarray(inputs.get(name, 0), dtype=bool if name in BOOL_FIELDS else np.int64)
+        columns[name] = column if size is None else np.broadcast_to(column, (size,))
+    return columns
+
+
+def prepare_settlement_batch(columns: dict, birth_orders=None) -> dict:
+    """calc_year_end_tax_batch() 중 세법 규칙과 무관한 단계.
+
+    입력 열, 연금보험료/보험료 소득공제(Step 3~4, 전액 공제), 카드+기타 소득공제 합계,
+    특별세액공제 합계, 총급여액 0 이하 가드를 한 번 계산하여
+    여러 규칙(settle_prepared_batch)에서 재사용합니다.
+
+    Args:
+        columns: batch_columns() 결과 (서로 브로드캐스트되는 모양, 마지막 축 = 직원)
+        birth_orders: 직원(마지막 축)별 출생순위 (RaggedArray 또는 e.g., [[3], [], None])
+
+    Returns:
+        dict: columns + 단계별 중간값 (settle_prepared_batch() 입력)
+
+    Raises:
+        ValueError: birth_orders 행 수가 마지막 축 길이와 다른 경우
+    """
+    prepared = dict(columns)
+    if birth_orders is not None:
+        birth_orders = as_ragged(birth_orders)
+        shape = np.broadcast_shapes(*(column.shape for column in columns.values()))
+        if (len(birth_orders),) != shape[-1:]:
+            raise ValueError("birth_orders 행 수가 다른 열과 일치하지 않습니다")
+    prepared["birth_orders"] = birth_orders
+
+    # Step 3: 연금보험료 소득공제
+    prepared["pension_insurance_deduction"] = calc_pension_insurance_deduction(
+        columns["national_pension"],
+    )
+    # Step 4: 보험료 소득공제 (건강보험 등)
+    prepared["insurance_income_deduction"] = calc_insurance_income_deduction(
+        health_insurance=columns["health_insurance"],
+        long_term_care=columns["long_term_care"],
+        employment_insurance=columns["employment_insurance"],
+    )
+    prepared["card_and_other"] = columns["card_deduction"] + columns["other_income_deductions"]
+    prepared["special_tax_credit"] = (
+        columns["insurance_tax_credit"]
+        + columns["medical_tax_credit"]
+        + columns["education_tax_credit"]
+        + columns["donation_tax_credit"]
+    )
+    prepared["invalid"] = columns["total_salary"] <= 0
+    return prepared
+
+
+def settle_prepared_batch(prepared: dict, rules=None) -> dict:
+    """calc_year_end_tax_batch() 중 세법 규칙별 단계 (Step 1~2, 5~11 + 가드).
+
+    각 값은 실제로 의존하는 입력의 모양 그대로 계산되고 브로드캐스트로 합쳐집니다
+    (e.g., 총급여액이 (1, N)이면 근로소득공제는 N번만 계산).
+
+    Args:
+        prepared: prepare_settlement_batch() 결과
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        dict: RESULT_KEYS 각 키 -> 입력 모양을 브로드캐스트한 int64 배열
+    """
+    if rules is None:
+        rules = load_rules()
+    p = prepared
+    salary = p["total_salary"]
+
+    # Step 1: 근로소득공제 및 근로소득금액 (고유 총급여액별 캐시 조회)
+    profile = {
+        name: column.reshape(salary.shape)
+        for name, column in salary_profiles_batch(salary.ravel(), rules).items()
+    }
+    earned_income_amount = profile["earned_income_amount"]
+
+    # Step 2: 인적공제
+    personal_deduction = calc_basic_personal_deduction(
+        p["num_dependents"], rules,
+    ) + calc_additional_deduction_batch(
+        elderly_count=p["elderly_count"],
+        disabled_count=p["disabled_count"],
+        is_single_parent=p["is_single_parent"],
+        is_woman_deduction=p["is_woman_deduction"],
+        rules=rules,
+    )
+
+    # Step 5: 소득공제 합계 (카드공제 및 기타 제외)
+    total_income_deduction = (
+        personal_deduction
+        + p["pension_insurance_deduction"]
+        + p["insurance_income_deduction"]
+        + p["housing_loan_deduction"]
+    )
+
+    # Step 6: 소득공제 종합한도 적용 (카드 + 기타)
+    limited_card_and_other = np.minimum(p["card_and_other"], rules.TOTAL_DEDUCTION_LIMIT)
+
+    # Step 7: 과세표준
+    taxable_income = np.maximum(
+        0, earned_income_amount - (total_income_deduction + limited_card_and_other),
+    )
+
+    # Step 8: 산출세액
+    calculated_tax = calc_calculated_tax_batch(taxable_income, rules)
+
+    # Step 9: 세액공제
+    earned_income_tax_credit = calc_earned_income_tax_credit_batch(
+        calculated_tax, salary, rules, credit_limit=profile["earned_income_tax_credit_limit"],
+    )
+    child_tax_credit = calc_child_tax_credit_batch(p["children_over_8"], rules=rules)
+    if p["birth_orders"] is not None:
+        # 출산/입양 공제는 직원(마지막 축)별
+        child_tax_credit = child_tax_credit + calc_child_tax_credit_batch(
+            np.zeros(len(p["birth_orders"]), dtype=np.int64), p["birth_orders"], rules,
+        )
+    pension_tax_credit = calc_pension_tax_credit_batch(
+        salary, p["pension_savings"], p["retirement_pension"], rules,
+    )
+    total_tax_credit = (
+        earned_income_tax_credit
+        + child_tax_credit
+        + pension_tax_credit
+        + p["special_tax_credit"]
+        + p["other_tax_credits"]
+    )
+
+    # Step 10: 결정세액 (음수 불가)
+    determined_tax = np.maximum(0, calculated_tax - total_tax_credit)
+
+    # Step 11: 환급/추가납부
+    prepaid = p["prepaid_tax"]
+    refund_amount = determined_tax - prepaid
+
+    result = {
+        "total_salary": salary,
+        "earned_income_deduction": profile["earned_income_deduction"],
+        "earned_income_amount": earned_income_amount,
+        "personal_deduction": personal_deduction,
+        "pension_insurance_deduction": p["pension_insurance_deduction"],
+        "insurance_income_deduction": p["insurance_income_deduction"],
+        "housing_deduction": p["housing_loan_deduction"],
+        "card_deduction": p["card_deduction"],
+        "total_income_deduction": total_income_deduction,
+        "taxable_income": taxable_income,
+        "calculated_tax": calculated_tax,
+        "earned_income_tax_credit": earned_income_tax_credit,
+        "child_tax_credit": child_tax_credit,
+        "pension_tax_credit": pension_tax_credit,
+        "special_tax_credit": p["special_tax_credit"],
+        "total_tax_credit": total_tax_credit,
+        "determined_tax": determined_tax,
+        "prepaid_tax": prepaid,
+        "refund_amount": refund_amount,
+    }
+
+    # Guard: 총급여액 0 이하 행은 모든 값 0 (기납부세액/환급액 제외)
+    invalid = p["invalid"]
+    for key in RESULT_KEYS:
+        if key == "prepaid_tax":
+            result[key] = prepaid.copy()
+        elif key == "refund_amount":
+            result[key] = np.where(invalid, -prepaid, refund_amount)
+        else:
+            result[key] = np.where(invalid, 0, result[key]).astype(np.int64)
+
+    return result
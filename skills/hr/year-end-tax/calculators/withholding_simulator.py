@@ -0,0 +1,111 @@
+"""
+12개월 원천징수 시뮬레이터
+
+직원별 12개월 급여 기록(월급여액, 공제대상가족 수, 자녀 수)에 매월 간이세액표를 적용하여
+기납부세액(prepaid_tax)을 만들고, 연말정산(calc_year_end_tax_batch)까지 이어서 계산합니다.
+모든 단계가 (직원 N x 12개월) 배열 연산이므로 4분기에 전사 1월 환급 현금흐름을 예측할 수 있습니다.
+
+아직 지급하지 않은 달은 project_months()로 마지막 지급월을 반복하여 채웁니다.
+
+Usage:
+    monthly_salary = project_months(paid_salary)  # (N, 10) -> (N, 12)
+    result = simulate_year_batch(monthly_salary, dependents=3, children=1)
+    result["cumulative_withholding"][:, -1]  # = result["prepaid_tax"]
+    result["refund_amount"].sum()            # 1월 환급(-)/추가납부(+) 합계
+"""
+import numpy as np
+
+from tax_rules import TaxRules, load_rules
+from total_calculator import calc_year_end_tax_batch
+from withholding_table import WithholdingTable, calc_monthly_withholding_batch
+
+MONTHS = 12
+
+
+def project_months(values, months: int = MONTHS):
+    """지급월 기록 (N, k)를 마지막 달 반복으로 (N, months)까지 채운다.
+
+    Args:
+        values: 직원별 월 기록 배열 (N, k), 1 <= k <= months
+        months: 채울 개월 수 (기본 12)
+
+    Returns:
+        (N, months) int64 배열
+
+    Raises:
+        ValueError: 2차원이 아니거나 k가 1~months 범위를 벗어난 경우
+    """
+    values = np.asarray(values, dtype=np.int64)
+    if values.ndim != 2 or not 1 <= values.shape[1] <= months:
+        raise ValueError(f"월 기록은 (N, 1~{months}) 배열이어야 합니다: {values.shape}")
+    missing = months - values.shape[1]
+    if missing == 0:
+        return values
+    return np.concatenate([values, np.repeat(values[:, -1:], missing, axis=1)], axis=1)
+
+
+def simulate_year_batch(
+    monthly_salary,
+    dependents,
+    children=0,
+    table: WithholdingTable | None = None,
+    rules: TaxRules | None = None,
+    **settlement_kwargs,
+) -> dict:
+    """12개월 원천징수 + 연말정산 배치 시뮬레이션.
+
+    Args:
+        monthly_salary: 월급여액 배열 (N, 12), 비과세 제외 (원)
+        dependents: 공제대상가족 수 (N, 12) / (N,) / 스칼라. 연말정산은 12월 값 사용
+        children: 8세 이상 20세 이하 자녀 수 (N, 12) / (N,) / 스칼라. 연말정산은 12월 값 사용
+        table: 월 원천징수에 쓸 간이세액표 (기본: 같은 산식으로 직접 계산)
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+        **settlement_kwargs: calc_year_end_tax_batch()의 나머지 인자
+            (total_salary, num_dependents, children_over_8, prepaid_tax 제외)
+
+    Returns:
+        dict: calc_year_end_tax_batch() 결과 (길이 N 배열) +
+            monthly_withholding: 월별 원천징수세액 (N, 12)
+            cumulative_withholding: 월말 누적 원천징수세액 (N, 12)
+
+    Raises:
+        ValueError: monthly_salary가 (N, 12) 배열이 아닌 경우
+    """
+    if rules is None:
+        rules = load_rules()
+
+    salary = np.asarray(monthly_salary, dtype=np.int64)
+    if salary.ndim != 2 or salary.shape[1] != MONTHS:
+        raise ValueError(f"monthly_salary는 (N, {MONTHS}) 배열이어야 합니다: {salary.shape}")
+    monthly_dependents = _monthly(dependents, salary.shape)
+    monthly_children = _monthly(children, salary.shape)
+
+    if table is None:
+        withholding = calc_monthly_withholding_batch(
+            salary, monthly_dependents, monthly_children, rules,
+        )
+    else:
+        withholding = table.lookup_batch(
+            salary.ravel(), monthly_dependents.ravel(), monthly_children.ravel(),
+        ).reshape(salary.shape)
+    cumulative = np.cumsum(withholding, axis=1)
+
+    result = calc_year_end_tax_batch(
+        total_salary=salary.sum(axis=1),
+        num_dependents=monthly_dependents[:, -1],
+        children_over_8=monthly_children[:, -1],
+        prepaid_tax=cumulative[:, -1],
+        rules=rules,
+        **settlement_kwargs,
+    )
+    result["monthly_withholding"] = withholding
+    result["cumulative_withholding"] = cumulative
+    return result
+
+
+def _monthly(values, shape):
+    """(N, 12) / (N,) / 스칼라 -> (N, 12) int64 배열."""
+    values = np.asarray(values, dtype=np.int64)
+    if values.ndim == 1:
+        values = values[:, np.newaxis]
+    return np.broadcast_to(values, shape)
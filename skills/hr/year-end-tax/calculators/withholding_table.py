@@ -0,0 +1,273 @@
+"""
+근로소득 간이세액표 생성기 및 조회
+
+월급여액(비과세 제외) x 공제대상가족 수(본인 포함 1~11명) x 8세 이상 20세 이하 자녀 수
+격자의 월 원천징수세액을 income_tax/personal_deduction 배치 계산기로 한 번에 계산합니다.
+외부 스프레드시트 대신 constants.py(과세연도 규칙)에서 직접 만들므로 세법 상수와 항상 일치합니다.
+
+월급여 구간별 세액 산정 (구간 중간값 기준):
+  1. 연간 총급여액 = 구간 중간값 x 12
+  2. 근로소득금액 = 총급여액 - 근로소득공제
+  3. 과세표준 = 근로소득금액 - 기본공제(가족 수 x 150만원)
+  4. 결정세액 = 산출세액 - 근로소득세액공제 - 자녀세액공제 (음수 불가)
+  5. 월 세액 = 결정세액 / 12 (10원 미만 절사)
+
+연금보험료/건강보험료 등 다른 소득공제와 특별세액공제는 반영하지 않으며
+(연말정산에서 정산), 표 범위를 벗어난 월급여는 같은 산식으로 직접 계산합니다.
+
+생성한 표는 압축 .npz 파일 하나로 저장하고, WithholdingTable.lookup()은
+구간 인덱스 산술과 평탄화 리스트 조회만으로 O(1)에 월 세액을 돌려줍니다.
+
+Usage:
+    python withholding_table.py -o withholding_2025.npz --tax-year 2025
+    table = WithholdingTable.load("withholding_2025.npz")
+    table.lookup(monthly_salary=4_500_000, dependents=3, children=1)
+"""
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from income_tax import (
+    calc_earned_income_deduction_batch,
+    calc_calculated_tax_batch,
+    calc_earned_income_tax_credit_batch,
+)
+from personal_deduction import calc_child_tax_credit_batch
+from tax_rules import DEFAULT_TAX_YEAR, TaxRules, available_years, load_rules
+
+# 표 범위 기본값 (월급여액, 원)
+DEFAULT_SALARY_MIN = 0
+DEFAULT_SALARY_MAX = 10_000_000
+DEFAULT_SALARY_STEP = 10_000
+
+MAX_DEPENDENTS = 11  # 공제대상가족 수 열 (본인 포함 1~11명)
+MAX_CHILDREN = MAX_DEPENDENTS - 1  # 자녀 수 열 (0~10명, 본인 제외)
+
+# 월 세액 절사 단위 (10원 미만 절사)
+TAX_ROUNDING_UNIT = 10
+
+
+def calc_monthly_withholding_batch(monthly_salary, dependents, children=0, rules=None):
+    """월 원천징수세액 배치 계산 (간이세액표 산식).
+
+    Args:
+        monthly_salary: 월급여액 배열 (비과세 제외, 원)
+        dependents: 공제대상가족 수 배열 (본인 포함)
+        children: 8세 이상 20세 이하 자녀 수 배열
+        rules: 과세연도 세법 규칙 (기본: load_rules())
+
+    Returns:
+        월 원천징수세액 배열 (원, int64, 10원 미만 절사)
+    """
+    if rules is None:
+        rules = load_rules()
+
+    annual_salary = np.asarray(monthly_salary, dtype=np.int64) * 12
+    dependents = np.asarray(dependents, dtype=np.int64)
+
+    earned_income_amount = annual_salary - calc_earned_income_deduction_batch(annual_salary, rules)
+    taxable_income = np.maximum(
+        0, earned_income_amount - dependents * rules.PERSONAL_DEDUCTION_PER_PERSON,
+    )
+    calculated_tax = calc_calculated_tax_batch(taxable_income, rules)
+    tax_credit = (
+        calc_earned_income_tax_credit_batch(calculated_tax, annual_salary, rules)
+        + calc_child_tax_credit_batch(children, rules=rules)
+    )
+    determined_tax = np.maximum(0, calculated_tax - tax_credit)
+
+    monthly_tax = determined_tax // 12
+    monthly_tax = monthly_tax - monthly_tax % TAX_ROUNDING_UNIT
+    return np.where(annual_salary <= 0, 0, monthly_tax)
+
+
+class WithholdingTable:
+    """월급여 구간 x 가족 수 x 자녀 수 간이세액표.
+
+    Attributes:
+        salary_min: 첫 구간 하한 (원, 이상)
+        salary_step: 구간 폭 (원)
+        salary_max: 마지막 구간 상한 (원, 미만)
+        tax_year: 과세연도
+        version: 생성에 사용한 규칙 버전 (rules.version)
+        cells: 월 세액 배열 (구간, 가족 수 - 1, 자녀 수)
+    """
+
+    __slots__ = (
+        "salary_min", "salary_step", "salary_max", "tax_year", "version", "cells",
+        "_flat", "_rows", "_rules",
+    )
+
+    def __init__(self, cells, salary_min: int, salary_step: int, tax_year: int, version: str):
+        """
+        Raises:
+            ValueError: cells 모양이 (구간 수, MAX_DEPENDENTS, MAX_CHILDREN + 1)이 아닌 경우
+        """
+        cells = np.asarray(cells)
+        if cells.ndim != 3 or cells.shape[1:] != (MAX_DEPENDENTS, MAX_CHILDREN + 1):
+            raise ValueError(f"간이세액표 모양이 잘못되었습니다: {cells.shape}")
+        self.cells = cells
+        self.salary_min = salary_min
+        self.salary_step = salary_step
+        self.salary_max = salary_min + salary_step * cells.shape[0]
+        self.tax_year = tax_year
+        self.version = version
+        self._rows = cells.shape[0]
+        self._flat = cells.ravel().tolist()  # 스칼라 조회용 (numpy 스칼라 변환 비용 제거)
+        self._rules = None
+
+    @classmethod
+    def build(
+        cls,
+        rules: TaxRules | None = None,
+        salary_min: int = DEFAULT_SALARY_MIN,
+        salary_max: int = DEFAULT_SALARY_MAX,
+        salary_step: int = DEFAULT_SALARY_STEP,
+    ) -> "WithholdingTable":
+        """전체 격자를 한 번의 배치 계산으로 생성한다.
+
+        Args:
+            rules: 과세연도 세법 규칙 (기본: load_rules())
+            salary_min: 첫 구간 하한 (원)
+            salary_max: 마지막 구간 상한 (원, salary_step 배수로 올림)
+            salary_step: 구간 폭 (원)
+
+        Raises:
+            ValueError: salary_step이 1 이하이거나 salary_max <= salary_min인 경우
+        """
+        if rules is None:
+            rules = load_rules()
+        if salary_step <= 1 or salary_max <= salary_min:
+            raise ValueError("salary_step은 2 이상, salary_max는 salary_min보다 커야 합니다")
+
+        rows = -(-(salary_max - salary_min) // salary_step)
+        midpoints = salary_min + np.arange(rows, dtype=np.int64) * salary_step + salary_step // 2
+        salary, dependents, children = np.meshgrid(
+            midpoints,
+            np.arange(1, MAX_DEPENDENTS + 1),
+            np.arange(MAX_CHILDREN + 1),
+            indexing="ij",
+        )
+        cells = calc_monthly_withholding_batch(
+            salary.ravel(), dependents.ravel(), children.ravel(), rules,
+        ).reshape(salary.shape)
+
+        dtype = np.int32 if cells.max(initial=0) <= np.iinfo(np.int32).max else np.int64
+        table = cls(cells.astype(dtype), salary_min, salary_step, rules.year, rules.version)
+        table._rules = rules
+        return table
+
+    def save(self, path) -> None:
+        """압축 .npz 파일로 저장한다."""
+        np.savez_compressed(
+            path,
+            cells=self.cells,
+            salary_min=self.salary_min,
+            salary_step=self.salary_step,
+            tax_year=self.tax_year,
+            version=self.version,
+        )
+
+    @classmethod
+    def load(cls, path) -> "WithholdingTable":
+        """save()로 저장한 파일을 읽는다."""
+        with np.load(path) as data:
+            return cls(
+                data["cells"],
+                int(data["salary_min"]),
+                int(data["salary_step"]),
+                int(data["tax_year"]),
+                str(data["version"]),
+            )
+
+    def lookup(self, monthly_salary: int, dependents: int, children: int = 0) -> int:
+        """월 원천징수세액 (O(1)).
+
+        Args:
+            monthly_salary: 월급여액 (비과세 제외, 원)
+            dependents: 공제대상가족 수 (본인 포함, 1~11)
+            children: 8세 이상 20세 이하 자녀 수 (0~10)
+
+        Returns:
+            월 원천징수세액 (원). 표 범위 밖 월급여는 같은 산식으로 직접 계산
+
+        Raises:
+            ValueError: 가족 수/자녀 수가 표 범위 밖인 경우
+        """
+        if not 1 <= dependents <= MAX_DEPENDENTS or not 0 <= children <= MAX_CHILDREN:
+            raise ValueError(
+                f"가족 수는 1~{MAX_DEPENDENTS}, 자녀 수는 0~{MAX_CHILDREN}이어야 합니다"
+            )
+        row = (monthly_salary - self.salary_min) // self.salary_step
+        if 0 <= row < self._rows:
+            return self._flat[
+                (row * MAX_DEPENDENTS + dependents - 1) * (MAX_CHILDREN + 1) + children
+            ]
+        return int(calc_monthly_withholding_batch(
+            monthly_salary, dependents, children, self._table_rules(),
+        ))
+
+    def lookup_batch(self, monthly_salary, dependents, children=0):
+        """월 원천징수세액 배열 (표 범위 밖 행은 직접 계산).
+
+        Raises:
+            ValueError: 가족 수/자녀 수가 표 범위 밖인 행이 있는 경우
+        """
+        salary = np.asarray(monthly_salary, dtype=np.int64)
+        dependents = np.asarray(dependents, dtype=np.int64)
+        children = np.asarray(children, dtype=np.int64)
+        if (
+            np.any((dependents < 1) | (dependents > MAX_DEPENDENTS))
+            or np.any((children < 0) | (children > MAX_CHILDREN))
+        ):
+            raise ValueError(
+                f"가족 수는 1~{MAX_DEPENDENTS}, 자녀 수는 0~{MAX_CHILDREN}이어야 합니다"
+            )
+
+        row = (salary - self.salary_min) // self.salary_step
+        in_range = (row >= 0) & (row < self._rows)
+        result = self.cells[
+            np.clip(row, 0, self._rows - 1), dependents - 1, children
+        ].astype(np.int64)
+        if not np.all(in_range):
+            direct = calc_monthly_withholding_batch(
+                salary, dependents, children, self._table_rules(),
+            )
+            result = np.where(in_range, result, direct)
+        return result
+
+    def _table_rules(self) -> TaxRules:
+        """표를 만든 과세연도 규칙 (파일에서 읽은 표는 tax_year로 로드)."""
+        if self._rules is None:
+            self._rules = load_rules(self.tax_year, exact=self.version.endswith("+exact"))
+        return self._rules
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="근로소득 간이세액표 생성기")
+    parser.add_argument("-o", "--output", type=Path, required=True,
+                        help="간이세액표 파일 (.npz)")
+    parser.add_argument("--tax-year", type=int, choices=available_years(), default=None,
+                        help=f"귀속 과세연도 (기본: {DEFAULT_TAX_YEAR})")
+    parser.add_argument("--salary-max", type=int, default=DEFAULT_SALARY_MAX,
+                        help=f"표에 포함할 월급여 상한 (기본: {DEFAULT_SALARY_MAX:,}원)")
+    parser.add_argument("--salary-step", type=int, default=DEFAULT_SALARY_STEP,
+                        help=f"월급여 구간 폭 (기본: {DEFAULT_SALARY_STEP:,}원)")
+    args = parser.parse_args(argv)
+
+    table = WithholdingTable.build(
+        load_rules(args.tax_year), salary_max=args.salary_max, salary_step=args.salary_step,
+    )
+    table.save(args.output)
+    print(
+        f"{args.output}: {table.cells.shape[0]:,}개 구간 x 가족 {MAX_DEPENDENTS} x "
+        f"자녀 {MAX_CHILDREN + 1} ({table.tax_year} 귀속, 규칙 {table.version})",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())